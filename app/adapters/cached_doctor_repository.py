@@ -0,0 +1,217 @@
+import asyncio
+import json
+import time
+from functools import partial
+from typing import Any, Optional, List
+from uuid import UUID, uuid4
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.core.metrics import CacheStatistics
+from app.domain.entities.doctor import Doctor
+from app.domain.interfaces.unit_of_work import UnitOfWork, NullUnitOfWork
+from app.infrastructure.database.routing import use_primary
+from app.repository.doctor_repository import DoctorFilters, DoctorRepository, DoctorSort
+from app.repository.pagination import Page
+
+# v2 entries carry the row version the ETag of GET /doctors/{id} is built from
+KEY_PREFIX = "doctor:v2:"
+# Cached "not found", so probes for missing ids do not reach the database
+TOMBSTONE = "null"
+MISS = object()
+
+# Release the load lock only if we still own it
+UNLOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+statistics = CacheStatistics()
+
+# Loads in progress in this process, keyed by cache key
+_inflight: dict[str, asyncio.Future] = {}
+
+
+def cache_key(doctor_id: UUID | str) -> str:
+    return f"{KEY_PREFIX}{doctor_id}"
+
+
+class CachedDoctorRepository(DoctorRepository):
+    """Read-through Redis cache in front of another doctor repository.
+
+    Lookups by id are served from Redis. On a miss one request per process
+    (single-flight) and one process per cluster (a short Redis lock) load the
+    row; everyone else waits for the cache to be filled instead of hitting
+    the database together. Writes delete the entry immediately and again
+    after the transaction commits, and misses are loaded from the primary,
+    so a concurrent reader cannot re-cache the old row, not even from a
+    lagging replica. Redis errors fall back to the wrapped repository.
+    """
+
+    def __init__(
+        self,
+        repository: DoctorRepository,
+        redis: Redis,
+        unit_of_work: UnitOfWork | None = None,
+        ttl_seconds: int = 300,
+        negative_ttl_seconds: int = 30,
+        lock_timeout_seconds: float = 5.0,
+        poll_interval_seconds: float = 0.05
+    ):
+        self.repository = repository
+        self.redis = redis
+        self.unit_of_work = unit_of_work or NullUnitOfWork()
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.lock_timeout_seconds = lock_timeout_seconds
+        self.poll_interval_seconds = poll_interval_seconds
+
+    async def get(self, **filters: Any) -> Optional[Doctor]:
+        doctor_id = filters.get('id')
+        if doctor_id is None or len(filters) != 1:
+            return await self.repository.get(**filters)
+
+        key = cache_key(doctor_id)
+        cached = await self._read(key)
+        if cached is not MISS:
+            statistics.record("hits")
+            return cached
+        statistics.record("misses")
+
+        if (pending := _inflight.get(key)) is not None:
+            try:
+                return await asyncio.shield(pending)
+            except Exception:
+                return await self.repository.get(id=doctor_id)
+
+        future = asyncio.get_running_loop().create_future()
+        _inflight[key] = future
+        try:
+            doctor = await self._load(key, doctor_id)
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # waiters fall back on their own; do not log it as unretrieved
+            raise
+        else:
+            future.set_result(doctor)
+            return doctor
+        finally:
+            del _inflight[key]
+
+    async def add(self, doctor: Doctor) -> None:
+        await self.repository.add(doctor)
+        await self._invalidate_after_commit(doctor.id)
+
+    async def update(self, doctor_id: str, **updates: Any) -> Optional[Doctor]:
+        doctor = await self.repository.update(doctor_id, **updates)
+        await self._invalidate_after_commit(doctor_id)
+        return doctor
+
+    async def delete(self, doctor_id: str) -> bool:
+        deleted = await self.repository.delete(doctor_id)
+        await self._invalidate_after_commit(doctor_id)
+        return deleted
+
+    async def list_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[DoctorFilters] = None,
+        sort: DoctorSort = DoctorSort.SURNAME
+    ) -> List[Doctor]:
+        return await self.repository.list_all(skip=skip, limit=limit, filters=filters, sort=sort)
+
+    async def list_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        filters: Optional[DoctorFilters] = None,
+        sort: DoctorSort = DoctorSort.SURNAME
+    ) -> Page[Doctor]:
+        return await self.repository.list_page(limit=limit, cursor=cursor, filters=filters, sort=sort)
+
+    async def version(self) -> tuple[int, int]:
+        return await self.repository.version()
+
+    async def invalidate(self, doctor_id: UUID | str) -> None:
+        try:
+            await self.redis.delete(cache_key(doctor_id))
+        except RedisError as e:
+            statistics.record("errors")
+            print(f'Redis invalidate error: {e}')
+
+    async def _invalidate_after_commit(self, doctor_id: UUID | str) -> None:
+        await self.invalidate(doctor_id)
+        self.unit_of_work.after_commit(partial(self.invalidate, doctor_id))
+
+    async def _load(self, key: str, doctor_id: UUID) -> Optional[Doctor]:
+        token = uuid4().hex
+        if await self._acquire(key, token):
+            try:
+                statistics.record("loads")
+                primary = use_primary.set(True)
+                try:
+                    doctor = await self.repository.get(id=doctor_id)
+                finally:
+                    use_primary.reset(primary)
+                await self._write(key, doctor)
+                return doctor
+            finally:
+                await self._release(key, token)
+
+        # Another process is loading this doctor: wait for it to fill the cache
+        statistics.record("lock_waits")
+        deadline = time.monotonic() + self.lock_timeout_seconds
+        while time.monotonic() < deadline:
+            await asyncio.sleep(self.poll_interval_seconds)
+            cached = await self._read(key)
+            if cached is not MISS:
+                return cached
+        return await self.repository.get(id=doctor_id)
+
+    async def _read(self, key: str) -> Optional[Doctor] | object:
+        try:
+            value = await self.redis.get(key)
+        except RedisError as e:
+            statistics.record("errors")
+            print(f'Redis get error: {e}')
+            return MISS
+        if value is None:
+            return MISS
+        if value == TOMBSTONE:
+            return None
+        # Entries carry no password hash; doctors read through the cache have an empty one
+        return Doctor.from_dict({**json.loads(value), "password": ""})
+
+    async def _write(self, key: str, doctor: Optional[Doctor]) -> None:
+        try:
+            if doctor is None:
+                await self.redis.set(key, TOMBSTONE, ex=self.negative_ttl_seconds)
+            else:
+                data = doctor.to_dict()
+                del data["password"]
+                await self.redis.set(key, json.dumps(data), ex=self.ttl_seconds)
+        except RedisError as e:
+            statistics.record("errors")
+            print(f'Redis set error: {e}')
+
+    async def _acquire(self, key: str, token: str) -> bool:
+        try:
+            return bool(await self.redis.set(
+                f"lock:{key}", token, nx=True, px=int(self.lock_timeout_seconds * 1000)
+            ))
+        except RedisError as e:
+            statistics.record("errors")
+            print(f'Redis lock error: {e}')
+            # Without Redis there is nobody to wait for
+            return True
+
+    async def _release(self, key: str, token: str) -> None:
+        try:
+            await self.redis.eval(UNLOCK_SCRIPT, 1, f"lock:{key}", token)
+        except RedisError as e:
+            statistics.record("errors")
+            print(f'Redis unlock error: {e}')
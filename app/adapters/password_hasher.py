@@ -1,9 +1,83 @@
+import asyncio
 import hashlib
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache, partial
+
+from passlib.context import CryptContext
+
 from app.domain.interfaces.password_hasher import PasswordHasher
 
+# Unsalted SHA-256 hex digests written by SHA256PasswordHasher; verified, then replaced on login
+LEGACY_SCHEMES = ("hex_sha256",)
+
+
 class SHA256PasswordHasher(PasswordHasher):
-    def hash(self, password: str) -> str:
+    async def hash(self, password: str) -> str:
         return hashlib.sha256(password.encode()).hexdigest()
     
-    def verify(self, plain_password: str, hashed_password: str) -> bool:
-        return self.hash(plain_password) == hashed_password
\ No newline at end of file
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self.hash(plain_password) == hashed_password
+
+
+@lru_cache
+def _context(scheme: str) -> CryptContext:
+    # Built per process, so worker processes only receive the scheme name
+    return CryptContext(schemes=[scheme, *LEGACY_SCHEMES], deprecated="auto")
+
+
+def _hash(scheme: str, password: str) -> str:
+    return _context(scheme).hash(password)
+
+
+def _verify_and_update(scheme: str, plain_password: str, hashed_password: str) -> tuple[bool, str | None]:
+    try:
+        return _context(scheme).verify_and_update(plain_password, hashed_password)
+    except ValueError:
+        # Not a hash any known scheme recognises
+        return False, None
+
+
+class PooledPasswordHasher(PasswordHasher):
+    """passlib slow hash run in a bounded thread or process pool.
+
+    At most `workers` hashes run at once; further calls queue in the pool
+    instead of blocking the event loop. Hashes in an older scheme still verify
+    and are reported by `verify_and_update` for rehashing.
+    """
+    
+    def __init__(self, scheme: str = "pbkdf2_sha256", workers: int = 4, use_processes: bool = False):
+        self.scheme = scheme
+        self.workers = workers
+        self.use_processes = use_processes
+        self._executor: Executor | None = None
+    
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            if self.use_processes:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="password-hash")
+        return self._executor
+    
+    async def _run(self, function, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.executor, partial(function, self.scheme, *args))
+    
+    async def hash(self, password: str) -> str:
+        return await self._run(_hash, password)
+    
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        verified, _ = await self._run(_verify_and_update, plain_password, hashed_password)
+        return verified
+    
+    def needs_rehash(self, hashed_password: str) -> bool:
+        return _context(self.scheme).needs_update(hashed_password)
+    
+    async def verify_and_update(self, plain_password: str, hashed_password: str) -> tuple[bool, str | None]:
+        # One trip to the pool: passlib verifies and rehashes in the same call
+        return await self._run(_verify_and_update, plain_password, hashed_password)
+    
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
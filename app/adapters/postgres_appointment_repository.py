@@ -1,11 +1,25 @@
-from typing import Any, Optional, List
+from datetime import datetime
+from typing import Any, AsyncIterator, Optional, List
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy.engine import Row
+from sqlalchemy import delete, literal, select, tuple_, union_all, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.postgresql import insert
 
 from app.repository.appointment_repository import AppointmentRepository
+from app.repository.pagination import Page, build_page, decode_cursor
 from app.domain.entities.appointment import Appointment
-from app.infrastructure.database.models import AppointmentORM
+from app.domain.entities.event import APPOINTMENT_CREATED, APPOINTMENT_DELETED, APPOINTMENT_UPDATED
+from app.infrastructure.database.models import AppointmentORM, DoctorORM, OutboxEventORM, RoomORM, UserORM
+from app.use_cases.exceptions import AppointmentConflictError
+
+EXCLUSION_VIOLATION = "23P01"
+# Exclusion constraints from migration 0002 and the resource each one protects
+OVERLAP_CONSTRAINTS = {
+    "appointments_doctor_no_overlap": "doctor",
+    "appointments_room_no_overlap": "room",
+}
 
 
 class DatabaseException(Exception):
@@ -40,50 +54,133 @@ class PostgresAppointmentRepository(AppointmentRepository):
                 datetime=appointment.datetime,
                 doctor_id=appointment.doctor_id,
                 user_id=appointment.user_id,
-                room_id=appointment.room_id
+                room_id=appointment.room_id,
+                duration_minutes=appointment.duration_minutes
             )
             self.session.add(appointment_db)
-            await self.session.commit()
+            # Flushed together with the appointment, committed or rolled back with it
+            self.session.add(self._outbox_event(APPOINTMENT_CREATED, appointment))
+            await self.session.flush()
             
+        except IntegrityError as e:
+            raise self._conflict_error(e) from e
         except Exception:
-            await self.session.rollback()
             raise DatabaseException
 
-    async def update(self, appointment_id: str, **updates: Any) -> Optional[Appointment]:
+    async def add_many(self, appointments: List[Appointment]) -> set[UUID]:
+        table = AppointmentORM.__table__
         try:
-            query = select(AppointmentORM).where(AppointmentORM.id == UUID(appointment_id))
+            # One multi-row INSERT; rows violating a constraint are skipped, not fatal
+            query = (
+                insert(table)
+                .values([self._to_row(appointment) for appointment in appointments])
+                .on_conflict_do_nothing()
+                .returning(table.c.id)
+            )
             result = await self.session.execute(query)
-            appointment_db = result.scalar_one_or_none()
+            inserted = set(result.scalars().all())
             
-            if not appointment_db:
-                return None
+            events = [
+                self._outbox_row(APPOINTMENT_CREATED, appointment)
+                for appointment in appointments if appointment.id in inserted
+            ]
+            if events:
+                await self.session.execute(insert(OutboxEventORM.__table__), events)
+            return inserted
             
-            for key, value in updates.items():
-                if value is not None and hasattr(appointment_db, key):
-                    setattr(appointment_db, key, value)
+        except Exception as e:
+            print(f'PostgreSQL add_many error: {e}')
+            raise DatabaseException
+
+    async def missing_references(self, appointments: List[Appointment]) -> dict[UUID, str]:
+        doctor_ids = {appointment.doctor_id for appointment in appointments}
+        user_ids = {appointment.user_id for appointment in appointments}
+        room_ids = {appointment.room_id for appointment in appointments}
+        try:
+            # All three lookups in a single round trip
+            query = union_all(
+                select(literal("doctor"), DoctorORM.id).where(DoctorORM.id.in_(doctor_ids)),
+                select(literal("user"), UserORM.id).where(UserORM.id.in_(user_ids)),
+                select(literal("room"), RoomORM.id).where(RoomORM.id.in_(room_ids)),
+            )
+            result = await self.session.execute(query)
+            existing = {(kind, entity_id) for kind, entity_id in result.all()}
+            
+        except Exception as e:
+            print(f'PostgreSQL missing_references error: {e}')
+            raise DatabaseException
+        
+        missing = {}
+        for appointment in appointments:
+            for kind, entity_id in (("doctor", appointment.doctor_id), ("user", appointment.user_id), ("room", appointment.room_id)):
+                if (kind, entity_id) not in existing:
+                    missing[appointment.id] = f"{kind.capitalize()} not found: {entity_id}"
+                    break
+        return missing
+
+    async def update(self, appointment_id: str, **updates: Any) -> Optional[Appointment]:
+        table = AppointmentORM.__table__
+        values = {
+            key: value for key, value in updates.items()
+            if value is not None and key in table.c
+        }
+        if not values:
+            return await self.get(id=UUID(appointment_id))
+        
+        try:
+            # Single round trip: the updated row comes back with RETURNING, together
+            # with the doctor and room it had before, read from the locked old row
+            previous = (
+                select(table.c.id, table.c.doctor_id, table.c.room_id)
+                .where(table.c.id == UUID(appointment_id))
+                .with_for_update()
+                .subquery("previous")
+            )
+            query = (
+                update(table)
+                .where(table.c.id == previous.c.id)
+                .values(**values)
+                .returning(
+                    *table.c,
+                    previous.c.doctor_id.label("previous_doctor_id"),
+                    previous.c.room_id.label("previous_room_id")
+                )
+            )
+            result = await self.session.execute(query)
+            row = result.one_or_none()
+            if row is None:
+                return None
             
-            await self.session.commit()
-            return self._to_entity(appointment_db)
+            appointment = self._to_entity(row)
+            # A moved booking also frees a slot in the old doctor's or room's schedule
+            self.session.add(self._outbox_event(
+                APPOINTMENT_UPDATED, appointment,
+                previous_doctor_id=str(row.previous_doctor_id),
+                previous_room_id=str(row.previous_room_id)
+            ))
+            return appointment
             
+        except IntegrityError as e:
+            raise self._conflict_error(e) from e
         except Exception as e:
-            await self.session.rollback()
             print(f'PostgreSQL update error: {e}')
             raise DatabaseException
 
     async def delete(self, appointment_id: str) -> bool:
+        table = AppointmentORM.__table__
         try:
-            query = select(AppointmentORM).where(AppointmentORM.id == UUID(appointment_id))
+            # Dependent rows go through ON DELETE CASCADE in the database;
+            # the whole row comes back so the event can say whose schedule changed
+            query = delete(table).where(table.c.id == UUID(appointment_id)).returning(*table.c)
             result = await self.session.execute(query)
-            appointment_db = result.scalar_one_or_none()
+            row = result.first()
+            if row is None:
+                return False
             
-            if appointment_db:
-                await self.session.delete(appointment_db)
-                await self.session.commit()
-                return True
-            return False
+            self.session.add(self._outbox_event(APPOINTMENT_DELETED, self._to_entity(row)))
+            return True
             
         except Exception as e:
-            await self.session.rollback()
             print(f'PostgreSQL delete error: {e}')
             raise DatabaseException
 
@@ -99,13 +196,93 @@ class PostgresAppointmentRepository(AppointmentRepository):
             print(f'PostgreSQL list_all error: {e}')
             raise DatabaseException
 
-    def _to_entity(self, appointment_db: AppointmentORM) -> Appointment:
+    async def list_page(self, limit: int = 100, cursor: Optional[str] = None) -> Page[Appointment]:
+        # Keyset pagination on (datetime, id): cost does not grow with page depth
+        query = select(AppointmentORM).order_by(AppointmentORM.datetime, AppointmentORM.id).limit(limit + 1)
+        if cursor:
+            last_datetime, last_id = decode_cursor(cursor, datetime.fromisoformat, UUID)
+            query = query.where(tuple_(AppointmentORM.datetime, AppointmentORM.id) > (last_datetime, last_id))
+        
+        try:
+            result = await self.session.execute(query)
+            appointments_db = result.scalars().all()
+        except Exception as e:
+            print(f'PostgreSQL list_page error: {e}')
+            raise DatabaseException
+        
+        appointments = [self._to_entity(appointment_db) for appointment_db in appointments_db]
+        return build_page(appointments, limit, lambda appointment: (appointment.datetime, appointment.id))
+
+    async def stream(
+        self,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        doctor_id: Optional[UUID] = None,
+        batch_size: int = 1000
+    ) -> AsyncIterator[Appointment]:
+        table = AppointmentORM.__table__
+        # Core rows from a server-side cursor: no ORM identity map, constant memory
+        query = (
+            select(table)
+            .order_by(table.c.datetime, table.c.id)
+            .execution_options(yield_per=batch_size)
+        )
+        if date_from is not None:
+            query = query.where(table.c.datetime >= date_from)
+        if date_to is not None:
+            query = query.where(table.c.datetime < date_to)
+        if doctor_id is not None:
+            query = query.where(table.c.doctor_id == doctor_id)
+        
+        try:
+            result = await self.session.stream(query)
+        except Exception as e:
+            print(f'PostgreSQL stream error: {e}')
+            raise DatabaseException
+        
+        try:
+            async for rows in result.partitions():
+                for row in rows:
+                    yield self._to_entity(row)
+        finally:
+            await result.close()
+
+    def _to_row(self, appointment: Appointment) -> dict:
+        return {
+            "id": appointment.id,
+            "datetime": appointment.datetime,
+            "doctor_id": appointment.doctor_id,
+            "user_id": appointment.user_id,
+            "room_id": appointment.room_id,
+            "duration_minutes": appointment.duration_minutes,
+        }
+
+    def _outbox_row(self, event_type: str, appointment: Appointment, **extra: Any) -> dict:
+        return {
+            "event_type": event_type,
+            "aggregate_id": appointment.id,
+            "payload": {**appointment.to_dict(), "datetime": appointment.datetime.isoformat(), **extra},
+        }
+
+    def _outbox_event(self, event_type: str, appointment: Appointment, **extra: Any) -> OutboxEventORM:
+        return OutboxEventORM(**self._outbox_row(event_type, appointment, **extra))
+
+    def _to_entity(self, appointment_db: AppointmentORM | Row) -> Appointment:
         return Appointment(
             datetime=appointment_db.datetime,
             doctor_id=appointment_db.doctor_id,
             user_id=appointment_db.user_id,
             room_id=appointment_db.room_id,
+            duration_minutes=appointment_db.duration_minutes,
             uuid=appointment_db.id
         )
+
+    def _conflict_error(self, error: IntegrityError) -> Exception:
+        """Map an exclusion violation to a domain error; anything else is a database error"""
+        if getattr(error.orig, "sqlstate", None) != EXCLUSION_VIOLATION:
+            print(f'PostgreSQL integrity error: {error}')
+            return DatabaseException()
+        constraint = getattr(error.orig.__cause__, "constraint_name", None)
+        return AppointmentConflictError(OVERLAP_CONSTRAINTS.get(constraint, "doctor or room"))
     
     
\ No newline at end of file
@@ -0,0 +1,100 @@
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repository.bulk_import_repository import BulkImportRepository
+from app.domain.entities.doctor import Doctor
+from app.domain.entities.user import User
+
+
+class DatabaseException(Exception):
+    def __str__(self):
+        return "Database is not currently available. Please try again later."
+
+
+DOCTOR_COLUMNS = [
+    "id", "name", "surname", "age", "specialization", "category", "password", "experience_years",
+    "work_start", "work_end"
+]
+USER_COLUMNS = ["id", "name", "surname", "email", "age", "phone", "role", "hashed_password", "disabled"]
+
+
+class PostgresBulkImportRepository(BulkImportRepository):
+    """COPYs rows into a per-transaction temp table, then merges with INSERT ... SELECT"""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self._staging_tables: set[str] = set()
+
+    async def stage_doctors(self, rows: list[tuple[int, Doctor]]) -> None:
+        records = [
+            (
+                line, doctor.id, doctor.name, doctor.surname, doctor.age, doctor.specialization,
+                doctor.category.name, doctor.password, doctor.experience_years,
+                doctor.work_start, doctor.work_end
+            )
+            for line, doctor in rows
+        ]
+        await self._copy("doctors", DOCTOR_COLUMNS, records)
+
+    async def merge_doctors(self) -> dict[int, str]:
+        return await self._merge("doctors", DOCTOR_COLUMNS, "Doctor with this surname already exists")
+
+    async def stage_users(self, rows: list[tuple[int, User]]) -> None:
+        records = [
+            (
+                line, user.id, user.name, user.surname, user.email, user.age, user.phone,
+                user.role.value, user.hashed_password, user.disabled
+            )
+            for line, user in rows
+        ]
+        await self._copy("users", USER_COLUMNS, records)
+
+    async def merge_users(self) -> dict[int, str]:
+        return await self._merge("users", USER_COLUMNS, "User with this email or phone already exists")
+
+    async def _copy(self, table: str, columns: list[str], records: list[tuple]) -> None:
+        staging = f"{table}_import"
+        try:
+            if staging not in self._staging_tables:
+                # Only the imported columns, with the target's types: columns filled by
+                # defaults (version, updated_at) get them on the merge INSERT
+                await self.session.execute(text(
+                    f"CREATE TEMP TABLE {staging} ON COMMIT DROP AS "
+                    f"SELECT NULL::integer AS line, {', '.join(columns)} FROM {table} WITH NO DATA"
+                ))
+                self._staging_tables.add(staging)
+
+            connection = await self.session.connection()
+            raw_connection = await connection.get_raw_connection()
+            # asyncpg binary COPY: one round trip per batch, no per-row INSERTs
+            await raw_connection.driver_connection.copy_records_to_table(
+                staging, records=records, columns=["line", *columns]
+            )
+        except Exception as e:
+            print(f'PostgreSQL COPY error: {e}')
+            raise DatabaseException
+
+    async def _merge(self, table: str, columns: list[str], reason: str) -> dict[int, str]:
+        staging = f"{table}_import"
+        if staging not in self._staging_tables:
+            return {}
+
+        column_list = ", ".join(columns)
+        try:
+            # Rows clashing with existing rows, or with an earlier line of the file, are skipped
+            result = await self.session.execute(text(f"""
+                WITH inserted AS (
+                    INSERT INTO {table} ({column_list})
+                    SELECT {column_list} FROM {staging} ORDER BY line
+                    ON CONFLICT DO NOTHING
+                    RETURNING id
+                )
+                SELECT staged.line FROM {staging} AS staged
+                LEFT JOIN inserted ON inserted.id = staged.id
+                WHERE inserted.id IS NULL
+                ORDER BY staged.line
+            """))
+            return {line: reason for line in result.scalars().all()}
+        except Exception as e:
+            print(f'PostgreSQL merge error: {e}')
+            raise DatabaseException
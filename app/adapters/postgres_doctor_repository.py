@@ -1,11 +1,21 @@
 from typing import Any, Optional, List
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy.engine import Row
+from sqlalchemy import Select, delete, func, or_, select, tuple_, update
+from sqlalchemy.exc import IntegrityError
 
-from app.repository.doctor_repository import DoctorRepository
+from app.repository.doctor_repository import DoctorFilters, DoctorRepository, DoctorSort
+from app.repository.pagination import Page, build_page, decode_cursor
 from app.domain.entities.doctor import Doctor
 from app.infrastructure.database.models import DoctorORM
+from app.use_cases.exceptions import InvalidDoctorDataError
+
+CHECK_VIOLATION = "23514"
+# Check constraints on doctors and what each one rejects
+CHECK_CONSTRAINTS = {
+    "doctors_working_hours_order": "work_start must be before work_end",
+}
 
 
 class DatabaseException(Exception):
@@ -13,6 +23,19 @@ class DatabaseException(Exception):
         return "Database is not currently available. Please try again later."
 
 
+# sort -> (column, entity attribute, cursor value type, descending)
+SORTS = {
+    DoctorSort.SURNAME: (DoctorORM.surname, "surname", str, False),
+    DoctorSort.SURNAME_DESC: (DoctorORM.surname, "surname", str, True),
+    DoctorSort.EXPERIENCE: (DoctorORM.experience_years, "experience_years", int, False),
+    DoctorSort.EXPERIENCE_DESC: (DoctorORM.experience_years, "experience_years", int, True),
+}
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
 class PostgresDoctorRepository(DoctorRepository):
     def __init__(self, session: AsyncSession):
         self.session = session
@@ -43,56 +66,65 @@ class PostgresDoctorRepository(DoctorRepository):
                 specialization=doctor.specialization,
                 category=doctor.category,
                 password=doctor.password,
-                experience_years=doctor.experience_years
+                experience_years=doctor.experience_years,
+                work_start=doctor.work_start,
+                work_end=doctor.work_end
             )
             self.session.add(doctor_db)
-            await self.session.commit()
+            await self.session.flush()
             
         except Exception:
-            await self.session.rollback()
             raise DatabaseException
 
     async def update(self, doctor_id: str, **updates: Any) -> Optional[Doctor]:
+        table = DoctorORM.__table__
+        values = {
+            key: value for key, value in updates.items()
+            if value is not None and key in table.c
+        }
+        if not values:
+            return await self.get(id=UUID(doctor_id))
+        
         try:
-            query = select(DoctorORM).where(DoctorORM.id == UUID(doctor_id))
+            # Single round trip: the updated row comes back with RETURNING
+            query = (
+                update(table)
+                .where(table.c.id == UUID(doctor_id))
+                .values(**values, version=func.nextval("doctors_version_seq"), updated_at=func.now())
+                .returning(*table.c)
+            )
             result = await self.session.execute(query)
-            doctor_db = result.scalar_one_or_none()
+            row = result.one_or_none()
             
-            if not doctor_db:
-                return None
-            
-            for key, value in updates.items():
-                if value is not None and hasattr(doctor_db, key):
-                    setattr(doctor_db, key, value)
-            
-            await self.session.commit()
-            return self._to_entity(doctor_db)
+            return self._to_entity(row) if row else None
             
+        except IntegrityError as e:
+            raise self._check_error(e) from e
         except Exception as e:
-            await self.session.rollback()
             print(f'PostgreSQL update error: {e}')
             raise DatabaseException
 
     async def delete(self, doctor_id: str) -> bool:
+        table = DoctorORM.__table__
         try:
-            query = select(DoctorORM).where(DoctorORM.id == UUID(doctor_id))
+            # Dependent rows go through ON DELETE CASCADE in the database
+            query = delete(table).where(table.c.id == UUID(doctor_id)).returning(table.c.id)
             result = await self.session.execute(query)
-            doctor_db = result.scalar_one_or_none()
-            
-            if doctor_db:
-                await self.session.delete(doctor_db)
-                await self.session.commit()
-                return True
-            return False
+            return result.first() is not None
             
         except Exception as e:
-            await self.session.rollback()
             print(f'PostgreSQL delete error: {e}')
             raise DatabaseException
 
-    async def list_all(self, skip: int = 0, limit: int = 100) -> List[Doctor]:
+    async def list_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[DoctorFilters] = None,
+        sort: DoctorSort = DoctorSort.SURNAME
+    ) -> List[Doctor]:
         try:
-            query = select(DoctorORM).offset(skip).limit(limit)
+            query = self._list_query(filters, sort).offset(skip).limit(limit)
             result = await self.session.execute(query)
             doctors_db = result.scalars().all()
             
@@ -102,7 +134,68 @@ class PostgresDoctorRepository(DoctorRepository):
             print(f'PostgreSQL list_all error: {e}')
             raise DatabaseException
 
-    def _to_entity(self, doctor_db: DoctorORM) -> Doctor:
+    async def list_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        filters: Optional[DoctorFilters] = None,
+        sort: DoctorSort = DoctorSort.SURNAME
+    ) -> Page[Doctor]:
+        # Keyset pagination on (sort column, id): cost does not grow with page depth
+        column, attribute, value_type, descending = SORTS[sort]
+        query = self._list_query(filters, sort).limit(limit + 1)
+        if cursor:
+            last_value, last_id = decode_cursor(cursor, value_type, UUID)
+            key = tuple_(column, DoctorORM.id)
+            query = query.where(key < (last_value, last_id) if descending else key > (last_value, last_id))
+        
+        try:
+            result = await self.session.execute(query)
+            doctors_db = result.scalars().all()
+        except Exception as e:
+            print(f'PostgreSQL list_page error: {e}')
+            raise DatabaseException
+        
+        doctors = [self._to_entity(doctor_db) for doctor_db in doctors_db]
+        return build_page(doctors, limit, lambda doctor: (getattr(doctor, attribute), doctor.id))
+
+    async def version(self) -> tuple[int, int]:
+        try:
+            # Index-only: no doctor rows are fetched. Sum rather than max: versions are
+            # drawn before commit, so a change committed after a later-drawn one
+            # would leave max() where it was
+            query = select(func.count(), func.coalesce(func.sum(DoctorORM.version), 0))
+            result = await self.session.execute(query)
+            count, version = result.one()
+            return count, int(version)
+            
+        except Exception as e:
+            print(f'PostgreSQL version error: {e}')
+            raise DatabaseException
+
+    def _list_query(self, filters: Optional[DoctorFilters], sort: DoctorSort) -> Select:
+        """Filtered, ordered SELECT; every filter has a matching index (migration 0004)"""
+        column, _, _, descending = SORTS[sort]
+        order = (column.desc(), DoctorORM.id.desc()) if descending else (column, DoctorORM.id)
+        query = select(DoctorORM).order_by(*order)
+        if filters is None:
+            return query
+        
+        if filters.specialization:
+            query = query.where(func.lower(DoctorORM.specialization) == filters.specialization.lower())
+        if filters.category:
+            query = query.where(DoctorORM.category == filters.category)
+        if filters.min_experience is not None:
+            query = query.where(DoctorORM.experience_years >= filters.min_experience)
+        if filters.name_prefix:
+            pattern = f"{_escape_like(filters.name_prefix)}%"
+            query = query.where(or_(
+                DoctorORM.name.ilike(pattern, escape="\\"),
+                DoctorORM.surname.ilike(pattern, escape="\\")
+            ))
+        return query
+
+    def _to_entity(self, doctor_db: DoctorORM | Row) -> Doctor:
         return Doctor(
             name=doctor_db.name,
             surname=doctor_db.surname,
@@ -111,7 +204,16 @@ class PostgresDoctorRepository(DoctorRepository):
             category=doctor_db.category,
             password=doctor_db.password,
             experience_years=doctor_db.experience_years,
-            uuid=doctor_db.id
+            work_start=doctor_db.work_start,
+            work_end=doctor_db.work_end,
+            uuid=doctor_db.id,
+            version=doctor_db.version
         )
-    
-    
\ No newline at end of file
+
+    def _check_error(self, error: IntegrityError) -> Exception:
+        """Map a check violation to a domain error; anything else is a database error"""
+        constraint = getattr(error.orig.__cause__, "constraint_name", None)
+        if getattr(error.orig, "sqlstate", None) != CHECK_VIOLATION or constraint not in CHECK_CONSTRAINTS:
+            print(f'PostgreSQL integrity error: {error}')
+            return DatabaseException()
+        return InvalidDoctorDataError(CHECK_CONSTRAINTS[constraint])
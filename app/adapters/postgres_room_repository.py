@@ -1,8 +1,10 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import func, select, tuple_
 from typing import Any, Optional, List
+from uuid import UUID
 
 from app.repository.room_repository import RoomRepository
+from app.repository.pagination import Page, build_page, decode_cursor
 from app.domain.entities.room import Room
 from app.infrastructure.database.models import RoomORM
 
@@ -55,6 +57,22 @@ class PostgresRoomRepository(RoomRepository):
         except Exception:
             raise DatabaseException
 
+    async def list_page(self, limit: int = 100, cursor: Optional[str] = None) -> Page[Room]:
+        # Keyset pagination on (number, id): cost does not grow with page depth
+        query = select(RoomORM).order_by(RoomORM.number, RoomORM.id).limit(limit + 1)
+        if cursor:
+            last_number, last_id = decode_cursor(cursor, int, UUID)
+            query = query.where(tuple_(RoomORM.number, RoomORM.id) > (last_number, last_id))
+        
+        try:
+            result = await self.session.execute(query)
+            rooms_orm = result.scalars().all()
+        except Exception:
+            raise DatabaseException
+        
+        rooms = [Room(number=room_orm.number, uuid=room_orm.id) for room_orm in rooms_orm]
+        return build_page(rooms, limit, lambda room: (room.number, room.id))
+
     async def add(self, room: Room) -> None:
         try:
             room_db = RoomORM(
@@ -62,8 +80,21 @@ class PostgresRoomRepository(RoomRepository):
                 number=room.number
             )
             self.session.add(room_db)
-            await self.session.commit()
+            await self.session.flush()
             
         except Exception:
-            await self.session.rollback()
+            raise DatabaseException
+
+    async def version(self) -> tuple[int, int]:
+        try:
+            # Index-only: no room rows are fetched. Sum rather than max: versions are
+            # drawn before commit, so a change committed after a later-drawn one
+            # would leave max() where it was
+            query = select(func.count(), func.coalesce(func.sum(RoomORM.version), 0))
+            result = await self.session.execute(query)
+            count, version = result.one()
+            return count, int(version)
+            
+        except Exception as e:
+            print(f'PostgreSQL version error: {e}')
             raise DatabaseException
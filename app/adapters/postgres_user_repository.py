@@ -1,9 +1,11 @@
 from typing import Any, Optional, List
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy.engine import Row
+from sqlalchemy import delete, select, tuple_, update
 
 from app.repository.user_repository import UserRepository
+from app.repository.pagination import Page, build_page, decode_cursor
 from app.domain.entities.user import User
 from app.infrastructure.database.models import UserORM
 
@@ -59,47 +61,46 @@ class PostgresUserRepository(UserRepository):
                 disabled=user.disabled
             )
             self.session.add(user_db)
-            await self.session.commit()
+            await self.session.flush()
             
         except Exception:
-            await self.session.rollback()
             raise DatabaseException
 
     async def update(self, user_id: str, **updates: Any) -> Optional[User]:
+        table = UserORM.__table__
+        values = {
+            key: value for key, value in updates.items()
+            if value is not None and key in table.c
+        }
+        if not values:
+            return await self.get(id=UUID(user_id))
+        
         try:
-            query = select(UserORM).where(UserORM.id == UUID(user_id))
+            # Single round trip: the updated row comes back with RETURNING
+            query = (
+                update(table)
+                .where(table.c.id == UUID(user_id))
+                .values(**values)
+                .returning(*table.c)
+            )
             result = await self.session.execute(query)
-            user_db = result.scalar_one_or_none()
-            
-            if not user_db:
-                return None
+            row = result.one_or_none()
             
-            for key, value in updates.items():
-                if value is not None and hasattr(user_db, key):
-                    setattr(user_db, key, value)
-            
-            await self.session.commit()
-            return self._to_entity(user_db)
+            return self._to_entity(row) if row else None
             
         except Exception as e:
-            await self.session.rollback()
             print(f'PostgreSQL update error: {e}')
             raise DatabaseException
 
     async def delete(self, user_id: str) -> bool:
+        table = UserORM.__table__
         try:
-            query = select(UserORM).where(UserORM.id == UUID(user_id))
+            # Dependent rows go through ON DELETE CASCADE in the database
+            query = delete(table).where(table.c.id == UUID(user_id)).returning(table.c.id)
             result = await self.session.execute(query)
-            user_db = result.scalar_one_or_none()
-            
-            if user_db:
-                await self.session.delete(user_db)
-                await self.session.commit()
-                return True
-            return False
+            return result.first() is not None
             
         except Exception as e:
-            await self.session.rollback()
             print(f'PostgreSQL delete error: {e}')
             raise DatabaseException
 
@@ -115,7 +116,24 @@ class PostgresUserRepository(UserRepository):
             print(f'PostgreSQL list_all error: {e}')
             raise DatabaseException
 
-    def _to_entity(self, user_db: UserORM) -> User:
+    async def list_page(self, limit: int = 100, cursor: Optional[str] = None) -> Page[User]:
+        # Keyset pagination on (email, id): cost does not grow with page depth
+        query = select(UserORM).order_by(UserORM.email, UserORM.id).limit(limit + 1)
+        if cursor:
+            last_email, last_id = decode_cursor(cursor, str, UUID)
+            query = query.where(tuple_(UserORM.email, UserORM.id) > (last_email, last_id))
+        
+        try:
+            result = await self.session.execute(query)
+            users_db = result.scalars().all()
+        except Exception as e:
+            print(f'PostgreSQL list_page error: {e}')
+            raise DatabaseException
+        
+        users = [self._to_entity(user_db) for user_db in users_db]
+        return build_page(users, limit, lambda user: (user.email, user.id))
+
+    def _to_entity(self, user_db: UserORM | Row) -> User:
         return User(
             name=user_db.name,
             surname=user_db.surname,
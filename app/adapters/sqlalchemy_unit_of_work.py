@@ -0,0 +1,36 @@
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.interfaces.unit_of_work import UnitOfWork
+
+
+@dataclass
+class CommitCounter:
+    count: int = 0
+
+
+# Commits made while handling the current request, set up by the API middleware
+request_commits: ContextVar[CommitCounter | None] = ContextVar("request_commits", default=None)
+
+
+class SqlAlchemyUnitOfWork(UnitOfWork):
+    def __init__(self, session: AsyncSession):
+        super().__init__()
+        self.session = session
+        self.commit_count = 0
+
+    async def commit(self) -> None:
+        await self.session.commit()
+        self.commit_count += 1
+        if (counter := request_commits.get()) is not None:
+            counter.count += 1
+
+    async def rollback(self) -> None:
+        await self.session.rollback()
+
+    @asynccontextmanager
+    async def savepoint(self):
+        async with self.session.begin_nested():
+            yield
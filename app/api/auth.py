@@ -1,11 +1,13 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from uuid import UUID
-from app.core.security import verify_token
+from app.core.config import settings
+from app.core.security import verify_token, verify_access_token
+from app.core.principal_cache import principal_cache
 from app.repository.user_repository import UserRepository
 from app.adapters.postgres_user_repository import PostgresUserRepository
 from app.infrastructure.database.postgres import get_db
-from app.domain.entities.user import User, UserRole
+from app.domain.entities.user import Principal, User, UserRole
 from sqlalchemy.ext.asyncio import AsyncSession
 
 security = HTTPBearer()
@@ -16,11 +18,23 @@ async def get_user_repository(session: AsyncSession = Depends(get_db)) -> UserRe
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     user_repository: UserRepository = Depends(get_user_repository)
-) -> User:
+) -> User | Principal:
     token = credentials.credentials
-    user_id = await verify_token(token)
+    if settings.stateless_auth:
+        claims = await verify_access_token(token)
+        # Tokens issued before stateless mode was enabled have no role claim
+        if "role" in claims and "ver" in claims:
+            return Principal(UUID(claims["sub"]), UserRole(claims["role"]))
+        user_id = UUID(claims["sub"])
+    else:
+        user_id = UUID(await verify_token(token))
     
-    user = await user_repository.get(id=UUID(user_id))
+    # The session opens a connection lazily, so a cache hit never touches the database
+    user = principal_cache.get(user_id)
+    if user is None:
+        user = await user_repository.get(id=user_id)
+        if user:
+            principal_cache.put(user)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -35,7 +49,7 @@ async def get_current_user(
     
     return user
 
-async def get_current_active_user(current_user: User = Depends(get_current_user)) -> User:
+async def get_current_active_user(current_user: User | Principal = Depends(get_current_user)) -> User | Principal:
     if current_user.disabled:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -43,7 +57,7 @@ async def get_current_active_user(current_user: User = Depends(get_current_user)
         )
     return current_user
 
-async def get_admin_user(current_user: User = Depends(get_current_active_user)) -> User:
+async def get_admin_user(current_user: User | Principal = Depends(get_current_active_user)) -> User | Principal:
     if current_user.role != UserRole.admin:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -51,7 +65,7 @@ async def get_admin_user(current_user: User = Depends(get_current_active_user))
         )
     return current_user
 
-async def get_doctor_user(current_user: User = Depends(get_current_active_user)) -> User:
+async def get_doctor_user(current_user: User | Principal = Depends(get_current_active_user)) -> User | Principal:
     if current_user.role not in [UserRole.doctor, UserRole.admin]:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -0,0 +1,173 @@
+import asyncio
+import json
+import os
+import socket
+import time
+from uuid import uuid4
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.api.connections import ConnectionManager, manager
+from app.core.config import settings
+from app.domain.entities.event import APPOINTMENT_CREATED, APPOINTMENT_DELETED, APPOINTMENT_UPDATED, DomainEvent
+from app.infrastructure.redis import get_redis
+
+# {"origin": <worker id>, "text": ..., "topic": ...} for every broadcast, relayed by all workers
+BROADCAST_CHANNEL = "ws:broadcast"
+# Hash of worker id -> {"connections": n, "at": unix time}, refreshed by each worker
+CONNECTIONS_KEY = "ws:connections"
+
+APPOINTMENT_EVENTS = {APPOINTMENT_CREATED, APPOINTMENT_DELETED, APPOINTMENT_UPDATED}
+
+
+def schedule_frames(event: DomainEvent) -> list[tuple[str, str]]:
+    """(topic, text) pushes for the doctor and room schedules an appointment event touches.
+
+    An update that moves the booking also reaches the previous doctor and room.
+    """
+    if event.type not in APPOINTMENT_EVENTS:
+        return []
+    appointment = event.payload
+    topics = [f"doctor:{appointment['doctor_id']}", f"room:{appointment['room_id']}"]
+    for kind in ("doctor", "room"):
+        previous = appointment.get(f"previous_{kind}_id")
+        if previous and previous != appointment[f"{kind}_id"]:
+            topics.append(f"{kind}:{previous}")
+    return [
+        (topic, json.dumps({"type": "event", "topic": topic, "event": event.type, "appointment": appointment}))
+        for topic in topics
+    ]
+
+
+class BroadcastBus:
+    """Relays WebSocket broadcasts between workers over Redis pub/sub.
+
+    A broadcast is delivered to this worker's sockets at once and published for
+    the others; `listen` relays what other workers publish and reports this
+    worker's connection count to the `ws:connections` hash every
+    `heartbeat_seconds`. Counts older than three heartbeats belong to workers
+    that are gone and are left out of the cluster total. With `events_channel`
+    set, `listen` also turns committed appointment events from the outbox into
+    pushes to the matching doctor and room topics.
+    """
+
+    def __init__(
+        self,
+        manager: ConnectionManager,
+        redis: Redis | None = None,
+        heartbeat_seconds: float = 5.0,
+        events_channel: str = ""
+    ):
+        self.manager = manager
+        self.redis = redis
+        self.heartbeat_seconds = heartbeat_seconds
+        self.events_channel = events_channel
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+        self.relayed = 0
+        self.publish_errors = 0
+
+    async def _get_redis(self) -> Redis:
+        return self.redis or await get_redis()
+
+    async def publish(self, text: str, topic: str | None = None) -> int:
+        """Broadcast to every worker, optionally only to `topic` subscribers;
+        returns how many local clients it was queued for"""
+        sent = self.manager.broadcast(text, topic)
+        try:
+            redis = await self._get_redis()
+            message = {"origin": self.worker_id, "text": text, "topic": topic}
+            await redis.publish(BROADCAST_CHANNEL, json.dumps(message))
+        except RedisError as e:
+            # Local clients still get it; other workers miss this one
+            self.publish_errors += 1
+            print(f'Redis broadcast publish error: {e}')
+        return sent
+
+    def apply(self, message: str) -> None:
+        """Handle one message from the broadcast channel"""
+        try:
+            data = json.loads(message)
+        except ValueError:
+            print(f'Broadcast bus: ignoring message {message!r}')
+            return
+        if data.get("origin") != self.worker_id:
+            self.manager.broadcast(data["text"], data.get("topic"))
+            self.relayed += 1
+
+    def deliver_event(self, event: DomainEvent) -> None:
+        """Push a domain event to this worker's subscribers of the topics it concerns"""
+        for topic, text in schedule_frames(event):
+            self.manager.broadcast(text, topic)
+
+    def apply_event(self, message: str) -> None:
+        """Handle one message from the outbox events channel"""
+        try:
+            event = DomainEvent.from_dict(json.loads(message))
+        except (ValueError, KeyError) as e:
+            print(f'Broadcast bus: ignoring event {message!r}: {e}')
+            return
+        self.deliver_event(event)
+
+    async def report_connections(self, redis: Redis) -> None:
+        await redis.hset(CONNECTIONS_KEY, self.worker_id, json.dumps({
+            "connections": len(self.manager.connections),
+            "at": time.time(),
+        }))
+
+    async def cluster_status(self) -> dict:
+        """Connections of all live workers, as last reported to Redis"""
+        redis = await self._get_redis()
+        reports = await redis.hgetall(CONNECTIONS_KEY)
+        cutoff = time.time() - 3 * self.heartbeat_seconds
+        workers, stale = {}, []
+        for worker_id, report in reports.items():
+            report = json.loads(report)
+            if report["at"] < cutoff:
+                stale.append(worker_id)
+            else:
+                workers[worker_id] = report["connections"]
+        if stale:
+            await redis.hdel(CONNECTIONS_KEY, *stale)
+        # This worker's own count is known exactly
+        workers[self.worker_id] = len(self.manager.connections)
+        return {"workers": len(workers), "connections": sum(workers.values())}
+
+    async def listen(self, retry_seconds: float = 1.0) -> None:
+        """Relay other workers' broadcasts and report connection counts until cancelled"""
+        redis = await self._get_redis()
+        try:
+            while True:
+                pubsub = redis.pubsub(ignore_subscribe_messages=True)
+                try:
+                    await pubsub.subscribe(*filter(None, (BROADCAST_CHANNEL, self.events_channel)))
+                    reported_at = 0.0
+                    while True:
+                        if time.monotonic() - reported_at >= self.heartbeat_seconds:
+                            await self.report_connections(redis)
+                            reported_at = time.monotonic()
+                        # A bounded wait: a blocking read would trip the socket timeout when idle
+                        message = await pubsub.get_message(timeout=1.0)
+                        if not message or message.get("type") != "message":
+                            continue
+                        if message["channel"] == BROADCAST_CHANNEL:
+                            self.apply(message["data"])
+                        else:
+                            self.apply_event(message["data"])
+                except RedisError as e:
+                    print(f'Redis broadcast subscribe error: {e}')
+                finally:
+                    await pubsub.aclose()
+                await asyncio.sleep(retry_seconds)
+        finally:
+            try:
+                await redis.hdel(CONNECTIONS_KEY, self.worker_id)
+            except RedisError:
+                pass
+
+
+broadcast_bus = BroadcastBus(
+    manager,
+    heartbeat_seconds=settings.websocket_heartbeat_seconds,
+    events_channel=settings.outbox_redis_channel
+)
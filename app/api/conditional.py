@@ -0,0 +1,31 @@
+from fastapi import Request, Response
+
+ETAG_HEADER = "ETag"
+CACHE_CONTROL_HEADER = "Cache-Control"
+
+
+def make_etag(*parts) -> str:
+    """Strong ETag from version parts, e.g. make_etag("doctors", count, version)"""
+    return '"' + "-".join(str(part) for part in parts) + '"'
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """True if the client's If-None-Match already names `etag`"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # If-None-Match uses the weak comparison: W/"x" matches "x"
+    return etag in {tag.strip().removeprefix("W/") for tag in header.split(",")}
+
+
+def set_cache_headers(response: Response, etag: str, cache_control: str) -> None:
+    response.headers[ETAG_HEADER] = etag
+    response.headers[CACHE_CONTROL_HEADER] = cache_control
+
+
+def not_modified(etag: str, cache_control: str) -> Response:
+    response = Response(status_code=304)
+    set_cache_headers(response, etag, cache_control)
+    return response
@@ -0,0 +1,164 @@
+import asyncio
+import time
+from threading import Lock
+from typing import Literal
+
+from fastapi import WebSocket
+
+from app.core.config import settings
+from app.core.metrics import Histogram
+
+OverflowPolicy = Literal["disconnect", "skip"]
+
+# Close code for clients that cannot keep up: "try again later"
+TRY_AGAIN_LATER = 1013
+# Broadcast fan-out and delivery latency buckets in milliseconds
+FANOUT_BUCKETS_MS = (0.1, 0.5, 1, 5, 10, 50, 100, 500, 1000, 5000)
+
+# Queued instead of a frame to make the writer close the socket
+_CLOSE = object()
+
+
+class ClientConnection:
+    """One WebSocket with a bounded outbound queue drained by its own writer task."""
+
+    def __init__(self, websocket: WebSocket, manager: "ConnectionManager", queue_size: int):
+        self.websocket = websocket
+        self.manager = manager
+        self.queue: asyncio.Queue = asyncio.Queue(queue_size)
+        self.lagging = False
+        self.skipped = 0
+        self.topics: set[str] = set()
+        self.writer = asyncio.create_task(self._write())
+
+    def offer(self, frame: tuple[dict, float]) -> bool:
+        """Queue a frame without waiting; False if the client is too far behind"""
+        try:
+            self.queue.put_nowait(frame)
+            return True
+        except asyncio.QueueFull:
+            return False
+
+    def close_soon(self, code: int = TRY_AGAIN_LATER) -> None:
+        """Drop whatever is still queued and let the writer close the socket"""
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        # Same shape as a frame, with the close code in place of the timestamp
+        self.queue.put_nowait((_CLOSE, code))
+
+    async def _write(self) -> None:
+        try:
+            while True:
+                message, queued_at = await self.queue.get()
+                if message is _CLOSE:
+                    await self.websocket.close(code=queued_at)
+                    return
+                await self.websocket.send(message)
+                self.manager.delivery.observe((time.perf_counter() - queued_at) * 1000)
+                if self.lagging and self.queue.empty():
+                    self.lagging = False
+        except Exception:
+            # The client went away; the receive loop sees the disconnect too
+            pass
+        finally:
+            self.manager.discard(self)
+
+
+class ConnectionManager:
+    """WebSocket connections of this worker.
+
+    `broadcast` builds the ASGI message once and only enqueues it, so a slow
+    client never delays the caller or the other clients. A client whose queue
+    is full is either disconnected (`disconnect`) or misses the frame and is
+    reported as lagging until it catches up (`skip`). Frames for a topic go
+    only to its subscribers, found through the topic index.
+    """
+
+    def __init__(self, queue_size: int = 100, overflow_policy: OverflowPolicy = "disconnect"):
+        self.queue_size = queue_size
+        self.overflow_policy = overflow_policy
+        self.connections: set[ClientConnection] = set()
+        self.topics: dict[str, set[ClientConnection]] = {}
+        self.fanout = Histogram(FANOUT_BUCKETS_MS)
+        self.delivery = Histogram(FANOUT_BUCKETS_MS)
+        self._counts = {"broadcasts": 0, "frames": 0, "skipped": 0, "disconnected_slow": 0}
+        self._lock = Lock()
+
+    def _record(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counts[name] += amount
+
+    async def connect(self, websocket: WebSocket) -> ClientConnection:
+        await websocket.accept()
+        connection = ClientConnection(websocket, self, self.queue_size)
+        self.connections.add(connection)
+        return connection
+
+    def discard(self, connection: ClientConnection) -> None:
+        self.connections.discard(connection)
+        for topic in list(connection.topics):
+            self.unsubscribe(connection, topic)
+
+    def subscribe(self, connection: ClientConnection, topic: str) -> None:
+        connection.topics.add(topic)
+        self.topics.setdefault(topic, set()).add(connection)
+
+    def unsubscribe(self, connection: ClientConnection, topic: str) -> None:
+        connection.topics.discard(topic)
+        subscribers = self.topics.get(topic)
+        if subscribers is not None:
+            subscribers.discard(connection)
+            if not subscribers:
+                del self.topics[topic]
+
+    async def disconnect(self, connection: ClientConnection) -> None:
+        self.discard(connection)
+        connection.writer.cancel()
+        try:
+            await connection.writer
+        except asyncio.CancelledError:
+            pass
+
+    def send(self, connection: ClientConnection, text: str) -> bool:
+        """Queue a reply for one connection"""
+        return connection.offer(({"type": "websocket.send", "text": text}, time.perf_counter()))
+
+    def broadcast(self, text: str, topic: str | None = None) -> int:
+        """Queue `text` for every connection, or only for the subscribers of `topic`;
+        returns how many accepted it"""
+        recipients = self.connections if topic is None else self.topics.get(topic)
+        if not recipients:
+            return 0
+        started = time.perf_counter()
+        frame = ({"type": "websocket.send", "text": text}, started)
+        sent = 0
+        for connection in list(recipients):
+            if connection.offer(frame):
+                sent += 1
+            elif self.overflow_policy == "skip":
+                connection.lagging = True
+                connection.skipped += 1
+                self._record("skipped")
+            else:
+                self.discard(connection)
+                connection.close_soon()
+                self._record("disconnected_slow")
+        self._record("broadcasts")
+        self._record("frames", sent)
+        self.fanout.observe((time.perf_counter() - started) * 1000)
+        return sent
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            counts = dict(self._counts)
+        counts["active_connections"] = len(self.connections)
+        counts["topics"] = len(self.topics)
+        counts["subscriptions"] = sum(len(subscribers) for subscribers in self.topics.values())
+        counts["lagging"] = sum(1 for connection in self.connections if connection.lagging)
+        counts["queued"] = sum(connection.queue.qsize() for connection in self.connections)
+        counts["fanout_ms"] = self.fanout.snapshot()
+        counts["delivery_ms"] = self.delivery.snapshot()
+        return counts
+
+
+manager = ConnectionManager(settings.websocket_send_queue_size, settings.websocket_overflow_policy)
@@ -1,3 +1,5 @@
+import asyncio
+
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -5,26 +7,91 @@ from app.adapters.postgres_user_repository import PostgresUserRepository
 from app.adapters.postgres_appointment_repository import PostgresAppointmentRepository
 from app.adapters.postgres_doctor_repository import PostgresDoctorRepository
 from app.adapters.postgres_room_repository import PostgresRoomRepository
-from app.adapters.password_hasher import SHA256PasswordHasher
+from app.adapters.postgres_bulk_import_repository import PostgresBulkImportRepository
+from app.adapters.cached_doctor_repository import CachedDoctorRepository
+from app.adapters.password_hasher import PooledPasswordHasher
+from app.adapters.sqlalchemy_unit_of_work import SqlAlchemyUnitOfWork
+from app.domain.interfaces.unit_of_work import UnitOfWork
+from app.domain.interfaces.password_hasher import PasswordHasher
 from app.repository.doctor_repository import DoctorRepository
 from app.repository.user_repository import UserRepository
 from app.repository.appointment_repository import AppointmentRepository
 from app.repository.room_repository import RoomRepository
+from app.repository.bulk_import_repository import BulkImportRepository
 from app.use_cases.crud_doctor import GetDoctor, CreateDoctor, ListDoctors
 from app.use_cases.crud_user import GetUser, CreateUser, ListUsers
-from app.use_cases.crud_appointment import GetAppointment, CreateAppointment, ListAppointments
+from app.use_cases.crud_appointment import GetAppointment, CreateAppointment, ListAppointments, BulkCreateAppointments, ExportAppointments
 from app.use_cases.update_doctor import UpdateDoctor
 from app.use_cases.update_user import UpdateUser
 from app.use_cases.delete_doctor import DeleteDoctor
 from app.use_cases.delete_user import DeleteUser
 from app.use_cases.delete_appointment import DeleteAppointment
 from app.use_cases.crud_room import CreateRoom, ListRooms
-from app.infrastructure.database.postgres import get_db
+from app.use_cases.import_csv import ImportDoctors, ImportUsers
+from app.use_cases.slot_search import FindFreeSlots, RefreshSlotIndex
+from app.domain.scheduling import SlotIndex
+from app.infrastructure.database.postgres import AsyncSessionLocal, get_db
+from app.infrastructure.redis import get_redis
+from app.core.config import settings
+from app.core.principal_cache import PrincipalInvalidator, principal_cache
+
+# One per worker process, shared by all requests
+slot_index = SlotIndex(settings.slot_step_minutes)
+
+password_hasher = PooledPasswordHasher(
+    settings.password_hash_scheme, settings.password_hash_workers, settings.password_hash_processes
+)
+
+def get_slot_index() -> SlotIndex:
+    return slot_index
+
+async def refresh_slot_index() -> None:
+    async with AsyncSessionLocal() as session:
+        await RefreshSlotIndex(
+            slot_index,
+            PostgresDoctorRepository(session),
+            PostgresRoomRepository(session),
+            PostgresAppointmentRepository(session)
+        )()
+
+async def keep_slot_index_fresh(retry_seconds: float = 1.0) -> None:
+    """Rebuild the slot index every `slot_index_max_age_seconds` until cancelled,
+    picking up other workers' bookings; searches never rebuild it themselves"""
+    while True:
+        try:
+            await refresh_slot_index()
+        except Exception as e:
+            print(f'Slot index refresh error: {e}')
+            await asyncio.sleep(retry_seconds)
+            continue
+        await asyncio.sleep(settings.slot_index_max_age_seconds)
+
+def get_password_hasher() -> PasswordHasher:
+    return password_hasher
+
+async def get_principal_invalidator() -> PrincipalInvalidator:
+    return PrincipalInvalidator(principal_cache, await get_redis())
+
+async def get_unit_of_work(
+    session: AsyncSession = Depends(get_db)
+) -> UnitOfWork:
+    return SqlAlchemyUnitOfWork(session)
 
 async def get_doctor_repository(
-    session: AsyncSession = Depends(get_db)
+    session: AsyncSession = Depends(get_db),
+    unit_of_work: UnitOfWork = Depends(get_unit_of_work)
 ) -> DoctorRepository:
-    return PostgresDoctorRepository(session)
+    repository = PostgresDoctorRepository(session)
+    if not settings.doctor_cache_enabled:
+        return repository
+    return CachedDoctorRepository(
+        repository,
+        await get_redis(),
+        unit_of_work,
+        ttl_seconds=settings.doctor_cache_ttl_seconds,
+        negative_ttl_seconds=settings.doctor_cache_negative_ttl_seconds,
+        lock_timeout_seconds=settings.doctor_cache_lock_timeout_seconds
+    )
 
 async def get_doctor_use_case(
     repository: DoctorRepository = Depends(get_doctor_repository)
@@ -32,9 +99,11 @@ async def get_doctor_use_case(
     return GetDoctor(repository)
 
 async def create_doctor_use_case(
-    repository: DoctorRepository = Depends(get_doctor_repository)
+    repository: DoctorRepository = Depends(get_doctor_repository),
+    unit_of_work: UnitOfWork = Depends(get_unit_of_work),
+    password_hasher: PasswordHasher = Depends(get_password_hasher)
 ) -> CreateDoctor:
-    return CreateDoctor(repository)
+    return CreateDoctor(repository, password_hasher, unit_of_work)
 
 async def list_doctors_use_case(
     repository: DoctorRepository = Depends(get_doctor_repository)
@@ -42,9 +111,11 @@ async def list_doctors_use_case(
     return ListDoctors(repository)
 
 async def update_doctor_use_case(
-    repository: DoctorRepository = Depends(get_doctor_repository)
+    repository: DoctorRepository = Depends(get_doctor_repository),
+    unit_of_work: UnitOfWork = Depends(get_unit_of_work),
+    password_hasher: PasswordHasher = Depends(get_password_hasher)
 ) -> UpdateDoctor:
-    return UpdateDoctor(repository)
+    return UpdateDoctor(repository, password_hasher, unit_of_work)
 
 
 async def get_user_repository(
@@ -58,9 +129,11 @@ async def get_user_use_case(
     return GetUser(repository)
 
 async def create_user_use_case(
-    repository: UserRepository = Depends(get_user_repository)
+    repository: UserRepository = Depends(get_user_repository),
+    unit_of_work: UnitOfWork = Depends(get_unit_of_work),
+    password_hasher: PasswordHasher = Depends(get_password_hasher)
 ) -> CreateUser:
-    return CreateUser(repository, SHA256PasswordHasher())
+    return CreateUser(repository, password_hasher, unit_of_work)
 
 async def list_users_use_case(
     repository: UserRepository = Depends(get_user_repository)
@@ -68,19 +141,25 @@ async def list_users_use_case(
     return ListUsers(repository)
 
 async def update_user_use_case(
-    repository: UserRepository = Depends(get_user_repository)
+    repository: UserRepository = Depends(get_user_repository),
+    unit_of_work: UnitOfWork = Depends(get_unit_of_work),
+    principal_invalidator: PrincipalInvalidator = Depends(get_principal_invalidator),
+    password_hasher: PasswordHasher = Depends(get_password_hasher)
 ) -> UpdateUser:
-    return UpdateUser(repository)
+    return UpdateUser(repository, password_hasher, unit_of_work, principal_invalidator)
 
 async def delete_doctor_use_case(
-    repository: DoctorRepository = Depends(get_doctor_repository)
+    repository: DoctorRepository = Depends(get_doctor_repository),
+    unit_of_work: UnitOfWork = Depends(get_unit_of_work)
 ) -> DeleteDoctor:
-    return DeleteDoctor(repository)
+    return DeleteDoctor(repository, unit_of_work)
 
 async def delete_user_use_case(
-    repository: UserRepository = Depends(get_user_repository)
+    repository: UserRepository = Depends(get_user_repository),
+    unit_of_work: UnitOfWork = Depends(get_unit_of_work),
+    principal_invalidator: PrincipalInvalidator = Depends(get_principal_invalidator)
 ) -> DeleteUser:
-    return DeleteUser(repository)
+    return DeleteUser(repository, unit_of_work, principal_invalidator)
 
 async def get_appointment_repository(
     session: AsyncSession = Depends(get_db)
@@ -88,9 +167,11 @@ async def get_appointment_repository(
     return PostgresAppointmentRepository(session)
 
 async def delete_appointment_use_case(
-    repository: AppointmentRepository = Depends(get_appointment_repository)
+    repository: AppointmentRepository = Depends(get_appointment_repository),
+    unit_of_work: UnitOfWork = Depends(get_unit_of_work),
+    slot_index: SlotIndex = Depends(get_slot_index)
 ) -> DeleteAppointment:
-    return DeleteAppointment(repository)
+    return DeleteAppointment(repository, unit_of_work, slot_index)
 
 async def get_appointment_use_case(
     repository: AppointmentRepository = Depends(get_appointment_repository)
@@ -98,9 +179,23 @@ async def get_appointment_use_case(
     return GetAppointment(repository)
 
 async def create_appointment_use_case(
-    repository: AppointmentRepository = Depends(get_appointment_repository)
+    repository: AppointmentRepository = Depends(get_appointment_repository),
+    unit_of_work: UnitOfWork = Depends(get_unit_of_work),
+    slot_index: SlotIndex = Depends(get_slot_index)
 ) -> CreateAppointment:
-    return CreateAppointment(repository)
+    return CreateAppointment(repository, unit_of_work, slot_index)
+
+async def bulk_create_appointments_use_case(
+    repository: AppointmentRepository = Depends(get_appointment_repository),
+    unit_of_work: UnitOfWork = Depends(get_unit_of_work),
+    slot_index: SlotIndex = Depends(get_slot_index)
+) -> BulkCreateAppointments:
+    return BulkCreateAppointments(repository, unit_of_work, settings.appointment_bulk_chunk_size, slot_index)
+
+async def export_appointments_use_case(
+    repository: AppointmentRepository = Depends(get_appointment_repository)
+) -> ExportAppointments:
+    return ExportAppointments(repository, settings.export_batch_size)
 
 async def list_appointments_use_case(
     repository: AppointmentRepository = Depends(get_appointment_repository)
@@ -113,11 +208,36 @@ async def get_room_repository(
     return PostgresRoomRepository(session)
 
 async def create_room_use_case(
-    repository: RoomRepository = Depends(get_room_repository)
+    repository: RoomRepository = Depends(get_room_repository),
+    unit_of_work: UnitOfWork = Depends(get_unit_of_work)
 ) -> CreateRoom:
-    return CreateRoom(repository)
+    return CreateRoom(repository, unit_of_work)
+
+async def find_free_slots_use_case(
+    slot_index: SlotIndex = Depends(get_slot_index)
+) -> FindFreeSlots:
+    return FindFreeSlots(slot_index, settings.slot_search_max_days)
 
 async def list_rooms_use_case(
     repository: RoomRepository = Depends(get_room_repository)
 ) -> ListRooms:
-    return ListRooms(repository)
\ No newline at end of file
+    return ListRooms(repository)
+
+async def get_bulk_import_repository(
+    session: AsyncSession = Depends(get_db)
+) -> BulkImportRepository:
+    return PostgresBulkImportRepository(session)
+
+async def import_doctors_use_case(
+    repository: BulkImportRepository = Depends(get_bulk_import_repository),
+    unit_of_work: UnitOfWork = Depends(get_unit_of_work),
+    password_hasher: PasswordHasher = Depends(get_password_hasher)
+) -> ImportDoctors:
+    return ImportDoctors(repository, password_hasher, unit_of_work, settings.import_batch_size)
+
+async def import_users_use_case(
+    repository: BulkImportRepository = Depends(get_bulk_import_repository),
+    unit_of_work: UnitOfWork = Depends(get_unit_of_work),
+    password_hasher: PasswordHasher = Depends(get_password_hasher)
+) -> ImportUsers:
+    return ImportUsers(repository, password_hasher, unit_of_work, settings.import_batch_size)
@@ -0,0 +1,71 @@
+import csv
+import io
+import json
+from typing import AsyncIterator, Literal
+
+from fastapi.responses import StreamingResponse
+
+from app.domain.entities.appointment import Appointment
+
+APPOINTMENT_FIELDS = ("id", "datetime", "duration_minutes", "doctor_id", "user_id", "room_id")
+
+
+ExportFormat = Literal["ndjson", "csv"]
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def _values(appointment: Appointment) -> tuple[str, ...]:
+    return (
+        str(appointment.id),
+        appointment.datetime.isoformat(),
+        str(appointment.duration_minutes),
+        str(appointment.doctor_id),
+        str(appointment.user_id),
+        str(appointment.room_id),
+    )
+
+
+async def ndjson_lines(appointments: AsyncIterator[Appointment], rows_per_chunk: int = 1000) -> AsyncIterator[bytes]:
+    chunk = []
+    async for appointment in appointments:
+        chunk.append(json.dumps(dict(zip(APPOINTMENT_FIELDS, _values(appointment)))))
+        if len(chunk) >= rows_per_chunk:
+            yield ("\n".join(chunk) + "\n").encode()
+            chunk.clear()
+    if chunk:
+        yield ("\n".join(chunk) + "\n").encode()
+
+
+async def csv_lines(appointments: AsyncIterator[Appointment], rows_per_chunk: int = 1000) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(APPOINTMENT_FIELDS)
+    rows = 0
+    async for appointment in appointments:
+        writer.writerow(_values(appointment))
+        rows += 1
+        if rows >= rows_per_chunk:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+            rows = 0
+    # Always flush: an empty export still gets its header row
+    yield buffer.getvalue().encode()
+
+
+def export_response(
+    appointments: AsyncIterator[Appointment],
+    export_format: ExportFormat,
+    rows_per_chunk: int = 1000
+) -> StreamingResponse:
+    """Chunked response; only one chunk of rows is held in memory at a time."""
+    encode = csv_lines if export_format == "csv" else ndjson_lines
+    return StreamingResponse(
+        encode(appointments, rows_per_chunk),
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="appointments.{export_format}"'},
+    )
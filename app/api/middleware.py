@@ -0,0 +1,51 @@
+import math
+import time
+from fastapi import Request
+from app.core.config import settings
+from app.infrastructure.database.routing import use_primary
+from app.adapters.sqlalchemy_unit_of_work import CommitCounter, request_commits
+
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+LAST_WRITE_COOKIE = "last_write"
+COMMIT_COUNT_HEADER = "X-DB-Commits"
+
+
+def _wrote_recently(request: Request) -> bool:
+    try:
+        last_write = float(request.cookies.get(LAST_WRITE_COOKIE, ""))
+    except ValueError:
+        return False
+    return time.time() - last_write < settings.read_your_writes_seconds
+
+
+async def read_your_writes_middleware(request: Request, call_next):
+    """Route writes, and reads shortly after a client's own write, to the primary"""
+    is_write = request.method not in SAFE_METHODS
+    token = use_primary.set(is_write or _wrote_recently(request))
+    try:
+        response = await call_next(request)
+    finally:
+        use_primary.reset(token)
+
+    if is_write and response.status_code < 400:
+        response.set_cookie(
+            LAST_WRITE_COOKIE,
+            f"{time.time():.3f}",
+            max_age=math.ceil(settings.read_your_writes_seconds),
+            httponly=True,
+            samesite="lax",
+        )
+    return response
+
+
+async def commit_count_middleware(request: Request, call_next):
+    """Report how many database commits the request made"""
+    counter = CommitCounter()
+    token = request_commits.set(counter)
+    try:
+        response = await call_next(request)
+    finally:
+        request_commits.reset(token)
+
+    response.headers[COMMIT_COUNT_HEADER] = str(counter.count)
+    return response
@@ -0,0 +1,13 @@
+from fastapi import Query, Response
+from app.repository.pagination import Page
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+CursorQuery = Query(None, description=f"Value of the {NEXT_CURSOR_HEADER} header of the previous page")
+# OFFSET pagination is kept for existing clients only: it rescans skipped rows
+LegacySkipQuery = Query(None, ge=0, deprecated=True, description="Legacy OFFSET pagination")
+
+
+def set_next_cursor(response: Response, page: Page) -> None:
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
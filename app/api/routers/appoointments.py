@@ -1,21 +1,50 @@
 from fastapi import APIRouter, Depends, Query
+from datetime import datetime
 from uuid import UUID
 
-from app.use_cases.crud_appointment import GetAppointment, CreateAppointment, ListAppointments
+from app.use_cases.crud_appointment import GetAppointment, CreateAppointment, ListAppointments, BulkCreateAppointments, BulkItemStatus, ExportAppointments
 from app.use_cases.delete_appointment import DeleteAppointment
 from app.api.dependencies import (
     get_appointment_use_case,
     create_appointment_use_case,
+    bulk_create_appointments_use_case,
+    export_appointments_use_case,
     list_appointments_use_case,
     delete_appointment_use_case
 )
-from app.api.auth import get_current_active_user
+from app.api.auth import get_current_active_user, get_admin_user
 
-from app.api.routers.schema import AppointmentItemCreate, AppointmentItem
+from app.api.routers.schema import (
+    AppointmentItemCreate,
+    AppointmentItem,
+    AppointmentBulkCreate,
+    AppointmentBulkItemResult,
+    AppointmentBulkResult
+)
+from app.api.pagination import CursorQuery, LegacySkipQuery, set_next_cursor
+from app.api.serialization import ListSerializer
+from app.api.export import ExportFormat, export_response
+from app.core.config import settings
 from app.domain.entities.user import User
 
 router = APIRouter()
 
+appointment_list = ListSerializer(AppointmentItem)
+
+
+# Declared before /appointments/{appointment_id} so "export" is not parsed as an id
+@router.get("/appointments/export")
+async def export_appointments(
+    format: ExportFormat = "ndjson",
+    date_from: datetime | None = None,
+    date_to: datetime | None = None,
+    doctor_id: UUID | None = None,
+    use_case: ExportAppointments = Depends(export_appointments_use_case),
+    current_user: User = Depends(get_admin_user)
+):
+    """Stream every matching appointment as NDJSON or CSV, ordered by datetime"""
+    appointments = use_case(date_from=date_from, date_to=date_to, doctor_id=doctor_id)
+    return export_response(appointments, format, settings.export_batch_size)
 
 @router.get("/appointments/{appointment_id}", response_model=AppointmentItem)
 async def get_appointment(
@@ -31,13 +60,41 @@ async def create_appointment(
 ):
     return await use_case(appointment_data.to_entity())
 
+@router.post("/appointments/bulk", response_model=AppointmentBulkResult)
+async def bulk_create_appointments(
+    bulk_data: AppointmentBulkCreate,
+    use_case: BulkCreateAppointments = Depends(bulk_create_appointments_use_case),
+    current_user: User = Depends(get_admin_user)
+):
+    results = await use_case([item.to_entity() for item in bulk_data.items])
+    return AppointmentBulkResult(
+        created=sum(result.status == BulkItemStatus.CREATED for result in results),
+        conflicts=sum(result.status == BulkItemStatus.CONFLICT for result in results),
+        invalid=sum(result.status == BulkItemStatus.INVALID for result in results),
+        items=[
+            AppointmentBulkItemResult(
+                index=result.index,
+                id=result.appointment.id,
+                status=result.status,
+                detail=result.detail
+            )
+            for result in results
+        ]
+    )
+
 @router.get("/appointments", response_model=list[AppointmentItem])
 async def list_appointments(
-    skip: int = Query(0, ge=0),
+    cursor: str | None = CursorQuery,
+    skip: int | None = LegacySkipQuery,
     limit: int = Query(100, ge=1, le=1000),
     use_case: ListAppointments = Depends(list_appointments_use_case)
 ):
-    return await use_case(skip=skip, limit=limit)
+    if skip is not None:
+        return appointment_list.response(await use_case(skip=skip, limit=limit))
+    page = await use_case.page(limit=limit, cursor=cursor)
+    response = appointment_list.response(page.items)
+    set_next_cursor(response, page)
+    return response
 
 @router.delete("/appointments/{appointment_id}")
 async def delete_appointment(
@@ -2,6 +2,8 @@ from fastapi import APIRouter, Depends
 from fastapi.security import OAuth2PasswordRequestForm
 from app.use_cases.auth import AuthService
 from app.api.auth import get_user_repository
+from app.api.dependencies import get_password_hasher, get_unit_of_work
+from app.domain.interfaces.password_hasher import PasswordHasher
 from app.api.routers.schema import (
     UserRegister, 
     TokenData, 
@@ -18,10 +20,12 @@ security = HTTPBearer()
 
 router = APIRouter()
 
-async def get_auth_service(user_repository = Depends(get_user_repository)) -> AuthService:
-    from app.adapters.password_hasher import SHA256PasswordHasher
-    password_hasher = SHA256PasswordHasher()
-    return AuthService(user_repository, password_hasher)
+async def get_auth_service(
+    user_repository = Depends(get_user_repository),
+    unit_of_work = Depends(get_unit_of_work),
+    password_hasher: PasswordHasher = Depends(get_password_hasher)
+) -> AuthService:
+    return AuthService(user_repository, password_hasher, unit_of_work)
 
 @router.post("/register", response_model=UserPublic)
 async def register(
@@ -42,8 +46,7 @@ async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
     auth_service: AuthService = Depends(get_auth_service)
 ):
-    user = await auth_service.authenticate_user(form_data.username, form_data.password)
-    tokens = await auth_service.create_tokens(user)
+    tokens = await auth_service.login(form_data.username, form_data.password)
     return TokenData(**tokens)
 
 @router.post("/refresh", response_model=TokenData)
@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends,  Query
+from fastapi import APIRouter, Depends, Query, Request, Response
+from typing import Literal
 from uuid import UUID
 
 from app.use_cases.crud_doctor import GetDoctor, CreateDoctor, ListDoctors
@@ -14,16 +15,32 @@ from app.api.dependencies import (
 from app.api.auth import get_current_active_user, get_admin_user
 from app.domain.entities.user import User
 from app.api.routers.schema import DoctorItemCreate, DoctorResponse, DoctorItemUpdate
+from app.api.pagination import CursorQuery, LegacySkipQuery, set_next_cursor
+from app.api.serialization import ListSerializer
+from app.api.conditional import is_not_modified, make_etag, not_modified, set_cache_headers
+from app.core.config import settings
+from app.domain.entities.doctor import CategoryEnum
+from app.repository.doctor_repository import DoctorFilters, DoctorSort
 
 router = APIRouter()
 
+doctor_list = ListSerializer(DoctorResponse)
+
 
 @router.get("/doctors/{doctor_id}", response_model=DoctorResponse)
 async def get_doctor(
     doctor_id: UUID,
+    request: Request,
+    response: Response,
     use_case: GetDoctor = Depends(get_doctor_use_case)
 ):
-    return await use_case(doctor_id)
+    # Usually a doctor cache hit; only serialization is skipped on a match
+    doctor = await use_case(doctor_id)
+    etag = make_etag("doctor", doctor.id, doctor.version)
+    if is_not_modified(request, etag):
+        return not_modified(etag, settings.doctor_cache_control)
+    set_cache_headers(response, etag, settings.doctor_cache_control)
+    return doctor
 
 @router.post("/doctors", response_model=DoctorResponse)
 async def create_doctor(
@@ -35,11 +52,36 @@ async def create_doctor(
 
 @router.get("/doctors", response_model=list[DoctorResponse])
 async def list_doctors(
-    skip: int = Query(0, ge=0),
+    request: Request,
+    cursor: str | None = CursorQuery,
+    skip: int | None = LegacySkipQuery,
     limit: int = Query(100, ge=1, le=1000),
+    specialization: str | None = Query(None, min_length=1),
+    category: Literal["first", "second", "highest", "no_category"] | None = None,
+    min_experience: int | None = Query(None, ge=0),
+    name: str | None = Query(None, min_length=1, description="Prefix of the name or surname"),
+    sort: Literal["surname", "-surname", "experience", "-experience"] = "surname",
     use_case: ListDoctors = Depends(list_doctors_use_case)
 ):
-    return await use_case(skip=skip, limit=limit)
+    filters = DoctorFilters(
+        specialization=specialization,
+        category=CategoryEnum(category) if category else None,
+        min_experience=min_experience,
+        name_prefix=name
+    )
+    # Read before the rows: a change in between gives an older tag, never a stale body
+    etag = make_etag("doctors", *await use_case.version())
+    if is_not_modified(request, etag):
+        return not_modified(etag, settings.doctors_cache_control)
+    
+    if skip is not None:
+        response = doctor_list.response(await use_case(skip=skip, limit=limit, filters=filters, sort=DoctorSort(sort)))
+    else:
+        page = await use_case.page(limit=limit, cursor=cursor, filters=filters, sort=DoctorSort(sort))
+        response = doctor_list.response(page.items)
+        set_next_cursor(response, page)
+    set_cache_headers(response, etag, settings.doctors_cache_control)
+    return response
 
 @router.patch("/doctors/{doctor_id}", response_model=DoctorResponse)
 async def update_doctor(
@@ -55,7 +97,9 @@ async def update_doctor(
         age=doctor_data.age,
         specialization=doctor_data.specialization,
         category=doctor_data.category,
-        password=doctor_data.password
+        password=doctor_data.password,
+        work_start=doctor_data.work_start,
+        work_end=doctor_data.work_end
     )
 
 @router.delete("/doctors/{doctor_id}")
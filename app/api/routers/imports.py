@@ -0,0 +1,50 @@
+import csv
+import io
+
+from fastapi import APIRouter, Depends, UploadFile
+
+from app.use_cases.import_csv import CsvImport, ImportDoctors, ImportUsers, ImportReport
+from app.api.dependencies import import_doctors_use_case, import_users_use_case
+from app.api.auth import get_admin_user
+from app.api.routers.schema import ImportResult, ImportRowReject
+from app.domain.entities.user import User
+
+router = APIRouter()
+
+
+async def _run_import(file: UploadFile, use_case: CsvImport) -> ImportResult:
+    # The upload is spooled to disk by the server; rows are read from it lazily
+    text = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    try:
+        report = await use_case(csv.DictReader(text))
+    finally:
+        text.detach()
+    return to_result(report)
+
+
+def to_result(report: ImportReport) -> ImportResult:
+    return ImportResult(
+        total=report.total,
+        imported=report.imported,
+        rejected=len(report.rejects),
+        rejects=[ImportRowReject(line=reject.line, reason=reject.reason) for reject in report.rejects]
+    )
+
+
+@router.post("/import/doctors", response_model=ImportResult)
+async def import_doctors(
+    file: UploadFile,
+    use_case: ImportDoctors = Depends(import_doctors_use_case),
+    current_user: User = Depends(get_admin_user)
+):
+    """CSV columns: name, surname, age, specialization, category, password, experience_years"""
+    return await _run_import(file, use_case)
+
+@router.post("/import/users", response_model=ImportResult)
+async def import_users(
+    file: UploadFile,
+    use_case: ImportUsers = Depends(import_users_use_case),
+    current_user: User = Depends(get_admin_user)
+):
+    """CSV columns: name, surname, email, password, age, phone, role"""
+    return await _run_import(file, use_case)
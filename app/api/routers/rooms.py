@@ -1,13 +1,19 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
 from typing import List
 
 from app.use_cases.crud_room import CreateRoom, ListRooms
 from app.api.dependencies import create_room_use_case, list_rooms_use_case
 
 from app.api.routers.schema import RoomItemCreate, RoomItem
+from app.api.pagination import CursorQuery, LegacySkipQuery, set_next_cursor
+from app.api.serialization import ListSerializer
+from app.api.conditional import is_not_modified, make_etag, not_modified, set_cache_headers
+from app.core.config import settings
 
 router = APIRouter()
 
+room_list = ListSerializer(RoomItem)
+
 @router.post("/rooms", response_model=RoomItemCreate)
 async def create_room(
     room_data: RoomItemCreate,
@@ -17,9 +23,23 @@ async def create_room(
 
 @router.get("/rooms", response_model=List[RoomItem])
 async def list_rooms(
-    skip: int = Query(0, ge=0),
+    request: Request,
+    cursor: str | None = CursorQuery,
+    skip: int | None = LegacySkipQuery,
     limit: int = Query(100, ge=1, le=1000),
     use_case: ListRooms = Depends(list_rooms_use_case)
 ):
-    return await use_case(skip=skip, limit=limit)
+    # Read before the rows: a change in between gives an older tag, never a stale body
+    etag = make_etag("rooms", *await use_case.version())
+    if is_not_modified(request, etag):
+        return not_modified(etag, settings.rooms_cache_control)
+    
+    if skip is not None:
+        response = room_list.response(await use_case(skip=skip, limit=limit))
+    else:
+        page = await use_case.page(limit=limit, cursor=cursor)
+        response = room_list.response(page.items)
+        set_next_cursor(response, page)
+    set_cache_headers(response, etag, settings.rooms_cache_control)
+    return response
 
@@ -1,5 +1,5 @@
 import re
-from datetime import date, datetime
+from datetime import date, datetime, time
 from typing import Optional
 
 from pydantic import (
@@ -10,7 +10,8 @@ from pydantic import (
     StrictInt,
     StrictStr,
     computed_field,
-    field_validator
+    field_validator,
+    model_validator
 )
 from uuid import UUID
 from enum import StrEnum
@@ -38,6 +39,8 @@ class DoctorItemCreate(BaseModel):
     category: CategoryEnum
     password: str = Field(exclude=True, min_length=4)
     experience_years: StrictInt = Field(default=0, ge=0)
+    work_start: time = time(9, 0)
+    work_end: time = time(17, 0)
 
     @field_validator('age')
     def check_age(cls, value):
@@ -45,6 +48,12 @@ class DoctorItemCreate(BaseModel):
             raise ValueError('Age cannot be negative')
         return value
 
+    @model_validator(mode='after')
+    def check_working_hours(self):
+        if self.work_start >= self.work_end:
+            raise ValueError('work_start must be before work_end')
+        return self
+
     @computed_field
     def full_name(self) -> str:
         return f"{self.name} {self.surname}"
@@ -58,7 +67,9 @@ class DoctorItemCreate(BaseModel):
             specialization=self.specialization,
             category=self.category,
             password=self.password,
-            experience_years=self.experience_years
+            experience_years=self.experience_years,
+            work_start=self.work_start,
+            work_end=self.work_end
         )
 
 
@@ -70,6 +81,8 @@ class DoctorResponse(BaseModel):
     specialization: StrictStr
     category: CategoryEnum
     experience_years: StrictInt
+    work_start: time
+    work_end: time
 
 
 class DoctorItemUpdate(BaseModel):
@@ -81,6 +94,15 @@ class DoctorItemUpdate(BaseModel):
     category: CategoryEnum | None = None
     password: str | None = Field(default=None, min_length=5, exclude=True)
     experience_years: StrictInt | None = Field(default=None, ge=0)
+    work_start: time | None = None
+    work_end: time | None = None
+
+    @model_validator(mode='after')
+    def check_working_hours(self):
+        # A single bound is checked against the stored one by the database
+        if self.work_start is not None and self.work_end is not None and self.work_start >= self.work_end:
+            raise ValueError('work_start must be before work_end')
+        return self
 
 
 class BaseUser(BaseModel):
@@ -200,6 +222,7 @@ class AppointmentItemCreate(BaseModel):
     doctor_id: UUID
     user_id: UUID
     room_id: UUID
+    duration_minutes: StrictInt = Field(default=30, gt=0, le=480)
     
     def to_entity(self):
         from app.domain.entities.appointment import Appointment
@@ -207,7 +230,8 @@ class AppointmentItemCreate(BaseModel):
             datetime=self.datetime,
             doctor_id=self.doctor_id,
             user_id=self.user_id,
-            room_id=self.room_id
+            room_id=self.room_id,
+            duration_minutes=self.duration_minutes
         )
 
 
@@ -215,6 +239,43 @@ class AppointmentItem(AppointmentItemCreate):
     id: UUID
 
 
+class AppointmentBulkCreate(BaseModel):
+    items: list[AppointmentItemCreate] = Field(min_length=1, max_length=10_000)
+
+
+class AppointmentBulkItemResult(BaseModel):
+    index: int
+    id: UUID
+    status: str
+    detail: str | None = None
+
+
+class AppointmentBulkResult(BaseModel):
+    created: int
+    conflicts: int
+    invalid: int
+    items: list[AppointmentBulkItemResult]
+
+
+class SlotItem(BaseModel):
+    doctor_id: UUID
+    room_id: UUID
+    start: datetime
+    end: datetime
+
+
+class ImportRowReject(BaseModel):
+    line: int
+    reason: str
+
+
+class ImportResult(BaseModel):
+    total: int
+    imported: int
+    rejected: int
+    rejects: list[ImportRowReject]
+
+
 class PasswordResetRequest(BaseModel):
     email: EmailStr
 
@@ -0,0 +1,31 @@
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, Query
+
+from app.use_cases.slot_search import FindFreeSlots
+from app.api.dependencies import find_free_slots_use_case
+from app.api.auth import get_current_active_user
+from app.api.routers.schema import SlotItem
+from app.domain.entities.user import User
+
+router = APIRouter()
+
+
+@router.get("/slots", response_model=list[SlotItem])
+async def find_free_slots(
+    specialization: str = Query(min_length=3),
+    date_from: datetime = Query(),
+    date_to: datetime = Query(),
+    duration_minutes: int = Query(30, gt=0, le=480),
+    limit: int = Query(10, ge=1, le=100),
+    use_case: FindFreeSlots = Depends(find_free_slots_use_case),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Earliest free (doctor, room, start) combinations within the doctors' working hours"""
+    return await use_case(
+        specialization=specialization,
+        date_from=date_from,
+        date_to=date_to,
+        duration_minutes=duration_minutes,
+        limit=limit
+    )
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from uuid import UUID
 from app.domain.entities.user import User, UserRole
 
@@ -14,6 +14,7 @@ from app.api.dependencies import (
 )
 
 from app.api.routers.schema import UserItemCreate, UserItem, UserItemUpdate
+from app.api.pagination import CursorQuery, LegacySkipQuery, set_next_cursor
 from app.api.auth import get_current_active_user, get_admin_user
 
 router = APIRouter()
@@ -35,12 +36,18 @@ async def create_user(
 
 @router.get("/users", response_model=list[UserItem])
 async def list_users(
-    skip: int = Query(0, ge=0),
+    response: Response,
+    cursor: str | None = CursorQuery,
+    skip: int | None = LegacySkipQuery,
     limit: int = Query(100, ge=1, le=1000),
     use_case: ListUsers = Depends(list_users_use_case),
     current_user: User = Depends(get_admin_user)
 ):
-    return await use_case(skip=skip, limit=limit)
+    if skip is not None:
+        return await use_case(skip=skip, limit=limit)
+    page = await use_case.page(limit=limit, cursor=cursor)
+    set_next_cursor(response, page)
+    return page.items
 
 @router.patch("/users/{user_id}", response_model=UserItem)
 async def update_user(
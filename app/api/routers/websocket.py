@@ -1,25 +1,72 @@
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect
-from typing import Set
 import json
+from uuid import UUID
+
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from redis.exceptions import RedisError
+
+from app.api.broadcast_bus import broadcast_bus
+from app.api.connections import ClientConnection, manager
+from app.core.config import settings
 
 router = APIRouter()
 
-# Storage of active WebSocket connections
-connections: Set[WebSocket] = set()
+# Schedules a client can follow: "doctor:<uuid>" or "room:<uuid>"
+TOPIC_KINDS = ("doctor", "room")
+
+
+def parse_topic(topic) -> str | None:
+    """The canonical form of a valid topic, None otherwise"""
+    if not isinstance(topic, str):
+        return None
+    kind, _, entity_id = topic.partition(":")
+    try:
+        return f"{kind}:{UUID(entity_id)}" if kind in TOPIC_KINDS else None
+    except ValueError:
+        return None
+
+
+def handle_command(connection: ClientConnection, data: str) -> bool:
+    """Apply a {"action": "subscribe" | "unsubscribe", "topic": ...} message;
+    False if `data` is not a command and should be broadcast as before"""
+    try:
+        command = json.loads(data)
+    except ValueError:
+        return False
+    if not isinstance(command, dict) or command.get("action") not in ("subscribe", "unsubscribe"):
+        return False
+    
+    action = command["action"]
+    topic = parse_topic(command.get("topic"))
+    if topic is None:
+        reply = {"type": "error", "message": "topic must be doctor:<id> or room:<id>"}
+    elif action == "subscribe" and topic not in connection.topics and len(connection.topics) >= settings.websocket_max_topics:
+        reply = {"type": "error", "message": f"at most {settings.websocket_max_topics} topics per connection"}
+    else:
+        if action == "subscribe":
+            manager.subscribe(connection, topic)
+        else:
+            manager.unsubscribe(connection, topic)
+        reply = {"type": f"{action}d", "topic": topic}
+    manager.send(connection, json.dumps(reply))
+    return True
+
 
 @router.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
-    await websocket.accept()
-    connections.add(websocket)
+    connection = await manager.connect(websocket)
     
     try:
         while True:
             data = await websocket.receive_text()
-            # We send a message to all connected users
-            message = f"Broadcast: {data}"
-            await broadcast_message(message)
-    except WebSocketDisconnect:
-        connections.discard(websocket)
+            if handle_command(connection, data):
+                continue
+            # We send a message to all connected users, in every worker
+            await broadcast_bus.publish(f"Broadcast: {data}")
+    except (WebSocketDisconnect, RuntimeError):
+        # RuntimeError: the writer already closed a client that fell behind
+        pass
+    finally:
+        await manager.disconnect(connection)
 
 @router.post("/broadcast")
 async def send_broadcast(message: str):
@@ -28,27 +75,22 @@ async def send_broadcast(message: str):
     return {"message": "Broadcast sent", "sent_to": sent_count}
 
 async def broadcast_message(message: str) -> int:
-    """Send a message to all active connections"""
-    if not connections:
-        return 0
-    
-    disconnected = set()
-    
-    for connection in connections:
-        try:
-            await connection.send_text(message)
-        except:
-            disconnected.add(connection)
-    
-    # Removing disabled connections
-    connections.difference_update(disconnected)
-    
-    return len(connections)
+    """Queue a message for all connections of all workers; returns this worker's count"""
+    return await broadcast_bus.publish(message)
 
 @router.get("/ws/status")
 async def websocket_status():
     """Get the status of WebSocket connections"""
+    snapshot = manager.snapshot()
+    try:
+        cluster = await broadcast_bus.cluster_status()
+    except RedisError as e:
+        print(f'Redis connection count error: {e}')
+        cluster = None
+    active = cluster["connections"] if cluster else snapshot["active_connections"]
     return {
-        "active_connections": len(connections),
-        "status": "active" if connections else "no_connections"
-    }
\ No newline at end of file
+        **snapshot,
+        "cluster": cluster,
+        "relayed": broadcast_bus.relayed,
+        "status": "active" if active else "no_connections"
+    }
@@ -0,0 +1,40 @@
+from operator import attrgetter
+from typing import Any, Iterable
+
+import orjson
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+
+from app.core.config import settings
+
+
+class ListSerializer:
+    """JSON serializer for lists of domain entities, built once per schema.
+
+    The default response path validates every entity into the `response_model`
+    and then serializes the models. Entities from our own repositories are
+    already valid, so the trusted path reads the schema's fields straight off
+    them and writes the bytes with orjson, which produces the same JSON for the
+    field types our schemas use. With `validate_responses` on, items go through
+    a TypeAdapter for the schema compiled once here.
+    """
+
+    def __init__(self, schema: type[BaseModel]):
+        decorators = schema.__pydantic_decorators__
+        if decorators.computed_fields or decorators.field_serializers or decorators.model_serializers:
+            raise ValueError(f"{schema.__name__} customizes serialization, which the trusted path would skip")
+        fields = [name for name, field in schema.model_fields.items() if not field.exclude]
+        self.schema = schema
+        self.keys = tuple(schema.model_fields[name].alias or name for name in fields)
+        self._values = attrgetter(*fields) if len(fields) > 1 else lambda item: (getattr(item, fields[0]),)
+        self._models = TypeAdapter(list[schema])
+
+    def dump_json(self, items: Iterable[Any], validate: bool | None = None) -> bytes:
+        if settings.validate_responses if validate is None else validate:
+            return self._models.dump_json(self._models.validate_python(items, from_attributes=True))
+        keys, values = self.keys, self._values
+        # OPT_UTC_Z writes UTC as "Z", like pydantic
+        return orjson.dumps([dict(zip(keys, values(item))) for item in items], option=orjson.OPT_UTC_Z)
+
+    def response(self, items: Iterable[Any]) -> Response:
+        return Response(content=self.dump_json(items), media_type="application/json")
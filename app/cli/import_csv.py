@@ -0,0 +1,54 @@
+"""Bulk import doctors or users from a CSV file.
+
+Usage: python -m app.cli.import_csv {doctors,users} path/to/file.csv
+"""
+import argparse
+import asyncio
+import csv
+import sys
+
+from app.adapters.password_hasher import PooledPasswordHasher
+from app.adapters.postgres_bulk_import_repository import PostgresBulkImportRepository
+from app.adapters.sqlalchemy_unit_of_work import SqlAlchemyUnitOfWork
+from app.core.config import settings
+from app.infrastructure.database.postgres import AsyncSessionLocal, dispose_engines
+from app.use_cases.import_csv import ImportDoctors, ImportUsers
+
+USE_CASES = {"doctors": ImportDoctors, "users": ImportUsers}
+
+
+async def run(kind: str, path: str) -> int:
+    # A batch job: use every configured worker, in processes when so configured
+    password_hasher = PooledPasswordHasher(
+        settings.password_hash_scheme, settings.password_hash_workers, settings.password_hash_processes
+    )
+    try:
+        async with AsyncSessionLocal() as session:
+            use_case = USE_CASES[kind](
+                PostgresBulkImportRepository(session),
+                password_hasher,
+                SqlAlchemyUnitOfWork(session),
+                settings.import_batch_size
+            )
+            with open(path, encoding="utf-8-sig", newline="") as file:
+                report = await use_case(csv.DictReader(file))
+    finally:
+        password_hasher.close()
+        await dispose_engines()
+
+    for reject in report.rejects:
+        print(f"line {reject.line}: {reject.reason}", file=sys.stderr)
+    print(f"{report.imported} of {report.total} {kind} imported, {len(report.rejects)} rejected")
+    return 0 if not report.rejects else 1
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Bulk import doctors or users from CSV")
+    parser.add_argument("kind", choices=sorted(USE_CASES))
+    parser.add_argument("path")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(run(args.kind, args.path)))
+
+
+if __name__ == "__main__":
+    main()
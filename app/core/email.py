@@ -1,10 +1,8 @@
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
 from app.core.config import settings
+from app.infrastructure.mail import OutgoingMail, mail_sender
 
 async def send_reset_email(email: str, reset_token: str):
-    """Send email for reset password"""
+    """Queue the password reset email; the background sender delivers it"""
     
     if not settings.smtp_username or not settings.smtp_password:
         print(f"Email sending disabled. Reset token for {email}: {reset_token}")
@@ -12,11 +10,6 @@ async def send_reset_email(email: str, reset_token: str):
     
     reset_url = f"http://localhost:8000/reset-password?token={reset_token}"
     
-    message = MIMEMultipart()
-    message["From"] = settings.from_email
-    message["To"] = email
-    message["Subject"] = "Сброс пароля - Medical App"
-    
     body = f"""
     Здравствуйте!
     
@@ -33,17 +26,4 @@ async def send_reset_email(email: str, reset_token: str):
     Команда Medical App
     """
     
-    message.attach(MIMEText(body, "plain"))
-    
-    try:
-        server = smtplib.SMTP(settings.smtp_server, settings.smtp_port)
-        server.starttls()
-        server.login(settings.smtp_username, settings.smtp_password)
-        text = message.as_string()
-        server.sendmail(settings.from_email, email, text)
-        server.quit()
-        print(f"Reset email sent to {email}")
-    except Exception as e:
-        print(f"Failed to send email to {email}: {e}")
-        # In production this should be logging
-        raise
\ No newline at end of file
+    mail_sender.enqueue(OutgoingMail(to=email, subject="Сброс пароля - Medical App", body=body))
@@ -0,0 +1,61 @@
+from bisect import bisect_left
+from threading import Lock
+from typing import Sequence
+
+# Default latency buckets in milliseconds
+DEFAULT_LATENCY_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class Histogram:
+    """Bucketed histogram; each value is counted in the smallest bucket it fits into."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS_MS):
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._max = 0.0
+        self._lock = Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._count += 1
+            self._sum += value
+            if value > self._max:
+                self._max = value
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            counts = list(self._counts)
+            count, total, maximum = self._count, self._sum, self._max
+
+        labels = [f"le_{bound:g}" for bound in self.buckets] + ["inf"]
+        return {
+            "count": count,
+            "sum": round(total, 3),
+            "max": round(maximum, 3),
+            "avg": round(total / count, 3) if count else 0.0,
+            "buckets": dict(zip(labels, counts)),
+        }
+
+
+class CacheStatistics:
+    """Hit/miss counters of a cache, shared by every instance that uses it."""
+
+    def __init__(self, *extra: str):
+        names = ("hits", "misses", "loads", "lock_waits", "errors", *extra)
+        self._counts = dict.fromkeys(names, 0)
+        self._lock = Lock()
+
+    def record(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counts[name] += amount
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            counts = dict(self._counts)
+        lookups = counts["hits"] + counts["misses"]
+        counts["hit_ratio"] = round(counts["hits"] / lookups, 4) if lookups else 0.0
+        return counts
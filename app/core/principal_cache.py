@@ -0,0 +1,127 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Callable
+from uuid import UUID
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.core.metrics import CacheStatistics
+from app.core.token_storage import security_version_key
+from app.domain.entities.user import User
+
+# Workers tell each other which user ids to drop
+INVALIDATION_CHANNEL = "principal:invalidate"
+# Published instead of an id to drop every entry
+ALL = "*"
+
+statistics = CacheStatistics("evictions", "invalidations")
+
+
+class PrincipalCache:
+    """Bounded LRU of authenticated users with a TTL, local to one worker.
+
+    Saves `get_current_user` a database round trip on every protected request.
+    Role and disabled changes are pushed to every worker through Redis pub/sub;
+    the TTL bounds staleness when a message is lost. A `max_size` of 0
+    disables the cache.
+    """
+
+    def __init__(self, max_size: int = 10_000, ttl_seconds: float = 30.0, clock: Callable[[], float] = time.monotonic):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self._entries: OrderedDict[UUID, tuple[float, User]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, user_id: UUID) -> User | None:
+        entry = self._entries.get(user_id)
+        if entry is None or entry[0] <= self.clock():
+            if entry is not None:
+                del self._entries[user_id]
+            statistics.record("misses")
+            return None
+        self._entries.move_to_end(user_id)
+        statistics.record("hits")
+        return entry[1]
+
+    def put(self, user: User) -> None:
+        if self.max_size <= 0:
+            return
+        self._entries[user.id] = (self.clock() + self.ttl_seconds, user)
+        self._entries.move_to_end(user.id)
+        statistics.record("loads")
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            statistics.record("evictions")
+
+    def discard(self, user_id: UUID) -> None:
+        if self._entries.pop(user_id, None) is not None:
+            statistics.record("invalidations")
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def apply(self, message: str) -> None:
+        """Handle one message from the invalidation channel"""
+        if message == ALL:
+            self.clear()
+            return
+        try:
+            self.discard(UUID(message))
+        except ValueError:
+            print(f'Principal cache: ignoring invalidation {message!r}')
+
+
+class PrincipalInvalidator:
+    """Revokes what other requests know about a user's authorization.
+
+    Drops the user from the principal cache of this and every other worker and
+    bumps their security version, which invalidates stateless access tokens.
+    """
+
+    def __init__(self, cache: PrincipalCache, redis: Redis | None = None):
+        self.cache = cache
+        self.redis = redis
+
+    async def invalidate(self, user_id: UUID | str) -> None:
+        self.cache.discard(UUID(str(user_id)))
+        if self.redis is None:
+            return
+        key = security_version_key(str(user_id))
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                # No TTL: a reset to 0 would revoke tokens issued after the bump
+                pipe.incr(key)
+                pipe.publish(INVALIDATION_CHANNEL, str(user_id))
+                await pipe.execute()
+        except RedisError as e:
+            statistics.record("errors")
+            print(f'Redis publish error: {e}')
+
+    async def listen(self, retry_seconds: float = 1.0) -> None:
+        """Apply other workers' invalidations until cancelled"""
+        while True:
+            pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                # Messages may have been missed while we were not subscribed
+                self.cache.clear()
+                while True:
+                    # A bounded wait: a blocking read would trip the socket timeout when idle
+                    message = await pubsub.get_message(timeout=1.0)
+                    if message and message.get("type") == "message":
+                        self.cache.apply(message["data"])
+            except RedisError as e:
+                statistics.record("errors")
+                print(f'Redis subscribe error: {e}')
+            finally:
+                await pubsub.aclose()
+            await asyncio.sleep(retry_seconds)
+
+
+principal_cache = PrincipalCache(settings.principal_cache_size, settings.principal_cache_ttl_seconds)
@@ -0,0 +1,197 @@
+import asyncio
+import hashlib
+import math
+import time
+from threading import Lock
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.core.metrics import Histogram
+
+# Revoked token fingerprints scored by token expiry, the source of full rebuilds
+INDEX_KEY = "blacklist:index"
+# "<fingerprint> <revoked_at>" for every revocation, so workers add it at once
+REVOKED_CHANNEL = "blacklist:revoked"
+# Set once the blacklist:<token> keys written before the index existed are indexed
+BACKFILL_KEY = "blacklist:index:backfilled"
+BLACKLIST_PREFIX = "blacklist:"
+BACKFILL_BATCH_SIZE = 1000
+
+# Sync lag buckets in milliseconds
+SYNC_LAG_BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000, 5000)
+
+
+def token_fingerprint(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over hex fingerprints; no false negatives."""
+
+    def __init__(self, capacity: int, error_rate: float):
+        capacity = max(capacity, 1)
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, fingerprint: str):
+        # Double hashing from two independent halves of the SHA-256 fingerprint
+        first, second = int(fingerprint[:16], 16), int(fingerprint[16:32], 16) | 1
+        return ((first + i * second) % self.size for i in range(self.hashes))
+
+    def add(self, fingerprint: str) -> None:
+        for position in self._positions(fingerprint):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, fingerprint: str) -> bool:
+        bits = self._bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(fingerprint))
+
+    def expected_error_rate(self) -> float:
+        return (1 - math.exp(-self.hashes * self.count / self.size)) ** self.hashes
+
+
+class RevocationFilter:
+    """Per-worker Bloom filter of revoked tokens in front of the Redis blacklist.
+
+    A negative answer means the token is not revoked and Redis is skipped; a
+    positive one is confirmed against Redis. New revocations arrive over pub/sub
+    and the filter is rebuilt from the index every `rebuild_seconds`, which also
+    drops expired tokens and heals missed messages. The first rebuild against a
+    Redis whose blacklist predates the index backfills the index from the keys. Until the first rebuild after
+    subscribing, and whenever the subscription is down, every check goes to Redis.
+    """
+
+    def __init__(self, capacity: int = 100_000, error_rate: float = 0.001, rebuild_seconds: float = 300.0):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.rebuild_seconds = rebuild_seconds
+        self.ready = False
+        self.synced_at: float | None = None
+        self.sync_lag = Histogram(SYNC_LAG_BUCKETS_MS)
+        self._filter = BloomFilter(capacity, error_rate)
+        self._counts = {"checks": 0, "skipped": 0, "positives": 0, "false_positives": 0}
+        self._lock = Lock()
+
+    def _record(self, name: str) -> None:
+        with self._lock:
+            self._counts[name] += 1
+
+    def might_be_revoked(self, token: str) -> bool:
+        """False only when the token is certainly not blacklisted"""
+        self._record("checks")
+        if not self.ready:
+            return True
+        if token_fingerprint(token) in self._filter:
+            self._record("positives")
+            return True
+        self._record("skipped")
+        return False
+
+    def confirm(self, revoked: bool) -> None:
+        """Report what Redis answered for a positive, to track the false-positive rate"""
+        if self.ready and not revoked:
+            self._record("false_positives")
+
+    def add(self, fingerprint: str, revoked_at: float | None = None) -> None:
+        self._filter.add(fingerprint)
+        if revoked_at is not None:
+            self.sync_lag.observe(max(0.0, (time.time() - revoked_at) * 1000))
+
+    def apply(self, message: str) -> None:
+        """Handle one message from the revocation channel"""
+        fingerprint, _, revoked_at = message.partition(" ")
+        try:
+            self.add(fingerprint, float(revoked_at) if revoked_at else None)
+        except ValueError:
+            print(f'Revocation filter: ignoring message {message!r}')
+
+    async def backfill(self, redis: Redis) -> int:
+        """Index revocations stored only as blacklist:<token> keys; runs until one
+        worker completes it. Returns how many revocations were indexed."""
+        if await redis.get(BACKFILL_KEY):
+            return 0
+        indexed, batch = 0, []
+        async for key in redis.scan_iter(match=f"{BLACKLIST_PREFIX}*", count=BACKFILL_BATCH_SIZE):
+            if key in (INDEX_KEY, BACKFILL_KEY):
+                continue
+            batch.append(key)
+            if len(batch) == BACKFILL_BATCH_SIZE:
+                indexed += await self._index_keys(redis, batch)
+                batch = []
+        if batch:
+            indexed += await self._index_keys(redis, batch)
+        await redis.set(BACKFILL_KEY, str(time.time()))
+        return indexed
+
+    async def _index_keys(self, redis: Redis, keys: list[str]) -> int:
+        async with redis.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.ttl(key)
+            ttls = await pipe.execute()
+        now = time.time()
+        # Keys without a TTL left (expired meanwhile, or -1/-2) need no entry
+        scores = {
+            token_fingerprint(key.removeprefix(BLACKLIST_PREFIX)): now + ttl
+            for key, ttl in zip(keys, ttls) if ttl > 0
+        }
+        if scores:
+            await redis.zadd(INDEX_KEY, scores)
+        return len(scores)
+
+    async def rebuild(self, redis: Redis) -> None:
+        await self.backfill(redis)
+        fingerprints = await redis.zrangebyscore(INDEX_KEY, time.time(), "+inf")
+        # Expired revocations are no longer needed, here or in the index
+        await redis.zremrangebyscore(INDEX_KEY, "-inf", time.time())
+        rebuilt = BloomFilter(max(self.capacity, 2 * len(fingerprints)), self.error_rate)
+        for fingerprint in fingerprints:
+            rebuilt.add(fingerprint)
+        self._filter = rebuilt
+        self.synced_at = time.monotonic()
+        self.ready = True
+
+    async def sync(self, redis: Redis, retry_seconds: float = 1.0) -> None:
+        """Keep the filter in sync with Redis until cancelled"""
+        while True:
+            pubsub = redis.pubsub(ignore_subscribe_messages=True)
+            try:
+                # Subscribe before loading so nothing revoked in between is missed
+                await pubsub.subscribe(REVOKED_CHANNEL)
+                await self.rebuild(redis)
+                while True:
+                    message = await pubsub.get_message(timeout=1.0)
+                    if message and message.get("type") == "message":
+                        self.apply(message["data"])
+                    if time.monotonic() - self.synced_at > self.rebuild_seconds:
+                        await self.rebuild(redis)
+            except RedisError as e:
+                print(f'Redis revocation sync error: {e}')
+            finally:
+                self.ready = False
+                await pubsub.aclose()
+            await asyncio.sleep(retry_seconds)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            counts = dict(self._counts)
+        # Of the tokens that were not revoked, how many the filter still sent to Redis
+        negatives = counts["skipped"] + counts["false_positives"]
+        counts["false_positive_rate"] = round(counts["false_positives"] / negatives, 6) if negatives else 0.0
+        counts["expected_false_positive_rate"] = round(self._filter.expected_error_rate(), 6)
+        counts["entries"] = self._filter.count
+        counts["ready"] = self.ready
+        counts["seconds_since_rebuild"] = round(time.monotonic() - self.synced_at, 3) if self.synced_at else None
+        counts["sync_lag_ms"] = self.sync_lag.snapshot()
+        return counts
+
+
+revocation_filter = RevocationFilter(
+    settings.blacklist_filter_capacity,
+    settings.blacklist_filter_error_rate,
+    settings.blacklist_filter_rebuild_seconds
+)
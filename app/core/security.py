@@ -58,6 +58,34 @@ async def verify_token(token: str):
             detail="Could not validate credentials"
         )
 
+async def verify_access_token(token: str) -> dict:
+    """Claims of a valid, unrevoked access token.
+
+    Tokens carrying a security version (`ver`) are only valid while it matches
+    the user's current version, so bumping it revokes them all at once.
+    """
+    try:
+        payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
+    except JWTError:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials"
+        )
+    user_id = payload.get("sub")
+    if user_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials"
+        )
+    
+    revoked, version = await token_storage.access_token_status(token, user_id)
+    if revoked or ("ver" in payload and payload["ver"] != version):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been revoked"
+        )
+    return payload
+
 def create_reset_token(email: str) -> str:
     expire = datetime.now(timezone.utc) + timedelta(hours=1)
     to_encode = {"sub": email, "exp": expire}
@@ -1,17 +1,21 @@
 from datetime import datetime
 from typing import Optional
 import json
+import time
 from app.infrastructure.redis import get_redis
 from app.core.config import settings
+from app.core.revocation_filter import INDEX_KEY, REVOKED_CHANNEL, revocation_filter, token_fingerprint
+
+def security_version_key(user_id: str) -> str:
+    return f"security_version:{user_id}"
 
 class TokenStorage:
-    def __init__(self):
-        self.redis = None
+    def __init__(self, redis=None):
+        # None: use the shared client, which owns the connection pool
+        self.redis = redis
     
     async def _get_redis(self):
-        if not self.redis:
-            self.redis = await get_redis()
-        return self.redis
+        return self.redis or await get_redis()
     
     async def store_refresh_token(self, user_id: str, token: str) -> None:
         """Save refresh token in Redis"""
@@ -54,13 +58,40 @@ class TokenStorage:
         # TTL until token expiration
         ttl = int((exp - datetime.utcnow()).total_seconds())
         if ttl > 0:
-            await redis_client.setex(key, ttl, "revoked")
+            fingerprint = token_fingerprint(token)
+            revocation_filter.add(fingerprint)
+            now = time.time()
+            # Index and announce the revocation for the other workers' filters
+            async with redis_client.pipeline(transaction=False) as pipe:
+                pipe.setex(key, ttl, "revoked")
+                pipe.zadd(INDEX_KEY, {fingerprint: now + ttl})
+                pipe.publish(REVOKED_CHANNEL, f"{fingerprint} {now}")
+                await pipe.execute()
     
     async def is_token_blacklisted(self, token: str) -> bool:
         """Check, token in blecklist"""
+        # Most tokens were never revoked: the local filter answers without Redis
+        if not revocation_filter.might_be_revoked(token):
+            return False
         redis_client = await self._get_redis()
         key = f"blacklist:{token}"
-        return await redis_client.exists(key)
+        revoked = bool(await redis_client.exists(key))
+        revocation_filter.confirm(revoked)
+        return revoked
+    
+    async def get_security_version(self, user_id: str) -> int:
+        """Current security version of a user; 0 until it is first bumped"""
+        redis_client = await self._get_redis()
+        return int(await redis_client.get(security_version_key(user_id)) or 0)
+    
+    async def access_token_status(self, token: str, user_id: str) -> tuple[bool, int]:
+        """Blacklist flag and the user's security version in one round trip"""
+        if not revocation_filter.might_be_revoked(token):
+            return False, await self.get_security_version(user_id)
+        redis_client = await self._get_redis()
+        revoked, version = await redis_client.mget(f"blacklist:{token}", security_version_key(user_id))
+        revocation_filter.confirm(revoked is not None)
+        return revoked is not None, int(version or 0)
     
     async def store_user_session(self, user_id: str, session_data: dict) -> None:
         """Save data session users"""
@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from uuid import UUID, uuid4
 
 @dataclass
@@ -8,18 +8,24 @@ class Appointment:
     doctor_id: UUID
     user_id: UUID
     room_id: UUID
+    duration_minutes: int = 30
     uuid: UUID = field(default_factory=uuid4)
     
     @property
     def id(self) -> UUID:
         return self.uuid
     
+    @property
+    def ends_at(self) -> datetime:
+        return self.datetime + timedelta(minutes=self.duration_minutes)
+    
     def to_dict(self) -> dict:
         return {
             "datetime": self.datetime,
             "doctor_id": str(self.doctor_id),
             "user_id": str(self.user_id),
             "room_id": str(self.room_id),
+            "duration_minutes": self.duration_minutes,
             "uuid": str(self.uuid)
         }
     
@@ -30,6 +36,7 @@ class Appointment:
             doctor_id=UUID(data["doctor_id"]),
             user_id=UUID(data["user_id"]),
             room_id=UUID(data["room_id"]),
+            duration_minutes=data.get("duration_minutes", 30),
             uuid=UUID(data["uuid"]) if "uuid" in data else uuid4()
         )
  
\ No newline at end of file
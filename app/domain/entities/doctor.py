@@ -1,5 +1,6 @@
 from uuid import UUID, uuid4
 from dataclasses import dataclass, field
+from datetime import time
 from enum import StrEnum
 
 class CategoryEnum(StrEnum):
@@ -17,7 +18,11 @@ class Doctor:
     category: CategoryEnum
     password: str
     experience_years: int = 0
+    work_start: time = time(9, 0)
+    work_end: time = time(17, 0)
     uuid: UUID = field(default_factory=uuid4)
+    # Row version, bumped by the repository on every change; 0 until stored
+    version: int = 0
     
     @property
     def id(self) -> UUID:
@@ -32,7 +37,10 @@ class Doctor:
             "category": self.category.value,
             "password": self.password,
             "experience_years": self.experience_years,
-            "uuid": str(self.uuid)
+            "work_start": self.work_start.isoformat(),
+            "work_end": self.work_end.isoformat(),
+            "uuid": str(self.uuid),
+            "version": self.version
         }
     
     @classmethod
@@ -45,6 +53,9 @@ class Doctor:
             category=CategoryEnum(data["category"]),
             password=data["password"],
             experience_years=data.get("experience_years", 0),
-            uuid=UUID(data["uuid"]) if "uuid" in data else uuid4()
+            work_start=time.fromisoformat(data.get("work_start", "09:00")),
+            work_end=time.fromisoformat(data.get("work_end", "17:00")),
+            uuid=UUID(data["uuid"]) if "uuid" in data else uuid4(),
+            version=data.get("version", 0)
         )
     
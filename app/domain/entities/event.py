@@ -0,0 +1,37 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any
+from uuid import UUID
+
+APPOINTMENT_CREATED = "appointment.created"
+APPOINTMENT_UPDATED = "appointment.updated"
+APPOINTMENT_DELETED = "appointment.deleted"
+
+
+@dataclass(frozen=True)
+class DomainEvent:
+    type: str
+    aggregate_id: UUID
+    payload: dict[str, Any]
+    occurred_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    # Outbox row id, set once the event has been stored
+    id: int | None = None
+    
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "type": self.type,
+            "aggregate_id": str(self.aggregate_id),
+            "payload": self.payload,
+            "occurred_at": self.occurred_at.isoformat()
+        }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> 'DomainEvent':
+        return cls(
+            type=data["type"],
+            aggregate_id=UUID(data["aggregate_id"]),
+            payload=data["payload"],
+            occurred_at=datetime.fromisoformat(data["occurred_at"]),
+            id=data.get("id")
+        )
@@ -60,4 +60,15 @@ class User:
             reset_token_expires=reset_token_expires,
             uuid=UUID(data["uuid"]) if "uuid" in data else uuid4()
         )
+
+
+@dataclass(frozen=True)
+class Principal:
+    """The caller as seen by authorization: built from token claims, no database row"""
+    uuid: UUID
+    role: UserRole
+    disabled: bool = False
     
+    @property
+    def id(self) -> UUID:
+        return self.uuid
@@ -1,10 +1,24 @@
 from abc import ABC, abstractmethod
 
 class PasswordHasher(ABC):
+    """Async so that slow hashes (bcrypt, argon2, pbkdf2) can run off the event loop"""
+    
     @abstractmethod
-    def hash(self, password: str) -> str:
+    async def hash(self, password: str) -> str:
         pass
     
     @abstractmethod
-    def verify(self, plain_password: str, hashed_password: str) -> bool:
-        pass
\ No newline at end of file
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        pass
+    
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """True when the hash uses a scheme or cost the hasher no longer issues"""
+        return False
+    
+    async def verify_and_update(self, plain_password: str, hashed_password: str) -> tuple[bool, str | None]:
+        """Verify a password; on success also return a new hash if the stored one is outdated"""
+        if not await self.verify(plain_password, hashed_password):
+            return False, None
+        if self.needs_rehash(hashed_password):
+            return True, await self.hash(plain_password)
+        return True, None
@@ -0,0 +1,66 @@
+import inspect
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from typing import Any, AsyncContextManager, Callable
+
+
+class UnitOfWork(ABC):
+    """Transaction boundary of a use case.
+
+    `async with unit_of_work:` commits once when the outermost block exits
+    cleanly and rolls back if it exits with an error. Nested blocks join the
+    outer transaction, so use cases can call each other without extra commits.
+    """
+
+    def __init__(self):
+        self._depth = 0
+        self._after_commit: list[Callable[[], Any]] = []
+
+    async def __aenter__(self) -> "UnitOfWork":
+        self._depth += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        self._depth -= 1
+        if self._depth == 0:
+            callbacks, self._after_commit = self._after_commit, []
+            if exc_type is None:
+                await self.commit()
+                for callback in callbacks:
+                    result = callback()
+                    if inspect.isawaitable(result):
+                        await result
+            else:
+                await self.rollback()
+        return False
+
+    def after_commit(self, callback: Callable[[], Any]) -> None:
+        """Run `callback` (sync or async) once the outermost block commits; dropped on rollback"""
+        self._after_commit.append(callback)
+
+    @abstractmethod
+    async def commit(self) -> None:
+        pass
+
+    @abstractmethod
+    async def rollback(self) -> None:
+        pass
+
+    @abstractmethod
+    def savepoint(self) -> AsyncContextManager[None]:
+        """Nested transaction that is rolled back on its own if the block fails"""
+        pass
+
+
+class NullUnitOfWork(UnitOfWork):
+    """Unit of work for repositories without transactions (in-memory, tests)"""
+
+    async def commit(self) -> None:
+        pass
+
+    async def rollback(self) -> None:
+        pass
+
+    @asynccontextmanager
+    async def savepoint(self):
+        yield
@@ -0,0 +1,216 @@
+import asyncio
+import heapq
+import time as clock
+from bisect import bisect_left
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from typing import Iterable, Iterator
+from uuid import UUID
+
+from app.domain.entities.appointment import Appointment
+from app.domain.entities.doctor import Doctor
+
+
+@dataclass(frozen=True)
+class Slot:
+    doctor_id: UUID
+    room_id: UUID
+    start: datetime
+    end: datetime
+
+
+@dataclass(frozen=True)
+class DoctorSchedule:
+    doctor_id: UUID
+    work_start: time
+    work_end: time
+
+
+class IntervalSet:
+    """Busy [start, end) intervals of one doctor or room, sorted by start."""
+
+    __slots__ = ("starts", "ends", "ids", "longest")
+
+    def __init__(self):
+        self.starts: list[datetime] = []
+        self.ends: list[datetime] = []
+        self.ids: list[UUID] = []
+        self.longest = timedelta(0)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def add(self, start: datetime, end: datetime, interval_id: UUID) -> None:
+        index = bisect_left(self.starts, start)
+        self.starts.insert(index, start)
+        self.ends.insert(index, end)
+        self.ids.insert(index, interval_id)
+        self.longest = max(self.longest, end - start)
+
+    def remove(self, start: datetime, interval_id: UUID) -> None:
+        index = bisect_left(self.starts, start)
+        while index < len(self.starts) and self.starts[index] == start:
+            if self.ids[index] == interval_id:
+                del self.starts[index], self.ends[index], self.ids[index]
+                return
+            index += 1
+
+    def busy(self, start: datetime, end: datetime) -> Iterator[tuple[datetime, datetime]]:
+        """Intervals overlapping [start, end), in start order"""
+        # Nothing starting earlier than `start - longest` can still be running at `start`
+        index = bisect_left(self.starts, start - self.longest)
+        while index < len(self.starts) and self.starts[index] < end:
+            if self.ends[index] > start:
+                yield self.starts[index], self.ends[index]
+            index += 1
+
+    def is_free(self, start: datetime, end: datetime) -> bool:
+        # Same scan as busy() without the generator: this is the hot path of room lookups
+        starts, ends = self.starts, self.ends
+        index = bisect_left(starts, start - self.longest)
+        while index < len(starts) and starts[index] < end:
+            if ends[index] > start:
+                return False
+            index += 1
+        return True
+
+    def gaps(self, start: datetime, end: datetime) -> Iterator[tuple[datetime, datetime]]:
+        cursor = start
+        for busy_start, busy_end in self.busy(start, end):
+            if busy_start > cursor:
+                yield cursor, busy_start
+            cursor = max(cursor, busy_end)
+        if cursor < end:
+            yield cursor, end
+
+
+EMPTY = IntervalSet()
+
+# Bounds the room lookup cache between writes
+ROOM_CACHE_LIMIT = 100_000
+
+
+class SlotIndex:
+    """In-memory index of doctor and room bookings for free-slot search.
+
+    Built from the database by a background refresh task and kept current by
+    the appointment use cases after each commit. Each worker process holds its
+    own copy, so it is also rebuilt periodically to pick up other workers'
+    writes; a stale slot is still rejected by the database when booked.
+    """
+
+    def __init__(self, step_minutes: int = 15):
+        self.step = timedelta(minutes=step_minutes)
+        self.lock = asyncio.Lock()
+        self.loaded_at: float | None = None
+        self._clear()
+
+    def _clear(self) -> None:
+        self.doctors: dict[UUID, DoctorSchedule] = {}
+        self.by_specialization: dict[str, list[UUID]] = defaultdict(list)
+        self.rooms: list[UUID] = []
+        self.doctor_busy: dict[UUID, IntervalSet] = defaultdict(IntervalSet)
+        self.room_busy: dict[UUID, IntervalSet] = defaultdict(IntervalSet)
+        self.appointments: dict[UUID, Appointment] = {}
+        # (start, end) -> first free room; valid until the next write
+        self._room_cache: dict[tuple[datetime, datetime], UUID | None] = {}
+
+    def is_stale(self, max_age_seconds: float) -> bool:
+        return self.loaded_at is None or clock.monotonic() - self.loaded_at > max_age_seconds
+
+    def load(self, doctors: Iterable[Doctor], room_ids: Iterable[UUID], appointments: Iterable[Appointment]) -> None:
+        self._clear()
+        for doctor in doctors:
+            self.doctors[doctor.id] = DoctorSchedule(doctor.id, doctor.work_start, doctor.work_end)
+            self.by_specialization[doctor.specialization.casefold()].append(doctor.id)
+        self.rooms = sorted(room_ids)
+        for room_id in self.rooms:
+            self.room_busy[room_id]
+        self.add_many(appointments)
+        self.loaded_at = clock.monotonic()
+
+    def add(self, appointment: Appointment) -> None:
+        if appointment.id in self.appointments:
+            return
+        self.appointments[appointment.id] = appointment
+        self._room_cache.clear()
+        self.doctor_busy[appointment.doctor_id].add(appointment.datetime, appointment.ends_at, appointment.id)
+        self.room_busy[appointment.room_id].add(appointment.datetime, appointment.ends_at, appointment.id)
+
+    def add_many(self, appointments: Iterable[Appointment]) -> None:
+        for appointment in appointments:
+            self.add(appointment)
+
+    def remove(self, appointment_id: UUID) -> None:
+        appointment = self.appointments.pop(appointment_id, None)
+        if appointment is None:
+            return
+        self._room_cache.clear()
+        self.doctor_busy[appointment.doctor_id].remove(appointment.datetime, appointment_id)
+        self.room_busy[appointment.room_id].remove(appointment.datetime, appointment_id)
+
+    def find(
+        self,
+        specialization: str,
+        window_start: datetime,
+        window_end: datetime,
+        duration: timedelta,
+        limit: int = 10
+    ) -> list[Slot]:
+        """Earliest (doctor, room, start) combinations free for `duration` inside the window"""
+        candidates = [
+            self._doctor_starts(self.doctors[doctor_id], position, window_start, window_end, duration)
+            for position, doctor_id in enumerate(self.by_specialization.get(specialization.casefold(), ()))
+        ]
+
+        slots: list[Slot] = []
+        # Lazy k-way merge: stops as soon as `limit` slots are found
+        for start, _, doctor_id in heapq.merge(*candidates):
+            end = start + duration
+            if (room_id := self._free_room(start, end)) is None:
+                continue
+            slots.append(Slot(doctor_id, room_id, start, end))
+            if len(slots) >= limit:
+                break
+        return slots
+
+    def _free_room(self, start: datetime, end: datetime) -> UUID | None:
+        # Doctors share the slot grid, so most lookups repeat within and across searches
+        key = (start, end)
+        if key in self._room_cache:
+            return self._room_cache[key]
+        if len(self._room_cache) >= ROOM_CACHE_LIMIT:
+            self._room_cache.clear()
+
+        room_busy = self.room_busy
+        free = next((room_id for room_id in self.rooms if room_busy[room_id].is_free(start, end)), None)
+        self._room_cache[key] = free
+        return free
+
+    def _doctor_starts(
+        self,
+        schedule: DoctorSchedule,
+        position: int,
+        window_start: datetime,
+        window_end: datetime,
+        duration: timedelta
+    ) -> Iterator[tuple[datetime, int, UUID]]:
+        # `position` breaks ties between doctors without comparing UUIDs in the heap
+        busy = self.doctor_busy.get(schedule.doctor_id, EMPTY)
+        day: date = window_start.date()
+        while day <= window_end.date():
+            shift_start = max(datetime.combine(day, schedule.work_start), window_start)
+            shift_end = min(datetime.combine(day, schedule.work_end), window_end)
+            for gap_start, gap_end in busy.gaps(shift_start, shift_end) if shift_start < shift_end else ():
+                start = self._align(gap_start)
+                while start + duration <= gap_end:
+                    yield start, position, schedule.doctor_id
+                    start += self.step
+            day += timedelta(days=1)
+
+    def _align(self, moment: datetime) -> datetime:
+        """Round up to the slot grid, counted from midnight"""
+        midnight = datetime.combine(moment.date(), time(0), tzinfo=moment.tzinfo)
+        remainder = (moment - midnight) % self.step
+        return moment + (self.step - remainder) if remainder else moment
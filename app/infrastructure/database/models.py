@@ -1,8 +1,9 @@
 import uuid
-from datetime import date as DateType, datetime
+from datetime import date as DateType, datetime, time
 from enum import StrEnum
 
-from sqlalchemy import UUID, Boolean, Date, DateTime, ForeignKey, String
+from sqlalchemy import UUID, BigInteger, Boolean, Date, DateTime, ForeignKey, Identity, Index, String, func, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncAttrs
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
@@ -26,6 +27,15 @@ class UserRole(StrEnum):
 class DoctorORM(Base):
     """Doctor database model representing medical professionals."""
     __tablename__ = "doctors"
+    __table_args__ = (
+        # Directory filters and sorts of GET /doctors (surname is indexed by its unique constraint)
+        Index("ix_doctors_specialization_surname_id", text("lower(specialization)"), "surname", "id"),
+        Index("ix_doctors_category_surname_id", "category", "surname", "id"),
+        Index("ix_doctors_experience_years_id", "experience_years", "id"),
+        Index("ix_doctors_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+        Index("ix_doctors_surname_trgm", "surname", postgresql_using="gin", postgresql_ops={"surname": "gin_trgm_ops"}),
+        Index("ix_doctors_version", "version"),
+    )
 
     id: Mapped[UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name: Mapped[str]
@@ -35,6 +45,11 @@ class DoctorORM(Base):
     category: Mapped[CategoryEnum]
     password: Mapped[str]
     experience_years: Mapped[int] = mapped_column(default=0)
+    work_start: Mapped[time] = mapped_column(default=time(9, 0), server_default="09:00")
+    work_end: Mapped[time] = mapped_column(default=time(17, 0), server_default="17:00")
+    # New value from doctors_version_seq on every insert and update (migration 0006)
+    version: Mapped[int] = mapped_column(BigInteger, server_default=text("nextval('doctors_version_seq')"))
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     appointments: Mapped[list["AppointmentORM"]] = relationship(back_populates="doctor")
 
@@ -61,8 +76,14 @@ class UserORM(Base):
 class RoomORM(Base):
     """ ORM model representing a room in the database."""
     __tablename__ = "rooms"
+    __table_args__ = (
+        Index("ix_rooms_number_id", "number", "id"),
+        Index("ix_rooms_version", "version"),
+    )
     id: Mapped[UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     number: Mapped[int]
+    version: Mapped[int] = mapped_column(BigInteger, server_default=text("nextval('rooms_version_seq')"))
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     appointments: Mapped[list["AppointmentORM"]] = relationship(back_populates="room")
 
@@ -70,11 +91,31 @@ class RoomORM(Base):
 class AppointmentORM(Base):
     """ORM model representing an appointment in the database."""
     __tablename__ = "appointments"
+    __table_args__ = (
+        Index("ix_appointments_doctor_id_datetime", "doctor_id", "datetime"),
+        Index("ix_appointments_room_id_datetime", "room_id", "datetime"),
+        Index("ix_appointments_user_id_datetime", "user_id", "datetime"),
+        Index("ix_appointments_datetime_id", "datetime", "id"),
+    )
     id: Mapped[UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     datetime: Mapped[datetime] = mapped_column(DateTime)
+    # [datetime, datetime + duration) may not overlap for one doctor or one room:
+    # enforced by the exclusion constraints created in migration 0002
+    duration_minutes: Mapped[int] = mapped_column(default=30, server_default="30")
     doctor_id: Mapped[UUID] = mapped_column(ForeignKey('doctors.id', ondelete="CASCADE"))
     doctor: Mapped["DoctorORM"] = relationship(back_populates="appointments")
     user_id: Mapped[UUID] = mapped_column(ForeignKey('users.id', ondelete="CASCADE"))
     user: Mapped["UserORM"] = relationship(back_populates="appointments")
     room_id: Mapped[UUID] = mapped_column(ForeignKey('rooms.id', ondelete="CASCADE"))
     room: Mapped["RoomORM"] = relationship(back_populates="appointments")
+
+
+class OutboxEventORM(Base):
+    """Domain event written in the same transaction as the change it describes."""
+    __tablename__ = "outbox_events"
+    # Rows are deleted once dispatched, so the primary key alone orders the backlog
+    id: Mapped[int] = mapped_column(BigInteger, Identity(), primary_key=True)
+    event_type: Mapped[str]
+    aggregate_id: Mapped[UUID] = mapped_column(UUID(as_uuid=True))
+    payload: Mapped[dict] = mapped_column(JSONB)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
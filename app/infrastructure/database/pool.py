@@ -0,0 +1,86 @@
+import time
+from threading import Lock
+
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool
+
+from app.core.metrics import Histogram
+
+
+class PoolStatistics:
+    """Checkout telemetry collected by an instrumented connection pool."""
+
+    def __init__(self):
+        self.checkout_wait_ms = Histogram()
+        self.checkouts = 0
+        self.checkout_timeouts = 0
+        self._lock = Lock()
+
+    def record_checkout(self, wait_ms: float) -> None:
+        self.checkout_wait_ms.observe(wait_ms)
+        with self._lock:
+            self.checkouts += 1
+
+    def record_timeout(self, wait_ms: float) -> None:
+        self.checkout_wait_ms.observe(wait_ms)
+        with self._lock:
+            self.checkout_timeouts += 1
+
+
+class InstrumentedPoolMixin:
+    """Times every pool checkout and counts checkouts that hit `pool_timeout`.
+
+    Must be mixed in front of a `QueuePool` subclass.
+    """
+
+    statistics: PoolStatistics
+
+    def __init__(self, *args, statistics: PoolStatistics | None = None, **kwargs):
+        self.statistics = statistics or PoolStatistics()
+        super().__init__(*args, **kwargs)
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.statistics.record_timeout((time.perf_counter() - start) * 1000)
+            raise
+        self.statistics.record_checkout((time.perf_counter() - start) * 1000)
+        return connection
+
+    def recreate(self):
+        # Keep counters across engine.dispose()/invalidation
+        pool = super().recreate()
+        pool.statistics = self.statistics
+        return pool
+
+
+class InstrumentedAsyncAdaptedQueuePool(InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def pool_status(pool: Pool) -> dict:
+    """Live snapshot of a queue pool: sizing, usage and checkout telemetry."""
+    status = {
+        "pool_class": type(pool).__name__,
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": max(pool.overflow(), 0),
+        "timeout_seconds": pool.timeout(),
+    }
+
+    statistics = getattr(pool, "statistics", None)
+    if statistics is not None:
+        status.update({
+            "checkouts": statistics.checkouts,
+            "checkout_timeouts": statistics.checkout_timeouts,
+            "checkout_wait_ms": statistics.checkout_wait_ms.snapshot(),
+        })
+    return status
+
+
+def engine_pool_status(engine: AsyncEngine) -> dict:
+    return pool_status(engine.sync_engine.pool)
@@ -1,20 +1,44 @@
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from typing import AsyncGenerator
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
+from app.infrastructure.database.pool import InstrumentedAsyncAdaptedQueuePool
+from app.infrastructure.database.routing import RoutingSession
+
+
+def _create_engine(url: str) -> AsyncEngine:
+    return create_async_engine(
+        url,
+        echo=settings.db_echo,
+        future=True,
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        connect_args={"statement_cache_size": settings.db_statement_cache_size},
+    )
 
-engine = create_async_engine(
-    settings.database_url,
-    echo=True,  # Logging SQL queries
-    future=True
-)
+
+engine = _create_engine(settings.database_url)
+
+# Read-only replicas; empty means every statement goes to the primary
+replica_engines = [_create_engine(url) for url in settings.database_replica_urls]
 
 AsyncSessionLocal = sessionmaker(
-    engine,
     class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    primary=engine.sync_engine,
+    replicas=[replica.sync_engine for replica in replica_engines],
     expire_on_commit=False
 )
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with AsyncSessionLocal() as session:
         yield session
+
+async def dispose_engines() -> None:
+    await engine.dispose()
+    for replica in replica_engines:
+        await replica.dispose()
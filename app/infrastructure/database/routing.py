@@ -0,0 +1,44 @@
+import random
+from contextvars import ContextVar
+from typing import Any, Sequence
+
+from sqlalchemy import Engine
+from sqlalchemy.orm import Session
+
+# Set per request by the read-your-writes middleware
+use_primary: ContextVar[bool] = ContextVar("use_primary", default=False)
+
+
+def _is_plain_select(clause: Any) -> bool:
+    if clause is None or not getattr(clause, "is_select", False):
+        return False
+    # SELECT ... FOR UPDATE must run where the write will happen
+    return getattr(clause, "_for_update_arg", None) is None
+
+
+class RoutingSession(Session):
+    """Sends plain SELECTs to a replica and everything else to the primary.
+
+    Once a session has written (or is pinned through `use_primary`), all of
+    its statements go to the primary so it always reads its own writes.
+    """
+
+    def __init__(self, *, primary: Engine, replicas: Sequence[Engine] = (), **kwargs: Any):
+        super().__init__(**kwargs)
+        self.primary = primary
+        # One replica per session keeps its reads on a single snapshot
+        self.replica = random.choice(replicas) if replicas else None
+
+    def get_bind(self, mapper=None, clause=None, **kwargs: Any) -> Engine:
+        if (
+            self.replica is not None
+            and not self._flushing
+            and not self.info.get("wrote")
+            and not use_primary.get()
+            and _is_plain_select(clause)
+        ):
+            return self.replica
+
+        if self._flushing or not _is_plain_select(clause):
+            self.info["wrote"] = True
+        return self.primary
@@ -0,0 +1,39 @@
+from pathlib import Path
+
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+ALEMBIC_INI = Path(__file__).resolve().parents[3] / "alembic.ini"
+
+
+class SchemaOutOfDateError(RuntimeError):
+    def __init__(self, current: set[str], expected: set[str]):
+        self.current = current
+        self.expected = expected
+        super().__init__(
+            f"Database schema is at revision {sorted(current) or 'none'}, "
+            f"expected {sorted(expected)}. Run `alembic upgrade head`."
+        )
+
+
+def expected_revisions() -> set[str]:
+    script = ScriptDirectory.from_config(Config(str(ALEMBIC_INI)))
+    return set(script.get_heads())
+
+
+async def check_schema_revision(engine: AsyncEngine) -> str:
+    """Fail fast if the database is not migrated to the code's head revision.
+
+    Only reads `alembic_version`: startup never runs DDL or takes schema locks.
+    """
+    async with engine.connect() as connection:
+        current = await connection.run_sync(
+            lambda sync_connection: set(MigrationContext.configure(sync_connection).get_current_heads())
+        )
+
+    expected = expected_revisions()
+    if current != expected:
+        raise SchemaOutOfDateError(current, expected)
+    return ", ".join(sorted(current))
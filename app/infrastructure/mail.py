@@ -0,0 +1,182 @@
+import asyncio
+from dataclasses import dataclass
+from email.message import EmailMessage
+from threading import Lock
+
+import aiosmtplib
+
+from app.core.config import settings
+
+
+@dataclass
+class OutgoingMail:
+    to: str
+    subject: str
+    body: str
+    attempts: int = 0
+
+    def to_message(self, sender: str) -> EmailMessage:
+        message = EmailMessage()
+        message["From"] = sender
+        message["To"] = self.to
+        message["Subject"] = self.subject
+        message.set_content(self.body)
+        return message
+
+
+class MailSender:
+    """Background SMTP sender fed by an in-memory queue.
+
+    `enqueue` returns at once; `run` keeps one authenticated connection open
+    while there is mail, sends whatever is queued in batches of up to
+    `batch_size` and retries failed messages with exponential backoff.
+    Mail still queued when the process stops is lost.
+    """
+
+    def __init__(
+        self,
+        hostname: str,
+        port: int,
+        sender: str,
+        username: str = "",
+        password: str = "",
+        start_tls: bool | None = None,
+        timeout: float = 10.0,
+        queue_size: int = 1000,
+        batch_size: int = 50,
+        max_attempts: int = 5,
+        backoff_seconds: float = 1.0,
+        idle_seconds: float = 30.0
+    ):
+        self.hostname = hostname
+        self.port = port
+        self.sender = sender
+        self.username = username
+        self.password = password
+        self.start_tls = start_tls
+        self.timeout = timeout
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.backoff_seconds = backoff_seconds
+        self.idle_seconds = idle_seconds
+        self.queue: asyncio.Queue[OutgoingMail] = asyncio.Queue(queue_size)
+        self._client: aiosmtplib.SMTP | None = None
+        self._retries: set[asyncio.Task] = set()
+        self._counts = {"queued": 0, "sent": 0, "retried": 0, "failed": 0, "dropped": 0, "batches": 0, "connects": 0}
+        self._lock = Lock()
+
+    def _record(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counts[name] += amount
+
+    def enqueue(self, mail: OutgoingMail) -> bool:
+        try:
+            self.queue.put_nowait(mail)
+        except asyncio.QueueFull:
+            self._record("dropped")
+            print(f'Mail queue full, dropping message to {mail.to}')
+            return False
+        self._record("queued")
+        return True
+
+    async def run(self) -> None:
+        """Send queued mail until cancelled"""
+        try:
+            while True:
+                try:
+                    first = await asyncio.wait_for(self.queue.get(), self.idle_seconds)
+                except asyncio.TimeoutError:
+                    # Do not hold a server connection while there is nothing to send
+                    await self._disconnect()
+                    continue
+                batch = [first]
+                while len(batch) < self.batch_size and not self.queue.empty():
+                    batch.append(self.queue.get_nowait())
+                await self.send_batch(batch)
+        finally:
+            for task in list(self._retries):
+                task.cancel()
+            await self._disconnect()
+
+    async def send_batch(self, batch: list[OutgoingMail]) -> None:
+        self._record("batches")
+        for mail in batch:
+            try:
+                client = await self._connection()
+                await client.send_message(mail.to_message(self.sender))
+                self._record("sent")
+            except (aiosmtplib.SMTPRecipientsRefused, aiosmtplib.SMTPSenderRefused) as e:
+                # The server will never accept this message
+                self._record("failed")
+                print(f'Mail to {mail.to} rejected: {e}')
+            except (aiosmtplib.SMTPException, OSError) as e:
+                await self._disconnect()
+                self._retry(mail, e)
+
+    def _retry(self, mail: OutgoingMail, error: Exception) -> None:
+        mail.attempts += 1
+        if mail.attempts >= self.max_attempts:
+            self._record("failed")
+            print(f'Giving up on mail to {mail.to} after {mail.attempts} attempts: {error}')
+            return
+        self._record("retried")
+        delay = self.backoff_seconds * 2 ** (mail.attempts - 1)
+        task = asyncio.create_task(self._requeue(mail, delay))
+        self._retries.add(task)
+        task.add_done_callback(self._retries.discard)
+
+    async def _requeue(self, mail: OutgoingMail, delay: float) -> None:
+        await asyncio.sleep(delay)
+        await self.queue.put(mail)
+
+    async def _connection(self) -> aiosmtplib.SMTP:
+        if self._client is None or not self._client.is_connected:
+            client = aiosmtplib.SMTP(
+                hostname=self.hostname,
+                port=self.port,
+                username=self.username or None,
+                password=self.password or None,
+                start_tls=self.start_tls,
+                timeout=self.timeout,
+            )
+            await client.connect()
+            self._record("connects")
+            self._client = client
+        return self._client
+
+    async def _disconnect(self) -> None:
+        client, self._client = self._client, None
+        if client is not None and client.is_connected:
+            try:
+                await client.quit()
+            except (aiosmtplib.SMTPException, OSError):
+                client.close()
+
+    async def drain(self, timeout: float) -> None:
+        """Wait up to `timeout` for the queue to empty, e.g. before shutdown"""
+        deadline = asyncio.get_running_loop().time() + timeout
+        while not self.queue.empty() and asyncio.get_running_loop().time() < deadline:
+            await asyncio.sleep(0.05)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            counts = dict(self._counts)
+        counts["pending"] = self.queue.qsize()
+        counts["retrying"] = len(self._retries)
+        counts["connected"] = self._client is not None and self._client.is_connected
+        return counts
+
+
+mail_sender = MailSender(
+    settings.smtp_server,
+    settings.smtp_port,
+    settings.from_email,
+    settings.smtp_username,
+    settings.smtp_password,
+    start_tls=settings.smtp_start_tls,
+    timeout=settings.smtp_timeout_seconds,
+    queue_size=settings.mail_queue_size,
+    batch_size=settings.mail_batch_size,
+    max_attempts=settings.mail_max_attempts,
+    backoff_seconds=settings.mail_backoff_seconds
+)
@@ -0,0 +1,142 @@
+import asyncio
+import inspect
+import json
+from threading import Lock
+from typing import Awaitable, Callable
+
+from redis.asyncio import Redis
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.metrics import Histogram
+from app.domain.entities.event import DomainEvent
+from app.infrastructure.database.models import OutboxEventORM
+from app.infrastructure.database.postgres import AsyncSessionLocal
+
+EventHandler = Callable[[DomainEvent], Awaitable[None] | None]
+
+# Time from the commit that wrote an event to its dispatch, in milliseconds
+DISPATCH_LAG_BUCKETS_MS = (5, 10, 50, 100, 250, 500, 1000, 5000, 30000)
+
+
+class OutboxDispatcher:
+    """Publishes events from the `outbox_events` table, oldest first.
+
+    Each batch is locked with FOR UPDATE SKIP LOCKED, so dispatchers in several
+    workers share the backlog without blocking each other. Events go to the Redis
+    channel first (all workers, other services) and then to the handlers
+    subscribed in this process; the rows are deleted in the same transaction.
+    Delivery is at least once: if publishing fails or the worker dies before the
+    commit, the batch is sent again.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        redis: Redis | None = None,
+        channel: str = "domain:events",
+        batch_size: int = 100,
+        poll_seconds: float = 0.5
+    ):
+        self.session_factory = session_factory
+        self.redis = redis
+        self.channel = channel
+        self.batch_size = batch_size
+        self.poll_seconds = poll_seconds
+        self.lag = Histogram(DISPATCH_LAG_BUCKETS_MS)
+        self._handlers: list[EventHandler] = []
+        self._counts = {"dispatched": 0, "batches": 0, "errors": 0, "handler_errors": 0}
+        self._lock = Lock()
+
+    def _record(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counts[name] += amount
+
+    def subscribe(self, handler: EventHandler) -> None:
+        """Call `handler` (sync or async) for every event this worker dispatches"""
+        self._handlers.append(handler)
+
+    async def dispatch_batch(self) -> int:
+        """Publish and delete up to `batch_size` pending events; returns how many"""
+        table = OutboxEventORM.__table__
+        query = (
+            select(table, func.extract("epoch", func.clock_timestamp() - table.c.created_at).label("lag"))
+            .order_by(table.c.id)
+            .limit(self.batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        async with self.session_factory() as session:
+            async with session.begin():
+                result = await session.execute(query)
+                rows = result.all()
+                if not rows:
+                    return 0
+
+                events = [self._to_event(row) for row in rows]
+                await self._publish(events)
+                await session.execute(delete(table).where(table.c.id.in_([event.id for event in events])))
+
+        self._record("batches")
+        self._record("dispatched", len(rows))
+        for row in rows:
+            self.lag.observe(max(0.0, float(row.lag) * 1000))
+        return len(rows)
+
+    async def _publish(self, events: list[DomainEvent]) -> None:
+        if self.redis is not None:
+            # A Redis failure aborts the batch; the rows stay locked until rollback
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for event in events:
+                    pipe.publish(self.channel, json.dumps(event.to_dict()))
+                await pipe.execute()
+
+        # A failing subscriber must not hold back everybody else's events
+        for event in events:
+            for handler in self._handlers:
+                try:
+                    result = handler(event)
+                    if inspect.isawaitable(result):
+                        await result
+                except Exception as e:
+                    self._record("handler_errors")
+                    print(f'Outbox handler error for event {event.id}: {e}')
+
+    async def run(self, retry_seconds: float = 1.0) -> None:
+        """Drain the outbox until cancelled"""
+        while True:
+            try:
+                dispatched = await self.dispatch_batch()
+            except Exception as e:
+                self._record("errors")
+                print(f'Outbox dispatch error: {e}')
+                await asyncio.sleep(retry_seconds)
+                continue
+            # A full batch means there is probably more waiting
+            if dispatched < self.batch_size:
+                await asyncio.sleep(self.poll_seconds)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            counts = dict(self._counts)
+        counts["subscribers"] = len(self._handlers)
+        counts["redis_channel"] = self.channel if self.redis is not None else None
+        counts["lag_ms"] = self.lag.snapshot()
+        return counts
+
+    def _to_event(self, row) -> DomainEvent:
+        return DomainEvent(
+            type=row.event_type,
+            aggregate_id=row.aggregate_id,
+            payload=row.payload,
+            occurred_at=row.created_at,
+            id=row.id
+        )
+
+
+outbox_dispatcher = OutboxDispatcher(
+    AsyncSessionLocal,
+    channel=settings.outbox_redis_channel,
+    batch_size=settings.outbox_batch_size,
+    poll_seconds=settings.outbox_poll_seconds
+)
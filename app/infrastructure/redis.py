@@ -1,16 +1,148 @@
+import asyncio
+import time
+from threading import Lock
+
 import redis.asyncio as redis
+from redis.asyncio.client import Pipeline
+from redis.asyncio.connection import BlockingConnectionPool
+from redis.asyncio.retry import Retry
+from redis.backoff import ExponentialBackoff
+from redis.exceptions import ConnectionError
+
 from app.core.config import settings
+from app.core.metrics import Histogram
 
 redis_client = None
 
+
+class RedisStatistics:
+    """Per-command latency and pool wait telemetry of the shared Redis client."""
+
+    def __init__(self):
+        self.commands: dict[str, Histogram] = {}
+        self.checkout_wait_ms = Histogram()
+        self.checkout_timeouts = 0
+        self.errors = 0
+        self._lock = Lock()
+
+    def record_command(self, name: str, elapsed_ms: float, failed: bool = False) -> None:
+        histogram = self.commands.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = self.commands.setdefault(name, Histogram())
+        histogram.observe(elapsed_ms)
+        if failed:
+            with self._lock:
+                self.errors += 1
+
+    def record_checkout(self, wait_ms: float, timed_out: bool = False) -> None:
+        self.checkout_wait_ms.observe(wait_ms)
+        if timed_out:
+            with self._lock:
+                self.checkout_timeouts += 1
+
+    def snapshot(self) -> dict:
+        return {
+            "errors": self.errors,
+            "checkout_timeouts": self.checkout_timeouts,
+            "checkout_wait_ms": self.checkout_wait_ms.snapshot(),
+            "commands": {name: histogram.snapshot() for name, histogram in sorted(self.commands.items())},
+        }
+
+
+statistics = RedisStatistics()
+
+
+class InstrumentedConnectionPool(BlockingConnectionPool):
+    """Waits up to `timeout` for a free connection instead of failing, and times the wait"""
+
+    async def get_connection(self, command_name, *keys, **options):
+        start = time.perf_counter()
+        try:
+            connection = await super().get_connection(command_name, *keys, **options)
+        except ConnectionError as e:
+            # Either the pool stayed exhausted for `timeout` or connecting failed
+            timed_out = isinstance(e.__cause__, asyncio.TimeoutError)
+            statistics.record_checkout((time.perf_counter() - start) * 1000, timed_out)
+            raise
+        statistics.record_checkout((time.perf_counter() - start) * 1000)
+        return connection
+
+
+class InstrumentedPipeline(Pipeline):
+    async def execute(self, raise_on_error: bool = True):
+        start = time.perf_counter()
+        failed = True
+        try:
+            result = await super().execute(raise_on_error)
+            failed = False
+            return result
+        finally:
+            statistics.record_command("PIPELINE", (time.perf_counter() - start) * 1000, failed)
+
+
+class InstrumentedRedis(redis.Redis):
+    """Redis client that records the latency of every command"""
+
+    async def execute_command(self, *args, **options):
+        start = time.perf_counter()
+        failed = True
+        try:
+            result = await super().execute_command(*args, **options)
+            failed = False
+            return result
+        finally:
+            statistics.record_command(str(args[0]).upper(), (time.perf_counter() - start) * 1000, failed)
+
+    def pipeline(self, transaction: bool = True, shard_hint=None) -> InstrumentedPipeline:
+        return InstrumentedPipeline(self.connection_pool, self.response_callbacks, transaction, shard_hint)
+
+
+def create_redis() -> InstrumentedRedis:
+    pool = InstrumentedConnectionPool.from_url(
+        settings.redis_url,
+        decode_responses=True,
+        max_connections=settings.redis_max_connections,
+        timeout=settings.redis_pool_timeout,
+        socket_timeout=settings.redis_socket_timeout,
+        socket_connect_timeout=settings.redis_socket_connect_timeout,
+        health_check_interval=settings.redis_health_check_interval,
+        retry_on_timeout=True,
+        retry=Retry(ExponentialBackoff(cap=1.0), settings.redis_retry_attempts),
+    )
+    return InstrumentedRedis(connection_pool=pool)
+
+
+async def init_redis():
+    """Build the shared client at startup; `get_redis` falls back to it lazily"""
+    return await get_redis()
+
+
 async def get_redis():
     global redis_client
+    # No await between the check and the assignment, so concurrent callers share one client
     if redis_client is None:
-        redis_client = redis.from_url(settings.redis_url, decode_responses=True)
+        redis_client = create_redis()
     return redis_client
 
+
 async def close_redis():
     global redis_client
     if redis_client:
-        await redis_client.close()
-        redis_client = None
\ No newline at end of file
+        client, redis_client = redis_client, None
+        await client.aclose()
+        await client.connection_pool.disconnect()
+
+
+def redis_status() -> dict:
+    """Pool sizing, usage and command telemetry of the shared client"""
+    status = {"connected": redis_client is not None}
+    if redis_client is not None:
+        pool = redis_client.connection_pool
+        status.update({
+            "max_connections": pool.max_connections,
+            "in_use": len(pool._in_use_connections),
+            "idle": len(pool._available_connections),
+        })
+    status.update(statistics.snapshot())
+    return status
@@ -1,14 +1,27 @@
+import asyncio
 from fastapi import FastAPI
-from contextlib import asynccontextmanager
-from app.infrastructure.database.postgres import engine
-from app.infrastructure.database.models import Base
-from app.infrastructure.redis import close_redis
+from contextlib import asynccontextmanager, suppress
+from app.infrastructure.database.postgres import engine, replica_engines, dispose_engines
+from app.infrastructure.database.pool import engine_pool_status
+from app.infrastructure.database.schema import check_schema_revision
+from app.infrastructure.redis import close_redis, get_redis, init_redis, redis_status
+from app.adapters.cached_doctor_repository import statistics as doctor_cache_statistics
+from app.core.principal_cache import PrincipalInvalidator, principal_cache, statistics as principal_cache_statistics
+from app.core.revocation_filter import revocation_filter
+from app.api.dependencies import keep_slot_index_fresh, password_hasher
+from app.infrastructure.mail import mail_sender
+from app.infrastructure.outbox import outbox_dispatcher
+from app.api.broadcast_bus import broadcast_bus
+from app.core.config import settings
 from app.api.routers.doctors import router as doctors_router
 from app.api.routers.users import router as users_router
 from app.api.routers.appoointments import router as appointments_router
 from app.api.routers.auth import router as auth_router
 from app.api.routers.rooms import router as rooms_router
 from app.api.routers.websocket import router as websocket_router
+from app.api.routers.imports import router as imports_router
+from app.api.routers.slots import router as slots_router
+from app.api.middleware import commit_count_middleware, read_your_writes_middleware
 
 from app.use_cases.exceptions import DomainException
 import logging
@@ -23,30 +36,64 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting up Medical App")
     
-    # Create database tables
+    # Schema changes are applied by `alembic upgrade head`, not by the app
     try:
-        async with engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
-        logger.info("Database tables created successfully")
+        revision = await check_schema_revision(engine)
+        logger.info(f"Database schema is at revision {revision}")
     except Exception as e:
-        logger.error(f"Failed to create database tables: {e}")
+        logger.error(f"Database schema check failed: {e}")
         raise
     
+    await init_redis()
+    
+    # Other workers publish role/disabled changes of cached users
+    invalidation_listener = asyncio.create_task(
+        PrincipalInvalidator(principal_cache, await get_redis()).listen()
+    )
+    # Keeps the local filter of revoked tokens current
+    revocation_sync = asyncio.create_task(revocation_filter.sync(await get_redis()))
+    # Emails are queued by requests and delivered here
+    mail_delivery = asyncio.create_task(mail_sender.run())
+    # WebSocket broadcasts published by other workers
+    broadcast_relay = asyncio.create_task(broadcast_bus.listen())
+    # Free-slot search reads an index this task loads and rebuilds
+    slot_index_refresh = asyncio.create_task(keep_slot_index_fresh())
+    background_tasks = [invalidation_listener, revocation_sync, mail_delivery, broadcast_relay, slot_index_refresh]
+    # Publishes appointment events committed to the outbox
+    if settings.outbox_dispatch_enabled:
+        if settings.outbox_redis_channel:
+            outbox_dispatcher.redis = await get_redis()
+        else:
+            # No events channel for the relay: push schedule changes from this worker only
+            outbox_dispatcher.subscribe(broadcast_bus.deliver_event)
+        background_tasks.append(asyncio.create_task(outbox_dispatcher.run()))
+    
     yield  
     
     # Shutdown
     logger.info("Shutting down Medical App")
-    await engine.dispose()
+    await mail_sender.drain(timeout=5.0)
+    for task in background_tasks:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+    await dispose_engines()
     await close_redis()
+    password_hasher.close()
 
 app = FastAPI(title="Medical App", version="1.0.0", lifespan=lifespan)
 
+app.middleware("http")(read_your_writes_middleware)
+app.middleware("http")(commit_count_middleware)
+
 app.include_router(auth_router, prefix="/api/v1/auth", tags=["auth"])
 app.include_router(doctors_router, prefix="/api/v1", tags=["doctors"])
 app.include_router(users_router, prefix="/api/v1", tags=["users"])
 app.include_router(appointments_router, prefix="/api/v1", tags=["appointments"])
 app.include_router(rooms_router, prefix="/api/v1", tags=["rooms"])
 app.include_router(websocket_router, prefix="/api/v1", tags=["websocket"])
+app.include_router(imports_router, prefix="/api/v1", tags=["import"])
+app.include_router(slots_router, prefix="/api/v1", tags=["slots"])
 
 
 @app.get("/")
@@ -57,6 +104,42 @@ async def root():
 async def health_check():
     return {"status": "healthy", "database": "postgresql"}
 
+@app.get("/health/db-pool")
+async def db_pool_status():
+    """Connection pool usage and checkout wait-time telemetry"""
+    return {
+        "primary": engine_pool_status(engine),
+        "replicas": [engine_pool_status(replica) for replica in replica_engines],
+    }
+
+@app.get("/health/redis")
+async def redis_pool_status():
+    """Redis pool usage and per-command latency telemetry"""
+    return redis_status()
+
+@app.get("/health/cache")
+async def cache_status():
+    """Hit/miss counters of the caches in this worker"""
+    return {
+        "doctors": doctor_cache_statistics.snapshot(),
+        "principals": principal_cache_statistics.snapshot(),
+    }
+
+@app.get("/health/token-filter")
+async def token_filter_status():
+    """False-positive rate and sync lag of this worker's revoked-token filter"""
+    return revocation_filter.snapshot()
+
+@app.get("/health/mail")
+async def mail_status():
+    """Queue depth and delivery counters of the background email sender"""
+    return mail_sender.snapshot()
+
+@app.get("/health/outbox")
+async def outbox_status():
+    """Dispatch counters and commit-to-publish lag of this worker's outbox dispatcher"""
+    return outbox_dispatcher.snapshot()
+
 @app.exception_handler(DomainException)
 async def domain_exception_handler(request: Request, exc: DomainException):
     return JSONResponse(
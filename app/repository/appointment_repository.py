@@ -1,6 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from datetime import datetime
+from typing import Any, AsyncIterator, Optional
+from uuid import UUID
 from app.domain.entities.appointment import Appointment
+from app.repository.pagination import Page
 
 class AppointmentRepository(ABC):
     @abstractmethod
@@ -11,6 +14,16 @@ class AppointmentRepository(ABC):
     async def add(self, appointment: Appointment) -> None:
         pass
     
+    @abstractmethod
+    async def add_many(self, appointments: list[Appointment]) -> set[UUID]:
+        """Insert in one statement, skipping conflicting rows; returns the ids inserted"""
+        pass
+    
+    @abstractmethod
+    async def missing_references(self, appointments: list[Appointment]) -> dict[UUID, str]:
+        """Appointments whose doctor, user or room does not exist, with the reason"""
+        pass
+    
     @abstractmethod
     async def update(self, appointment_id: str, **updates: Any) -> Optional[Appointment]:
         pass
@@ -22,4 +35,18 @@ class AppointmentRepository(ABC):
     @abstractmethod
     async def list_all(self, skip: int = 0, limit: int = 100) -> list[Appointment]:
         pass
-    
\ No newline at end of file
+    
+    @abstractmethod
+    async def list_page(self, limit: int = 100, cursor: Optional[str] = None) -> Page[Appointment]:
+        pass
+    
+    @abstractmethod
+    def stream(
+        self,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        doctor_id: Optional[UUID] = None,
+        batch_size: int = 1000
+    ) -> AsyncIterator[Appointment]:
+        """Yield matching appointments ordered by datetime, `batch_size` rows in memory at a time"""
+        pass
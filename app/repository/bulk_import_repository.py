@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+from app.domain.entities.doctor import Doctor
+from app.domain.entities.user import User
+
+class BulkImportRepository(ABC):
+    """Loads validated rows into a staging area and merges them in one statement.
+
+    Rows are keyed by their line number in the source file so that rejects can
+    be reported back to the uploader.
+    """
+
+    @abstractmethod
+    async def stage_doctors(self, rows: list[tuple[int, Doctor]]) -> None:
+        pass
+    
+    @abstractmethod
+    async def merge_doctors(self) -> dict[int, str]:
+        """Insert staged doctors; returns rejected line numbers with the reason"""
+        pass
+    
+    @abstractmethod
+    async def stage_users(self, rows: list[tuple[int, User]]) -> None:
+        pass
+    
+    @abstractmethod
+    async def merge_users(self) -> dict[int, str]:
+        """Insert staged users; returns rejected line numbers with the reason"""
+        pass
@@ -1,6 +1,25 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from enum import StrEnum
 from typing import Any, Optional
-from app.domain.entities.doctor import Doctor
+from app.domain.entities.doctor import CategoryEnum, Doctor
+from app.repository.pagination import Page
+
+
+class DoctorSort(StrEnum):
+    SURNAME = "surname"
+    SURNAME_DESC = "-surname"
+    EXPERIENCE = "experience"
+    EXPERIENCE_DESC = "-experience"
+
+
+@dataclass(frozen=True)
+class DoctorFilters:
+    specialization: str | None = None  # case-insensitive exact match
+    category: CategoryEnum | None = None
+    min_experience: int | None = None
+    name_prefix: str | None = None  # matches the start of name or surname
+
 
 class DoctorRepository(ABC):
     @abstractmethod
@@ -20,6 +39,27 @@ class DoctorRepository(ABC):
         pass
     
     @abstractmethod
-    async def list_all(self, skip: int = 0, limit: int = 100) -> list[Doctor]:
+    async def list_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        filters: DoctorFilters | None = None,
+        sort: DoctorSort = DoctorSort.SURNAME
+    ) -> list[Doctor]:
+        pass
+    
+    @abstractmethod
+    async def list_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        filters: DoctorFilters | None = None,
+        sort: DoctorSort = DoctorSort.SURNAME
+    ) -> Page[Doctor]:
+        pass
+    
+    @abstractmethod
+    async def version(self) -> tuple[int, int]:
+        """(count, sum of row versions): changes whenever a doctor is added, updated or deleted"""
         pass
     
\ No newline at end of file
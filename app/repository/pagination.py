@@ -0,0 +1,48 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from typing import Any, Callable, Generic, Sequence, TypeVar
+
+from app.use_cases.exceptions import InvalidCursorError
+
+T = TypeVar("T")
+
+
+@dataclass
+class Page(Generic[T]):
+    """One page of a keyset-paginated listing"""
+    items: list[T]
+    next_cursor: str | None = None
+
+
+def _to_json(value: Any) -> Any:
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+def encode_cursor(*values: Any) -> str:
+    """Opaque token holding the sort key of the last row of a page"""
+    raw = json.dumps(list(values), default=_to_json, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, *types: Callable[[Any], Any]) -> tuple:
+    """Decode a cursor and convert each sort key value with the matching type"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(types):
+            raise ValueError("unexpected cursor shape")
+        return tuple(convert(value) for convert, value in zip(types, values))
+    except (ValueError, TypeError, binascii.Error):
+        raise InvalidCursorError(cursor)
+
+
+def build_page(rows: Sequence[T], limit: int, sort_key: Callable[[T], tuple]) -> Page[T]:
+    """Turn `limit + 1` fetched rows into a page; the extra row only signals there is more"""
+    items = list(rows[:limit])
+    if len(rows) > limit:
+        return Page(items=items, next_cursor=encode_cursor(*sort_key(items[-1])))
+    return Page(items=items)
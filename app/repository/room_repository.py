@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import Any, Optional, List
 from app.domain.entities.room import Room
+from app.repository.pagination import Page
 
 class RoomRepository(ABC):
     @abstractmethod
@@ -11,7 +12,16 @@ class RoomRepository(ABC):
     async def list(self, skip: int = 0, limit: int = 100) -> List[Room]:
         pass
     
+    @abstractmethod
+    async def list_page(self, limit: int = 100, cursor: Optional[str] = None) -> Page[Room]:
+        pass
+    
     @abstractmethod
     async def add(self, user: Room) -> None:
         pass
+    
+    @abstractmethod
+    async def version(self) -> tuple[int, int]:
+        """(count, sum of row versions): changes whenever a room is added, updated or deleted"""
+        pass
     
\ No newline at end of file
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import Any, Optional
 from app.domain.entities.user import User
+from app.repository.pagination import Page
 
 class UserRepository(ABC):
     @abstractmethod
@@ -26,4 +27,8 @@ class UserRepository(ABC):
     @abstractmethod
     async def list_all(self, skip: int = 0, limit: int = 100) -> list[User]:
         pass
+    
+    @abstractmethod
+    async def list_page(self, limit: int = 100, cursor: Optional[str] = None) -> Page[User]:
+        pass
    
\ No newline at end of file
@@ -25,7 +25,7 @@ class InMemoryDoctorRepository:
     async def add(self, doctor):
         self.doctors.append(doctor)
     
-    async def list_all(self, skip=0, limit=100):
+    async def list_all(self, skip=0, limit=100, filters=None, sort=None):
         return self.doctors[skip:skip+limit]
 
 @pytest.fixture
@@ -0,0 +1,99 @@
+import csv
+import io
+import json
+import pytest
+from uuid import uuid4
+from datetime import datetime, timedelta
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.api.auth import get_admin_user
+from app.api.dependencies import export_appointments_use_case
+from app.api.export import csv_lines, ndjson_lines
+from app.domain.entities.appointment import Appointment
+from app.use_cases.crud_appointment import ExportAppointments
+
+DOCTOR_ID = uuid4()
+START = datetime(2024, 12, 25, 9, 0)
+
+
+def create_appointments(count, doctor_id=DOCTOR_ID):
+    return [
+        Appointment(
+            datetime=START + timedelta(minutes=30 * number),
+            doctor_id=doctor_id,
+            user_id=uuid4(),
+            room_id=uuid4()
+        )
+        for number in range(count)
+    ]
+
+
+class MockAppointmentRepository:
+    def __init__(self, appointments):
+        self.appointments = appointments
+        self.batch_size = None
+
+    async def stream(self, date_from=None, date_to=None, doctor_id=None, batch_size=1000):
+        self.batch_size = batch_size
+        for appointment in self.appointments:
+            if date_from and appointment.datetime < date_from:
+                continue
+            if date_to and appointment.datetime >= date_to:
+                continue
+            if doctor_id and appointment.doctor_id != doctor_id:
+                continue
+            yield appointment
+
+
+async def collect(chunks):
+    return [chunk async for chunk in chunks]
+
+
+@pytest.mark.asyncio
+async def test_export_passes_filters_and_batch_size():
+    appointments = create_appointments(5) + create_appointments(2, doctor_id=uuid4())
+    repository = MockAppointmentRepository(appointments)
+
+    stream = ExportAppointments(repository, batch_size=50)(
+        date_from=START + timedelta(minutes=30), doctor_id=DOCTOR_ID
+    )
+    exported = [appointment async for appointment in stream]
+
+    assert exported == appointments[1:5]
+    assert repository.batch_size == 50
+
+
+@pytest.mark.asyncio
+async def test_ndjson_is_chunked_one_object_per_line():
+    repository = MockAppointmentRepository(create_appointments(5))
+
+    chunks = await collect(ndjson_lines(repository.stream(), rows_per_chunk=2))
+
+    assert len(chunks) == 3
+    lines = b"".join(chunks).decode().splitlines()
+    assert [json.loads(line)["datetime"] for line in lines] == [
+        appointment.datetime.isoformat() for appointment in repository.appointments
+    ]
+
+
+@pytest.mark.asyncio
+async def test_csv_has_header_even_when_empty():
+    chunks = await collect(csv_lines(MockAppointmentRepository([]).stream()))
+
+    assert b"".join(chunks).decode().splitlines() == ["id,datetime,duration_minutes,doctor_id,user_id,room_id"]
+
+
+def test_export_endpoint_streams_csv():
+    repository = MockAppointmentRepository(create_appointments(3))
+    app.dependency_overrides[export_appointments_use_case] = lambda: ExportAppointments(repository)
+    app.dependency_overrides[get_admin_user] = lambda: None
+    try:
+        response = TestClient(app).get("/api/v1/appointments/export", params={"format": "csv"})
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [row["id"] for row in rows] == [str(appointment.id) for appointment in repository.appointments]
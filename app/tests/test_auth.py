@@ -3,6 +3,7 @@ from unittest.mock import AsyncMock, patch
 from app.use_cases.auth import AuthService
 from app.domain.entities.user import User, UserRole
 from app.core.test_security import get_password_hash, verify_password
+from app.domain.interfaces.password_hasher import PasswordHasher
 from fastapi import HTTPException
 
 class MockUserRepository:
@@ -34,11 +35,11 @@ class MockUserRepository:
 def user_repository():
     return MockUserRepository()
 
-class MockPasswordHasher:
-    def hash(self, password: str) -> str:
+class MockPasswordHasher(PasswordHasher):
+    async def hash(self, password: str) -> str:
         return get_password_hash(password)
     
-    def verify(self, password: str, hashed: str) -> bool:
+    async def verify(self, password: str, hashed: str) -> bool:
         return verify_password(password, hashed)
 
 @pytest.fixture
@@ -0,0 +1,137 @@
+import asyncio
+import json
+import time
+import pytest
+from uuid import uuid4
+
+from app.api.broadcast_bus import BROADCAST_CHANNEL, CONNECTIONS_KEY, BroadcastBus
+from app.api.connections import ConnectionManager
+from app.domain.entities.event import APPOINTMENT_CREATED, DomainEvent
+
+
+class FakePubSub:
+    def __init__(self, redis):
+        self.redis = redis
+        self.messages = asyncio.Queue()
+
+    async def subscribe(self, *channels):
+        for channel in channels:
+            self.redis.subscribers.setdefault(channel, []).append(self)
+
+    async def get_message(self, timeout=None):
+        try:
+            return await asyncio.wait_for(self.messages.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def aclose(self):
+        for subscribers in self.redis.subscribers.values():
+            if self in subscribers:
+                subscribers.remove(self)
+
+
+class FakeRedis:
+    """Pub/sub and hashes shared by every bus that uses it, like one Redis server"""
+
+    def __init__(self):
+        self.subscribers = {}
+        self.hashes = {}
+
+    def pubsub(self, ignore_subscribe_messages=False):
+        return FakePubSub(self)
+
+    async def publish(self, channel, message):
+        subscribers = self.subscribers.get(channel, [])
+        for pubsub in subscribers:
+            pubsub.messages.put_nowait({"type": "message", "channel": channel, "data": message})
+        return len(subscribers)
+
+    async def hset(self, key, field, value):
+        self.hashes.setdefault(key, {})[field] = value
+
+    async def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    async def hdel(self, key, *fields):
+        for field in fields:
+            self.hashes.get(key, {}).pop(field, None)
+
+
+class FakeWebSocket:
+    def __init__(self):
+        self.sent = []
+
+    async def accept(self):
+        pass
+
+    async def send(self, message):
+        self.sent.append(message["text"])
+
+    async def close(self, code=1000):
+        pass
+
+
+async def wait_until(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_broadcast_reaches_clients_of_every_worker():
+    redis = FakeRedis()
+    workers = [BroadcastBus(ConnectionManager(), redis) for _ in range(2)]
+    sockets = [FakeWebSocket() for _ in workers]
+    for bus, socket in zip(workers, sockets):
+        await bus.manager.connect(socket)
+    listeners = [asyncio.create_task(bus.listen()) for bus in workers]
+    await wait_until(lambda: len(redis.subscribers.get(BROADCAST_CHANNEL, [])) == 2)
+
+    assert await workers[0].publish("hello") == 1
+    await wait_until(lambda: all(socket.sent for socket in sockets))
+
+    # The publishing worker delivered locally and ignored its own echo
+    assert [socket.sent for socket in sockets] == [["hello"], ["hello"]]
+    assert [bus.relayed for bus in workers] == [0, 1]
+    assert await workers[0].cluster_status() == {"workers": 2, "connections": 2}
+
+    for listener in listeners:
+        listener.cancel()
+    await asyncio.gather(*listeners, return_exceptions=True)
+    assert redis.hashes[CONNECTIONS_KEY] == {}
+
+@pytest.mark.asyncio
+async def test_outbox_events_are_pushed_to_topic_subscribers():
+    redis = FakeRedis()
+    bus = BroadcastBus(ConnectionManager(), redis, events_channel="domain:events")
+    socket = FakeWebSocket()
+    bus.manager.subscribe(await bus.manager.connect(socket), "doctor:d1")
+    listener = asyncio.create_task(bus.listen())
+    await wait_until(lambda: redis.subscribers.get("domain:events"))
+
+    event = DomainEvent(APPOINTMENT_CREATED, uuid4(), {"doctor_id": "d1", "room_id": "r1"}, id=1)
+    await redis.publish("domain:events", json.dumps(event.to_dict()))
+    await wait_until(lambda: socket.sent)
+
+    assert json.loads(socket.sent[0]) == {"type": "event", "topic": "doctor:d1", "event": APPOINTMENT_CREATED,
+                                          "appointment": {"doctor_id": "d1", "room_id": "r1"}}
+    listener.cancel()
+    await asyncio.gather(listener, return_exceptions=True)
+
+@pytest.mark.asyncio
+async def test_stale_worker_counts_are_dropped():
+    redis = FakeRedis()
+    bus = BroadcastBus(ConnectionManager(), redis, heartbeat_seconds=5)
+    await redis.hset(CONNECTIONS_KEY, "live", json.dumps({"connections": 3, "at": time.time()}))
+    await redis.hset(CONNECTIONS_KEY, "gone", json.dumps({"connections": 7, "at": time.time() - 60}))
+
+    # The live worker plus this one, with no clients
+    assert await bus.cluster_status() == {"workers": 2, "connections": 3}
+    assert list(redis.hashes[CONNECTIONS_KEY]) == ["live"]
+
+def test_malformed_message_is_ignored():
+    bus = BroadcastBus(ConnectionManager(), FakeRedis())
+
+    bus.apply("not json")
+
+    assert bus.relayed == 0
@@ -0,0 +1,120 @@
+import pytest
+from uuid import uuid4
+from datetime import datetime, timedelta
+from sqlalchemy.dialects import postgresql
+
+from app.adapters.postgres_appointment_repository import PostgresAppointmentRepository
+from app.domain.entities.appointment import Appointment
+from app.domain.interfaces.unit_of_work import NullUnitOfWork
+from app.use_cases.crud_appointment import BulkCreateAppointments, BulkItemStatus
+
+DOCTOR_ID = uuid4()
+ROOM_ID = uuid4()
+USER_ID = uuid4()
+START = datetime(2024, 12, 25, 9, 0)
+
+
+def create_appointment(minutes=0, **kwargs):
+    return Appointment(
+        datetime=START + timedelta(minutes=minutes),
+        doctor_id=kwargs.get('doctor_id', DOCTOR_ID),
+        user_id=kwargs.get('user_id', USER_ID),
+        room_id=kwargs.get('room_id', ROOM_ID)
+    )
+
+
+class MockAppointmentRepository:
+    def __init__(self, taken=()):
+        self.appointments = {}
+        self.taken = set(taken)
+        self.insert_calls = 0
+
+    async def add_many(self, appointments):
+        self.insert_calls += 1
+        inserted = set()
+        for appointment in appointments:
+            if appointment.datetime not in self.taken:
+                self.appointments[appointment.id] = appointment
+                inserted.add(appointment.id)
+        return inserted
+
+    async def missing_references(self, appointments):
+        return {
+            appointment.id: f"Doctor not found: {appointment.doctor_id}"
+            for appointment in appointments
+            if appointment.doctor_id != DOCTOR_ID
+        }
+
+
+class CountingUnitOfWork(NullUnitOfWork):
+    def __init__(self):
+        super().__init__()
+        self.commits = 0
+
+    async def commit(self):
+        self.commits += 1
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_reports_per_item_status():
+    repository = MockAppointmentRepository(taken={START + timedelta(minutes=30)})
+    use_case = BulkCreateAppointments(repository)
+    appointments = [
+        create_appointment(0),
+        create_appointment(30),                      # taken in the database
+        create_appointment(60, doctor_id=uuid4()),   # unknown doctor
+        create_appointment(0, room_id=uuid4()),      # same doctor, same time as item 0
+    ]
+
+    results = await use_case(appointments)
+
+    assert [result.status for result in results] == [
+        BulkItemStatus.CREATED,
+        BulkItemStatus.CONFLICT,
+        BulkItemStatus.INVALID,
+        BulkItemStatus.CONFLICT,
+    ]
+    assert [result.index for result in results] == [0, 1, 2, 3]
+    assert "Doctor not found" in results[2].detail
+    assert set(repository.appointments) == {appointments[0].id}
+
+@pytest.mark.asyncio
+async def test_bulk_create_commits_once_per_chunk():
+    repository = MockAppointmentRepository()
+    unit_of_work = CountingUnitOfWork()
+    use_case = BulkCreateAppointments(repository, unit_of_work, chunk_size=2)
+
+    results = await use_case([create_appointment(minutes * 30) for minutes in range(5)])
+
+    assert all(result.status == BulkItemStatus.CREATED for result in results)
+    assert repository.insert_calls == 3
+    assert unit_of_work.commits == 3
+
+
+class CapturingSession:
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, statement):
+        self.statements.append(str(statement.compile(dialect=postgresql.dialect())))
+
+        class Result:
+            def scalars(self):
+                return self
+
+            def all(self):
+                return []
+        return Result()
+
+
+@pytest.mark.asyncio
+async def test_add_many_is_one_multi_row_insert():
+    session = CapturingSession()
+
+    await PostgresAppointmentRepository(session).add_many([create_appointment(0), create_appointment(30)])
+
+    assert len(session.statements) == 1
+    sql = session.statements[0]
+    assert sql.startswith("INSERT INTO appointments")
+    assert sql.count("(%(id_m0)s") == 1 and "%(id_m1)s" in sql
+    assert "ON CONFLICT DO NOTHING RETURNING appointments.id" in sql
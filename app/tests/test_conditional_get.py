@@ -0,0 +1,178 @@
+import pytest
+from uuid import uuid4
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
+
+from app.main import app
+from app.api.conditional import is_not_modified, make_etag
+from app.api.dependencies import get_doctor_use_case, list_doctors_use_case
+from app.adapters.postgres_doctor_repository import PostgresDoctorRepository
+from app.core.config import settings
+from app.domain.entities.doctor import CategoryEnum, Doctor
+from app.repository.pagination import Page
+
+
+def create_doctor(**kwargs):
+    return Doctor(name="John", surname="Doe", age=30, specialization="GP",
+                  category=CategoryEnum.FIRST, password="hashed", **kwargs)
+
+
+class MockListDoctors:
+    def __init__(self, doctors, version):
+        self.doctors = doctors
+        self.current_version = version
+        self.loads = 0
+
+    async def __call__(self, **kwargs):
+        self.loads += 1
+        return self.doctors
+
+    async def page(self, **kwargs):
+        self.loads += 1
+        return Page(self.doctors)
+
+    async def version(self):
+        return len(self.doctors), self.current_version
+
+
+class MockGetDoctor:
+    def __init__(self, doctor):
+        self.doctor = doctor
+
+    async def __call__(self, doctor_id):
+        return self.doctor
+
+
+class FakeRequest:
+    def __init__(self, if_none_match=None):
+        self.headers = {"if-none-match": if_none_match} if if_none_match else {}
+
+
+class FakeResult:
+    def __init__(self, row):
+        self.row = row
+
+    def one(self):
+        return self.row
+
+
+class CapturingSession:
+    def __init__(self, row):
+        self.row = row
+        self.statements = []
+
+    async def execute(self, statement):
+        self.statements.append(str(statement.compile(dialect=postgresql.dialect())))
+        return FakeResult(self.row)
+
+
+class AggregatingSession:
+    """Answers the version query from committed row versions, as Postgres would"""
+
+    def __init__(self, committed):
+        self.committed = committed
+
+    async def execute(self, statement):
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+        versions = self.committed.values()
+        aggregate = sum(versions) if "sum(" in sql else max(versions)
+        return FakeResult((len(versions), aggregate))
+
+
+@pytest.fixture
+def client():
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.parametrize("header, matches", [
+    (None, False),
+    ('"doctors-3-7"', True),
+    ('W/"doctors-3-7"', True),
+    ('"other", "doctors-3-7"', True),
+    ("*", True),
+    ('"doctors-3-8"', False),
+])
+def test_if_none_match_parsing(header, matches):
+    assert is_not_modified(FakeRequest(header), make_etag("doctors", 3, 7)) is matches
+
+def test_unchanged_directory_is_not_loaded_again(client):
+    use_case = MockListDoctors([create_doctor(), create_doctor()], version=7)
+    app.dependency_overrides[list_doctors_use_case] = lambda: use_case
+
+    first = client.get("/api/v1/doctors")
+    etag = first.headers["ETag"]
+    repeat = client.get("/api/v1/doctors", headers={"If-None-Match": etag})
+
+    assert first.status_code == 200 and etag == '"doctors-2-7"'
+    assert first.headers["Cache-Control"] == settings.doctors_cache_control
+    assert repeat.status_code == 304 and repeat.content == b""
+    assert repeat.headers["ETag"] == etag
+    assert use_case.loads == 1
+
+    use_case.current_version = 8
+    changed = client.get("/api/v1/doctors", headers={"If-None-Match": etag})
+    assert changed.status_code == 200 and changed.headers["ETag"] == '"doctors-2-8"'
+    assert len(changed.json()) == 2
+
+def test_doctor_etag_follows_row_version(client):
+    doctor = create_doctor(version=5)
+    app.dependency_overrides[get_doctor_use_case] = lambda: MockGetDoctor(doctor)
+
+    first = client.get(f"/api/v1/doctors/{doctor.id}")
+    repeat = client.get(f"/api/v1/doctors/{doctor.id}", headers={"If-None-Match": first.headers["ETag"]})
+    doctor.version = 6
+    changed = client.get(f"/api/v1/doctors/{doctor.id}", headers={"If-None-Match": first.headers["ETag"]})
+
+    assert first.status_code == 200 and first.headers["Cache-Control"] == settings.doctor_cache_control
+    assert "version" not in first.json()
+    assert repeat.status_code == 304
+    assert changed.status_code == 200 and changed.headers["ETag"] != first.headers["ETag"]
+
+def test_cached_doctor_keeps_its_version():
+    doctor = create_doctor(version=9)
+
+    assert Doctor.from_dict(doctor.to_dict()).version == 9
+
+@pytest.mark.asyncio
+async def test_version_is_one_aggregate_query():
+    session = CapturingSession((4, 12))
+
+    assert await PostgresDoctorRepository(session).version() == (4, 12)
+    assert len(session.statements) == 1
+    assert "count(*)" in session.statements[0] and "sum(doctors.version)" in session.statements[0]
+
+@pytest.mark.asyncio
+async def test_version_moves_when_commits_land_out_of_order():
+    committed = {"a": 5, "b": 6}
+    session = AggregatingSession(committed)
+    repository = PostgresDoctorRepository(session)
+    etags = [make_etag("doctors", *await repository.version())]
+
+    # T1 updates a and draws 10, T2 updates b and draws 11, T2 commits first
+    committed["b"] = 11
+    etags.append(make_etag("doctors", *await repository.version()))
+    committed["a"] = 10
+    etags.append(make_etag("doctors", *await repository.version()))
+
+    assert len(set(etags)) == 3
+
+@pytest.mark.asyncio
+async def test_update_draws_a_new_version():
+    session = CapturingSession(None)
+    session.execute = _returning_none(session)
+
+    await PostgresDoctorRepository(session).update(str(uuid4()), age=41)
+
+    assert "version=nextval(" in session.statements[0]
+
+
+def _returning_none(session):
+    async def execute(statement):
+        session.statements.append(str(statement.compile(dialect=postgresql.dialect())))
+
+        class Result:
+            def one_or_none(self):
+                return None
+        return Result()
+    return execute
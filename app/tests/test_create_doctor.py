@@ -1,10 +1,11 @@
 import pytest
+from app.adapters.password_hasher import SHA256PasswordHasher
 from app.use_cases.crud_doctor import CreateDoctor
 from tests.utils import create_doctor
 
 @pytest.mark.asyncio
 async def test_create_doctor_use_case(doctor_repository):
-    create_doctor_use_case = CreateDoctor(doctor_repository)
+    create_doctor_use_case = CreateDoctor(doctor_repository, SHA256PasswordHasher())
     
     doctor_data = create_doctor(
         name="Елена",
@@ -41,4 +42,13 @@ async def test_list_doctors_with_pagination(doctor_repository):
     doctors_page2 = await list_doctors_use_case(skip=2, limit=2)
     
     assert len(doctors_page1) == 2
-    assert len(doctors_page2) == 1
\ No newline at end of file
+    assert len(doctors_page2) == 1
+@pytest.mark.asyncio
+async def test_create_doctor_stores_hashed_password(doctor_repository):
+    hasher = SHA256PasswordHasher()
+
+    doctor = await CreateDoctor(doctor_repository, hasher)(create_doctor(password="password123"))
+
+    saved_doctor = await doctor_repository.get(id=doctor.id)
+    assert saved_doctor.password != "password123"
+    assert await hasher.verify("password123", saved_doctor.password)
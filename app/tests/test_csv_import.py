@@ -0,0 +1,156 @@
+import csv
+import io
+import pytest
+
+from app.adapters.password_hasher import SHA256PasswordHasher
+from app.adapters.postgres_bulk_import_repository import DOCTOR_COLUMNS, PostgresBulkImportRepository
+from app.domain.entities.doctor import CategoryEnum, Doctor
+from app.domain.interfaces.unit_of_work import NullUnitOfWork
+from app.use_cases.import_csv import ImportDoctors, ImportUsers
+
+DOCTORS_CSV = """name,surname,age,specialization,category,password,experience_years
+John,Smith,40,Cardiology,first,secret1,10
+Bad,Age,forty,Cardiology,first,secret1,
+Anna,Brown,35,Neurology,highest,secret2,
+Jack,Smith,50,Surgery,second,secret3,20
+"""
+
+USERS_CSV = """name,surname,email,password,age,phone,role
+Alice,Jones,alice@example.com,password1,30,,admin
+Bob,Stone,not-an-email,password2,,,
+Carl,Young,carl@example.com,short,,,
+"""
+
+
+class MockBulkImportRepository:
+    def __init__(self):
+        self.staged = []
+        self.batches = 0
+
+    async def stage_doctors(self, rows):
+        self.batches += 1
+        self.staged.extend(rows)
+
+    async def merge_doctors(self):
+        # Unique surname: later lines with a taken surname are skipped
+        seen, rejected = set(), {}
+        for line, doctor in self.staged:
+            if doctor.surname in seen:
+                rejected[line] = "Doctor with this surname already exists"
+            seen.add(doctor.surname)
+        return rejected
+
+    async def stage_users(self, rows):
+        self.batches += 1
+        self.staged.extend(rows)
+
+    async def merge_users(self):
+        return {}
+
+
+class FakeDriverConnection:
+    def __init__(self):
+        self.copies = []
+
+    async def copy_records_to_table(self, table, records, columns):
+        self.copies.append((table, columns, records))
+
+
+class FakeConnection:
+    def __init__(self, driver_connection):
+        self.driver_connection = driver_connection
+
+    async def get_raw_connection(self):
+        return self
+
+
+class CapturingSession:
+    def __init__(self):
+        self.statements = []
+        self.driver_connection = FakeDriverConnection()
+
+    async def execute(self, statement):
+        self.statements.append(str(statement))
+
+    async def connection(self):
+        return FakeConnection(self.driver_connection)
+
+
+class CountingUnitOfWork(NullUnitOfWork):
+    def __init__(self):
+        super().__init__()
+        self.commits = 0
+
+    async def commit(self):
+        self.commits += 1
+
+
+def rows(text):
+    return csv.DictReader(io.StringIO(text))
+
+
+@pytest.mark.asyncio
+async def test_import_doctors_reports_rejects_by_line():
+    repository = MockBulkImportRepository()
+    unit_of_work = CountingUnitOfWork()
+    use_case = ImportDoctors(repository, SHA256PasswordHasher(), unit_of_work, batch_size=2)
+
+    report = await use_case(rows(DOCTORS_CSV))
+
+    assert report.total == 4
+    assert report.imported == 2
+    assert [reject.line for reject in report.rejects] == [3, 5]
+    assert "age" in report.rejects[0].reason
+    assert "surname" in report.rejects[1].reason
+    assert repository.batches == 2
+    assert unit_of_work.commits == 1
+
+
+@pytest.mark.asyncio
+async def test_import_doctors_hashes_passwords_and_coerces_numbers():
+    repository = MockBulkImportRepository()
+    hasher = SHA256PasswordHasher()
+
+    await ImportDoctors(repository, hasher)(rows(DOCTORS_CSV))
+
+    line, doctor = repository.staged[0]
+    assert line == 2
+    assert doctor.age == 40 and doctor.experience_years == 10
+    assert doctor.category == CategoryEnum.FIRST
+    assert await hasher.verify("secret1", doctor.password)
+    # Blank optional column falls back to the schema default
+    assert repository.staged[1][1].experience_years == 0
+
+
+@pytest.mark.asyncio
+async def test_import_users_validates_with_user_schema():
+    repository = MockBulkImportRepository()
+
+    report = await ImportUsers(repository, SHA256PasswordHasher())(rows(USERS_CSV))
+
+    assert report.imported == 1
+    assert [reject.line for reject in report.rejects] == [3, 4]
+    user = repository.staged[0][1]
+    assert user.email == "alice@example.com"
+    assert user.role.value == "admin"
+    assert user.hashed_password != "password1"
+
+
+@pytest.mark.asyncio
+async def test_staging_table_holds_only_the_copied_columns():
+    session = CapturingSession()
+    repository = PostgresBulkImportRepository(session)
+    doctor = Doctor(name="John", surname="Smith", age=40, specialization="Cardiology",
+                    category=CategoryEnum.FIRST, password="hashed")
+
+    await repository.stage_doctors([(2, doctor)])
+    await repository.stage_doctors([(3, doctor)])
+
+    # LIKE doctors would copy NOT NULL on version/updated_at without their defaults
+    assert session.statements == [
+        "CREATE TEMP TABLE doctors_import ON COMMIT DROP AS "
+        f"SELECT NULL::integer AS line, {', '.join(DOCTOR_COLUMNS)} FROM doctors WITH NO DATA"
+    ]
+    table, columns, records = session.driver_connection.copies[0]
+    assert table == "doctors_import" and columns == ["line", *DOCTOR_COLUMNS]
+    assert len(records[0]) == len(columns)
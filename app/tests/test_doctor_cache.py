@@ -0,0 +1,186 @@
+import asyncio
+import pytest
+from uuid import uuid4
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.adapters.password_hasher import SHA256PasswordHasher
+from app.adapters import cached_doctor_repository
+from app.adapters.cached_doctor_repository import CachedDoctorRepository, cache_key
+from app.core.metrics import CacheStatistics
+from app.domain.entities.doctor import CategoryEnum, Doctor
+from app.domain.interfaces.unit_of_work import NullUnitOfWork
+from app.infrastructure.database.routing import use_primary
+from app.use_cases.crud_doctor import GetDoctor
+from app.use_cases.delete_doctor import DeleteDoctor
+from app.use_cases.update_doctor import UpdateDoctor
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values = {}
+        self.deletes = []
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, ex=None, px=None, nx=False):
+        if nx and key in self.values:
+            return None
+        self.values[key] = value
+        return True
+
+    async def delete(self, key):
+        self.deletes.append(key)
+        self.values.pop(key, None)
+
+    async def eval(self, script, numkeys, key, token):
+        if self.values.get(key) == token:
+            del self.values[key]
+
+
+class BrokenRedis:
+    async def get(self, *args, **kwargs):
+        raise RedisConnectionError("down")
+
+    set = delete = eval = get
+
+
+class SlowDoctorRepository:
+    def __init__(self, doctors=()):
+        self.doctors = {doctor.id: doctor for doctor in doctors}
+        self.gets = 0
+        self.primary_reads = []
+
+    async def get(self, **filters):
+        self.gets += 1
+        self.primary_reads.append(use_primary.get())
+        await asyncio.sleep(0.01)
+        return self.doctors.get(filters.get('id'))
+
+    async def update(self, doctor_id, **updates):
+        doctor = self.doctors[doctor_id_key(doctor_id)]
+        for key, value in updates.items():
+            setattr(doctor, key, value)
+        return doctor
+
+    async def delete(self, doctor_id):
+        return self.doctors.pop(doctor_id_key(doctor_id), None) is not None
+
+
+def doctor_id_key(doctor_id):
+    from uuid import UUID
+    return UUID(str(doctor_id))
+
+
+def create_doctor():
+    return Doctor(name="John", surname="Smith", age=40, specialization="Cardiology",
+                  category=CategoryEnum.FIRST, password="hash", experience_years=5)
+
+
+@pytest.fixture(autouse=True)
+def fresh_statistics(monkeypatch):
+    monkeypatch.setattr(cached_doctor_repository, "statistics", CacheStatistics())
+
+
+@pytest.mark.asyncio
+async def test_second_read_is_served_from_redis():
+    doctor = create_doctor()
+    repository = SlowDoctorRepository([doctor])
+    cached = CachedDoctorRepository(repository, FakeRedis())
+
+    first = await GetDoctor(cached)(doctor.id)
+    second = await GetDoctor(cached)(doctor.id)
+
+    assert first == doctor
+    # The password hash is not cached
+    assert second == Doctor.from_dict({**doctor.to_dict(), "password": ""})
+    assert repository.gets == 1
+    counts = cached_doctor_repository.statistics.snapshot()
+    assert (counts["hits"], counts["misses"], counts["loads"]) == (1, 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_misses_are_loaded_from_the_primary():
+    doctor = create_doctor()
+    repository = SlowDoctorRepository([doctor])
+    redis = FakeRedis()
+
+    await CachedDoctorRepository(repository, redis).get(id=doctor.id)
+
+    # A lagging replica could still return the row an update just invalidated
+    assert repository.primary_reads == [True]
+    assert use_primary.get() is False
+    assert "password" not in redis.values[cache_key(doctor.id)]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_load_once():
+    doctor = create_doctor()
+    repository = SlowDoctorRepository([doctor])
+    redis = FakeRedis()
+
+    results = await asyncio.gather(*(
+        CachedDoctorRepository(repository, redis).get(id=doctor.id) for _ in range(50)
+    ))
+
+    assert all(result == doctor for result in results)
+    assert repository.gets == 1
+
+
+@pytest.mark.asyncio
+async def test_waits_for_another_workers_load():
+    doctor = create_doctor()
+    repository = SlowDoctorRepository([doctor])
+    redis = FakeRedis()
+    # Another process holds the load lock and fills the cache a little later
+    redis.values[f"lock:{cache_key(doctor.id)}"] = "other-worker"
+    cached = CachedDoctorRepository(repository, redis, poll_interval_seconds=0.01)
+
+    async def other_worker():
+        await asyncio.sleep(0.03)
+        await CachedDoctorRepository(SlowDoctorRepository([doctor]), redis)._write(cache_key(doctor.id), doctor)
+
+    result, _ = await asyncio.gather(cached.get(id=doctor.id), other_worker())
+
+    assert result.id == doctor.id and result.password == ""
+    assert repository.gets == 0
+    assert cached_doctor_repository.statistics.snapshot()["lock_waits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_missing_doctor_is_cached_as_tombstone():
+    repository = SlowDoctorRepository()
+    cached = CachedDoctorRepository(repository, FakeRedis())
+    doctor_id = uuid4()
+
+    assert await cached.get(id=doctor_id) is None
+    assert await cached.get(id=doctor_id) is None
+    assert repository.gets == 1
+
+
+@pytest.mark.asyncio
+async def test_update_and_delete_invalidate_entry_after_commit():
+    doctor = create_doctor()
+    redis = FakeRedis()
+    cached = CachedDoctorRepository(SlowDoctorRepository([doctor]), redis, NullUnitOfWork())
+    key = cache_key(doctor.id)
+
+    await cached.get(id=doctor.id)
+    await UpdateDoctor(cached, SHA256PasswordHasher(), cached.unit_of_work)(doctor.id, age=41)
+    assert key not in redis.values
+    # Once immediately, once after the commit
+    assert redis.deletes == [key, key]
+
+    assert (await cached.get(id=doctor.id)).age == 41
+    await DeleteDoctor(cached, cached.unit_of_work)(doctor.id)
+    assert key not in redis.values
+
+
+@pytest.mark.asyncio
+async def test_redis_outage_falls_back_to_repository():
+    doctor = create_doctor()
+    repository = SlowDoctorRepository([doctor])
+    cached = CachedDoctorRepository(repository, BrokenRedis())
+
+    assert await cached.get(id=doctor.id) == doctor
+    assert cached_doctor_repository.statistics.snapshot()["errors"] >= 1
@@ -0,0 +1,101 @@
+import json
+import os
+import pytest
+from uuid import uuid4
+from sqlalchemy.dialects import postgresql
+
+from app.adapters.postgres_doctor_repository import PostgresDoctorRepository
+from app.domain.entities.doctor import CategoryEnum
+from app.repository.doctor_repository import DoctorFilters, DoctorSort
+from app.repository.pagination import encode_cursor
+from app.use_cases.exceptions import InvalidCursorError
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+
+class FakeScalars:
+    def all(self):
+        return []
+
+
+class FakeResult:
+    def scalars(self):
+        return FakeScalars()
+
+
+class CapturingSession:
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+        return FakeResult()
+
+
+def compile_sql(statement, dialect=postgresql.dialect()) -> str:
+    return str(statement.compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+
+
+def test_filters_become_where_clauses():
+    query = PostgresDoctorRepository(None)._list_query(
+        DoctorFilters(specialization="Cardiology", category=CategoryEnum.FIRST, min_experience=5, name_prefix="An_"),
+        DoctorSort.SURNAME
+    )
+    sql = compile_sql(query)
+
+    assert "lower(doctors.specialization) = 'cardiology'" in sql
+    assert "doctors.category = 'FIRST'" in sql
+    assert "doctors.experience_years >= 5" in sql
+    assert "doctors.name ILIKE" in sql and "doctors.surname ILIKE" in sql
+    # LIKE wildcards typed by the user are matched literally
+    assert "An\\_%" in query.compile().params.values()
+    assert sql.endswith("ORDER BY doctors.surname, doctors.id")
+
+
+@pytest.mark.asyncio
+async def test_descending_sort_pages_backwards_from_cursor():
+    session = CapturingSession()
+    repository = PostgresDoctorRepository(session)
+
+    await repository.list_page(limit=10, cursor=encode_cursor(7, uuid4()), sort=DoctorSort.EXPERIENCE_DESC)
+    sql = compile_sql(session.statements[0])
+
+    assert "(doctors.experience_years, doctors.id) < (7," in sql
+    assert "ORDER BY doctors.experience_years DESC, doctors.id DESC" in sql
+
+
+@pytest.mark.asyncio
+async def test_cursor_from_another_sort_is_rejected():
+    repository = PostgresDoctorRepository(CapturingSession())
+
+    with pytest.raises(InvalidCursorError):
+        await repository.list_page(cursor=encode_cursor("Smith", uuid4()), sort=DoctorSort.EXPERIENCE)
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL is not set (needs a migrated database)")
+@pytest.mark.parametrize("filters, sort, index", [
+    (DoctorFilters(specialization="Cardiology"), DoctorSort.SURNAME, "ix_doctors_specialization_surname_id"),
+    (DoctorFilters(category=CategoryEnum.HIGHEST), DoctorSort.SURNAME, "ix_doctors_category_surname_id"),
+    (DoctorFilters(min_experience=10), DoctorSort.EXPERIENCE_DESC, "ix_doctors_experience_years_id"),
+    (DoctorFilters(name_prefix="Ann"), DoctorSort.SURNAME, "_trgm"),
+])
+async def test_filters_use_their_index(filters, sort, index):
+    from sqlalchemy import text
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    engine = create_async_engine(TEST_DATABASE_URL)
+    query = PostgresDoctorRepository(None)._list_query(filters, sort).limit(100)
+    try:
+        async with engine.connect() as connection:
+            # Test tables are tiny; make the planner show which index it would use at scale
+            await connection.execute(text("SET LOCAL enable_seqscan = off"))
+            # The connected dialect knows the server's string escaping rules
+            sql = compile_sql(query, connection.dialect)
+            result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}")
+            plan = result.scalar_one()
+    finally:
+        await engine.dispose()
+
+    plan_text = plan if isinstance(plan, str) else json.dumps(plan)
+    assert index in plan_text
@@ -0,0 +1,126 @@
+import asyncio
+import os
+import pytest
+from uuid import uuid4
+from datetime import datetime, timedelta
+from sqlalchemy.exc import IntegrityError
+
+from app.adapters.postgres_appointment_repository import DatabaseException, PostgresAppointmentRepository
+from app.domain.entities.appointment import Appointment
+from app.use_cases.exceptions import AppointmentConflictError
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+START = datetime(2024, 12, 25, 9, 0)
+
+
+class FakeAsyncpgError(Exception):
+    def __init__(self, constraint_name):
+        self.constraint_name = constraint_name
+
+
+class FakeDriverError(Exception):
+    def __init__(self, sqlstate, constraint_name=None):
+        self.sqlstate = sqlstate
+        self.__cause__ = FakeAsyncpgError(constraint_name)
+
+
+class FailingSession:
+    def __init__(self, error):
+        self.error = error
+
+    def add(self, instance):
+        pass
+
+    async def flush(self):
+        raise IntegrityError("INSERT INTO appointments ...", {}, self.error)
+
+
+def create_appointment(**kwargs):
+    return Appointment(
+        datetime=kwargs.get('datetime', START),
+        doctor_id=kwargs.get('doctor_id', uuid4()),
+        user_id=kwargs.get('user_id', uuid4()),
+        room_id=kwargs.get('room_id', uuid4()),
+        duration_minutes=kwargs.get('duration_minutes', 30)
+    )
+
+
+def test_appointment_ends_after_its_duration():
+    appointment = create_appointment(duration_minutes=45)
+    assert appointment.ends_at == START + timedelta(minutes=45)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("constraint, resource", [
+    ("appointments_doctor_no_overlap", "doctor"),
+    ("appointments_room_no_overlap", "room"),
+])
+async def test_exclusion_violation_becomes_conflict_error(constraint, resource):
+    repository = PostgresAppointmentRepository(FailingSession(FakeDriverError("23P01", constraint)))
+
+    with pytest.raises(AppointmentConflictError) as error:
+        await repository.add(create_appointment())
+
+    assert error.value.status_code == 409
+    assert error.value.resource == resource
+
+
+@pytest.mark.asyncio
+async def test_other_integrity_errors_stay_database_errors():
+    # e.g. a foreign key violation
+    repository = PostgresAppointmentRepository(FailingSession(FakeDriverError("23503")))
+
+    with pytest.raises(DatabaseException):
+        await repository.add(create_appointment())
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL is not set (needs a migrated database)")
+async def test_concurrent_bookings_for_one_slot_admit_exactly_one():
+    from sqlalchemy import text
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+    from app.adapters.sqlalchemy_unit_of_work import SqlAlchemyUnitOfWork
+    from app.use_cases.crud_appointment import CreateAppointment
+
+    engine = create_async_engine(TEST_DATABASE_URL, pool_size=20, max_overflow=0)
+    sessions = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    doctor_id, user_id = uuid4(), uuid4()
+    room_ids = [uuid4() for _ in range(2)]
+
+    async with engine.begin() as connection:
+        await connection.execute(text(
+            "INSERT INTO doctors (id, name, surname, age, specialization, category, password, experience_years) "
+            "VALUES (:id, 'Load', :surname, 40, 'Testing', 'FIRST', 'x', 0)"
+        ), {"id": doctor_id, "surname": f"t{doctor_id.hex[:8]}"})
+        await connection.execute(text(
+            "INSERT INTO users (id, name, surname, email, role, hashed_password, disabled) "
+            "VALUES (:id, 'Load', 'Test', :email, 'user', 'x', false)"
+        ), {"id": user_id, "email": f"{user_id.hex}@example.com"})
+        for room_id in room_ids:
+            await connection.execute(text("INSERT INTO rooms (id, number) VALUES (:id, 1)"), {"id": room_id})
+
+    async def book(attempt: int):
+        async with sessions() as session:
+            use_case = CreateAppointment(PostgresAppointmentRepository(session), SqlAlchemyUnitOfWork(session))
+            # Same doctor, two rooms and start times shifted inside the 30 minute visit
+            appointment = create_appointment(
+                datetime=START + timedelta(minutes=attempt % 20),
+                doctor_id=doctor_id,
+                user_id=user_id,
+                room_id=room_ids[attempt % 2]
+            )
+            try:
+                await use_case(appointment)
+                return True
+            except AppointmentConflictError:
+                return False
+
+    try:
+        results = await asyncio.gather(*(book(attempt) for attempt in range(300)))
+        assert results.count(True) == 1
+    finally:
+        async with engine.begin() as connection:
+            await connection.execute(text("DELETE FROM doctors WHERE id = :id"), {"id": doctor_id})
+            await connection.execute(text("DELETE FROM users WHERE id = :id"), {"id": user_id})
+            await connection.execute(text("DELETE FROM rooms WHERE id = ANY(:ids)"), {"ids": room_ids})
+        await engine.dispose()
@@ -0,0 +1,138 @@
+import asyncio
+import socket
+import pytest
+from aiosmtpd.controller import Controller
+
+import app.core.email as email_module
+from app.core.config import settings
+from app.infrastructure.mail import MailSender, OutgoingMail
+
+
+class RecordingHandler:
+    """aiosmtpd handler that stores messages and can fail on demand"""
+
+    def __init__(self, data_failures: int = 0, refuse: tuple[str, ...] = ()):
+        self.messages = []
+        self.sessions = set()
+        self.data_failures = data_failures
+        self.refuse = refuse
+
+    async def handle_RCPT(self, server, session, envelope, address, rcpt_options):
+        if address in self.refuse:
+            return "550 No such user"
+        envelope.rcpt_tos.append(address)
+        return "250 OK"
+
+    async def handle_DATA(self, server, session, envelope):
+        self.sessions.add(id(session))
+        if self.data_failures:
+            self.data_failures -= 1
+            return "451 Try again later"
+        self.messages.append(envelope)
+        return "250 Message accepted"
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def smtp_server():
+    servers = []
+
+    def start(handler):
+        controller = Controller(handler, hostname="127.0.0.1", port=free_port())
+        controller.start()
+        servers.append(controller)
+        return controller
+
+    yield start
+    for controller in servers:
+        controller.stop()
+
+
+def make_sender(port: int, **kwargs) -> MailSender:
+    options = dict(start_tls=False, timeout=2.0, backoff_seconds=0.01)
+    options.update(kwargs)
+    return MailSender("127.0.0.1", port, "noreply@medicalapp.com", **options)
+
+
+async def deliver(sender: MailSender, until, timeout: float = 5.0) -> None:
+    task = asyncio.create_task(sender.run())
+    try:
+        deadline = asyncio.get_running_loop().time() + timeout
+        while not until() and asyncio.get_running_loop().time() < deadline:
+            await asyncio.sleep(0.01)
+    finally:
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+
+@pytest.mark.asyncio
+async def test_batch_goes_over_one_connection(smtp_server):
+    handler = RecordingHandler()
+    sender = make_sender(smtp_server(handler).port)
+    for index in range(5):
+        assert sender.enqueue(OutgoingMail(f"user{index}@example.com", "Hello", "Body"))
+
+    await deliver(sender, lambda: len(handler.messages) == 5)
+
+    assert sorted(envelope.rcpt_tos[0] for envelope in handler.messages) == [f"user{i}@example.com" for i in range(5)]
+    assert len(handler.sessions) == 1
+    snapshot = sender.snapshot()
+    assert snapshot["sent"] == 5 and snapshot["connects"] == 1 and snapshot["batches"] == 1
+
+@pytest.mark.asyncio
+async def test_temporary_failure_is_retried(smtp_server):
+    handler = RecordingHandler(data_failures=2)
+    sender = make_sender(smtp_server(handler).port)
+    sender.enqueue(OutgoingMail("user@example.com", "Hello", "Body"))
+
+    await deliver(sender, lambda: handler.messages)
+
+    assert len(handler.messages) == 1
+    assert sender.snapshot()["retried"] == 2
+
+@pytest.mark.asyncio
+async def test_refused_recipient_is_not_retried(smtp_server):
+    handler = RecordingHandler(refuse=("gone@example.com",))
+    sender = make_sender(smtp_server(handler).port)
+    sender.enqueue(OutgoingMail("gone@example.com", "Hello", "Body"))
+    sender.enqueue(OutgoingMail("user@example.com", "Hello", "Body"))
+
+    await deliver(sender, lambda: handler.messages)
+
+    snapshot = sender.snapshot()
+    assert snapshot["failed"] == 1 and snapshot["retried"] == 0 and snapshot["sent"] == 1
+
+@pytest.mark.asyncio
+async def test_unreachable_server_gives_up_after_max_attempts():
+    sender = make_sender(free_port(), max_attempts=3)
+    sender.enqueue(OutgoingMail("user@example.com", "Hello", "Body"))
+
+    await deliver(sender, lambda: sender.snapshot()["failed"])
+
+    snapshot = sender.snapshot()
+    assert snapshot["failed"] == 1 and snapshot["retried"] == 2
+
+def test_full_queue_drops_instead_of_blocking():
+    sender = make_sender(free_port(), queue_size=1)
+
+    assert sender.enqueue(OutgoingMail("first@example.com", "Hello", "Body"))
+    assert not sender.enqueue(OutgoingMail("second@example.com", "Hello", "Body"))
+    assert sender.snapshot()["dropped"] == 1
+
+@pytest.mark.asyncio
+async def test_reset_email_is_only_queued(monkeypatch):
+    sender = make_sender(free_port())
+    monkeypatch.setattr(email_module, "mail_sender", sender)
+    monkeypatch.setattr(settings, "smtp_username", "user")
+    monkeypatch.setattr(settings, "smtp_password", "secret")
+
+    await email_module.send_reset_email("john@example.com", "token123")
+
+    mail = sender.queue.get_nowait()
+    assert mail.to == "john@example.com" and "token123" in mail.body
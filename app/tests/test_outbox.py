@@ -0,0 +1,189 @@
+import json
+import pytest
+from datetime import datetime, timezone
+from uuid import uuid4
+from sqlalchemy.dialects import postgresql
+
+from app.adapters.postgres_appointment_repository import PostgresAppointmentRepository
+from app.domain.entities.appointment import Appointment
+from app.domain.entities.event import APPOINTMENT_CREATED, APPOINTMENT_DELETED, APPOINTMENT_UPDATED, DomainEvent
+from app.infrastructure.database.models import OutboxEventORM
+from app.infrastructure.outbox import OutboxDispatcher
+
+START = datetime(2024, 12, 25, 9, 0)
+
+
+class Row:
+    def __init__(self, **values):
+        self.__dict__.update(values)
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def one_or_none(self):
+        return self.rows[0] if self.rows else None
+
+    def first(self):
+        return self.one_or_none()
+
+    def all(self):
+        return self.rows
+
+
+class FakeSession:
+    def __init__(self, rows=()):
+        self.rows = list(rows)
+        self.statements = []
+        self.added = []
+
+    def add(self, instance):
+        self.added.append(instance)
+
+    async def flush(self):
+        pass
+
+    async def execute(self, statement, parameters=None):
+        self.statements.append(str(statement.compile(dialect=postgresql.dialect())))
+        return FakeResult(self.rows)
+
+    def begin(self):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def publish(self, channel, message):
+        self.redis.pending.append((channel, message))
+
+    async def execute(self):
+        if self.redis.fail:
+            raise ConnectionError("Redis is down")
+        self.redis.published.extend(self.redis.pending)
+
+
+class FakeRedis:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.pending = []
+        self.published = []
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+def appointment_row(appointment):
+    return Row(id=appointment.id, datetime=appointment.datetime, doctor_id=appointment.doctor_id,
+               user_id=appointment.user_id, room_id=appointment.room_id,
+               duration_minutes=appointment.duration_minutes)
+
+
+def outbox_row(event_id, event_type=APPOINTMENT_CREATED):
+    return Row(id=event_id, event_type=event_type, aggregate_id=uuid4(), payload={"room_id": "1"},
+               created_at=datetime.now(timezone.utc), lag=0.02)
+
+
+def create_appointment():
+    return Appointment(datetime=START, doctor_id=uuid4(), user_id=uuid4(), room_id=uuid4())
+
+
+@pytest.mark.asyncio
+async def test_add_writes_created_event_in_the_same_flush():
+    session = FakeSession()
+    appointment = create_appointment()
+
+    await PostgresAppointmentRepository(session).add(appointment)
+
+    event = session.added[1]
+    assert isinstance(event, OutboxEventORM)
+    assert event.event_type == APPOINTMENT_CREATED and event.aggregate_id == appointment.id
+    assert event.payload["doctor_id"] == str(appointment.doctor_id)
+    assert json.dumps(event.payload)
+
+@pytest.mark.asyncio
+async def test_update_and_delete_write_events_only_for_existing_rows():
+    appointment = create_appointment()
+    previous_doctor_id = uuid4()
+    row = appointment_row(appointment)
+    row.previous_doctor_id, row.previous_room_id = previous_doctor_id, appointment.room_id
+    session = FakeSession([row])
+    repository = PostgresAppointmentRepository(session)
+
+    await repository.update(str(appointment.id), doctor_id=appointment.doctor_id)
+    assert await repository.delete(str(appointment.id)) is True
+
+    assert [event.event_type for event in session.added] == [APPOINTMENT_UPDATED, APPOINTMENT_DELETED]
+    # The old doctor and room come from the locked row, in the same statement
+    assert "FOR UPDATE" in session.statements[0] and "previous_doctor_id" in session.statements[0]
+    assert session.added[0].payload["previous_doctor_id"] == str(previous_doctor_id)
+    assert session.added[0].payload["previous_room_id"] == str(appointment.room_id)
+    assert session.added[1].payload["room_id"] == str(appointment.room_id)
+
+    missing = FakeSession()
+    assert await PostgresAppointmentRepository(missing).delete(str(uuid4())) is False
+    assert missing.added == []
+
+@pytest.mark.asyncio
+async def test_dispatch_publishes_then_deletes_the_locked_batch():
+    session = FakeSession([outbox_row(1), outbox_row(2, APPOINTMENT_DELETED)])
+    redis = FakeRedis()
+    received = []
+    dispatcher = OutboxDispatcher(lambda: session, redis, batch_size=10)
+    dispatcher.subscribe(received.append)
+
+    assert await dispatcher.dispatch_batch() == 2
+
+    assert "FOR UPDATE SKIP LOCKED" in session.statements[0]
+    assert session.statements[1].startswith("DELETE FROM outbox_events")
+    assert [event.id for event in received] == [1, 2]
+    assert [json.loads(message)["type"] for _, message in redis.published] == [APPOINTMENT_CREATED, APPOINTMENT_DELETED]
+    snapshot = dispatcher.snapshot()
+    assert snapshot["dispatched"] == 2 and snapshot["lag_ms"]["count"] == 2
+
+@pytest.mark.asyncio
+async def test_redis_failure_keeps_the_batch_for_a_retry():
+    session = FakeSession([outbox_row(1)])
+    received = []
+    dispatcher = OutboxDispatcher(lambda: session, FakeRedis(fail=True))
+    dispatcher.subscribe(received.append)
+
+    with pytest.raises(ConnectionError):
+        await dispatcher.dispatch_batch()
+
+    assert len(session.statements) == 1
+    assert received == []
+
+@pytest.mark.asyncio
+async def test_failing_handler_does_not_block_others():
+    session = FakeSession([outbox_row(1)])
+    received = []
+    dispatcher = OutboxDispatcher(lambda: session)
+
+    async def broken(event):
+        raise ValueError("boom")
+    dispatcher.subscribe(broken)
+    dispatcher.subscribe(received.append)
+
+    assert await dispatcher.dispatch_batch() == 1
+    assert len(received) == 1
+    assert dispatcher.snapshot()["handler_errors"] == 1
+
+def test_event_round_trips_through_json():
+    event = DomainEvent(APPOINTMENT_CREATED, uuid4(), {"doctor_id": "d"}, id=7)
+
+    assert DomainEvent.from_dict(json.loads(json.dumps(event.to_dict()))) == event
@@ -0,0 +1,60 @@
+import pytest
+from datetime import datetime
+from uuid import UUID, uuid4
+from sqlalchemy.dialects import postgresql
+
+from app.adapters.postgres_appointment_repository import PostgresAppointmentRepository
+from app.repository.pagination import build_page, decode_cursor, encode_cursor
+from app.use_cases.exceptions import InvalidCursorError
+
+
+class FakeResult:
+    def scalars(self):
+        return self
+
+    def all(self):
+        return []
+
+
+class CapturingSession:
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+        return FakeResult()
+
+
+def test_cursor_round_trip():
+    moment = datetime(2024, 12, 25, 10, 30)
+    appointment_id = uuid4()
+
+    cursor = encode_cursor(moment, appointment_id)
+
+    assert decode_cursor(cursor, datetime.fromisoformat, UUID) == (moment, appointment_id)
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", encode_cursor("only-one-value"), encode_cursor("x", "not-a-uuid")])
+def test_invalid_cursor(cursor):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor, str, UUID)
+
+def test_build_page_sets_cursor_only_when_more_rows_exist():
+    page = build_page([1, 2, 3], limit=2, sort_key=lambda item: (item,))
+    assert page.items == [1, 2]
+    assert decode_cursor(page.next_cursor, int) == (2,)
+
+    last_page = build_page([1, 2], limit=2, sort_key=lambda item: (item,))
+    assert last_page.items == [1, 2]
+    assert last_page.next_cursor is None
+
+@pytest.mark.asyncio
+async def test_list_page_uses_keyset_instead_of_offset():
+    session = CapturingSession()
+    repository = PostgresAppointmentRepository(session)
+
+    await repository.list_page(limit=50, cursor=encode_cursor(datetime(2024, 1, 1), uuid4()))
+
+    sql = str(session.statements[0].compile(dialect=postgresql.dialect()))
+    assert "OFFSET" not in sql
+    assert "(appointments.datetime, appointments.id) >" in sql
+    assert "ORDER BY appointments.datetime, appointments.id" in sql
@@ -0,0 +1,82 @@
+import asyncio
+import threading
+import time
+import pytest
+
+import app.adapters.password_hasher as password_hasher_module
+from app.adapters.password_hasher import PooledPasswordHasher, SHA256PasswordHasher
+from app.domain.entities.user import User
+from app.use_cases.auth import AuthService
+
+
+class MockUserRepository:
+    def __init__(self, user):
+        self.user = user
+        self.updates = []
+
+    async def get_by_email(self, email):
+        return self.user if email == self.user.email else None
+
+    async def update(self, user_id, **updates):
+        self.updates.append(updates)
+        return self.user
+
+
+@pytest.fixture
+def hasher():
+    hasher = PooledPasswordHasher(workers=2)
+    yield hasher
+    hasher.close()
+
+
+@pytest.mark.asyncio
+async def test_hash_round_trip(hasher):
+    hashed = await hasher.hash("secret")
+
+    assert hashed.startswith("$pbkdf2-sha256$")
+    assert await hasher.verify("secret", hashed)
+    assert not await hasher.verify("wrong", hashed)
+    assert not await hasher.verify("secret", "not a hash")
+    assert not hasher.needs_rehash(hashed)
+
+@pytest.mark.asyncio
+async def test_legacy_hash_verifies_and_is_replaced(hasher):
+    legacy = await SHA256PasswordHasher().hash("secret")
+
+    assert hasher.needs_rehash(legacy)
+    verified, new_hash = await hasher.verify_and_update("secret", legacy)
+    assert verified and new_hash.startswith("$pbkdf2-sha256$")
+    assert await hasher.verify_and_update("wrong", legacy) == (False, None)
+
+@pytest.mark.asyncio
+async def test_concurrency_is_bounded_by_workers(hasher, monkeypatch):
+    running = peak = 0
+    lock = threading.Lock()
+
+    def slow_hash(scheme, password):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.02)
+        with lock:
+            running -= 1
+        return password
+    monkeypatch.setattr(password_hasher_module, "_hash", slow_hash)
+
+    assert await asyncio.gather(*(hasher.hash(str(i)) for i in range(8))) == [str(i) for i in range(8)]
+    assert peak == 2
+
+@pytest.mark.asyncio
+async def test_login_upgrades_outdated_hash(hasher):
+    user = User(name="John", surname="Doe", email="john@example.com",
+                hashed_password=await SHA256PasswordHasher().hash("secret"))
+    repository = MockUserRepository(user)
+    service = AuthService(repository, hasher)
+
+    await service.authenticate_user("john@example.com", "secret")
+    await service.authenticate_user("john@example.com", "secret")
+
+    assert len(repository.updates) == 1
+    assert user.hashed_password == repository.updates[0]["hashed_password"]
+    assert await hasher.verify("secret", user.hashed_password)
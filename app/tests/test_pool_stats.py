@@ -0,0 +1,71 @@
+import sqlite3
+import pytest
+from sqlalchemy import exc
+from sqlalchemy.pool import QueuePool
+from fastapi.testclient import TestClient
+
+from app.core.metrics import Histogram
+from app.infrastructure.database.pool import InstrumentedPoolMixin, pool_status
+from app.main import app
+
+
+class InstrumentedQueuePool(InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+def make_pool(**kwargs):
+    return InstrumentedQueuePool(lambda: sqlite3.connect(":memory:"), **kwargs)
+
+
+def test_histogram_buckets():
+    histogram = Histogram(buckets=(1, 10))
+    for value in (0.5, 1, 5, 50):
+        histogram.observe(value)
+
+    snapshot = histogram.snapshot()
+    assert snapshot["count"] == 4
+    assert snapshot["buckets"] == {"le_1": 2, "le_10": 1, "inf": 1}
+    assert snapshot["max"] == 50
+
+def test_pool_counts_checkouts_and_usage():
+    pool = make_pool(pool_size=2, max_overflow=1)
+
+    first = pool.connect()
+    second = pool.connect()
+    third = pool.connect()
+
+    status = pool_status(pool)
+    assert status["checked_out"] == 3
+    assert status["overflow"] == 1
+    assert status["checkouts"] == 3
+    assert status["checkout_wait_ms"]["count"] == 3
+
+    for connection in (first, second, third):
+        connection.close()
+    assert pool_status(pool)["checked_out"] == 0
+
+def test_pool_counts_checkout_timeouts():
+    pool = make_pool(pool_size=1, max_overflow=0, timeout=0.01)
+    connection = pool.connect()
+
+    with pytest.raises(exc.TimeoutError):
+        pool.connect()
+
+    status = pool_status(pool)
+    assert status["checkout_timeouts"] == 1
+    assert status["checkouts"] == 1
+    connection.close()
+
+def test_statistics_survive_recreate():
+    pool = make_pool(pool_size=1)
+    pool.connect().close()
+
+    recreated = pool.recreate()
+    assert recreated.statistics is pool.statistics
+    assert pool_status(recreated)["checkouts"] == 1
+
+def test_db_pool_endpoint():
+    client = TestClient(app)
+    response = client.get("/health/db-pool")
+    assert response.status_code == 200
+    assert "checked_out" in response.json()["primary"]
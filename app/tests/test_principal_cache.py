@@ -0,0 +1,189 @@
+import pytest
+from uuid import uuid4, UUID
+from fastapi.security import HTTPAuthorizationCredentials
+
+from app.adapters.password_hasher import SHA256PasswordHasher
+from app.api import auth
+from app.core.principal_cache import ALL, INVALIDATION_CHANNEL, PrincipalCache, PrincipalInvalidator
+from app.domain.entities.user import User, UserRole
+from app.use_cases.update_user import UpdateUser
+from app.use_cases.delete_user import DeleteUser
+from app.domain.interfaces.unit_of_work import NullUnitOfWork
+
+
+def create_user(**kwargs):
+    return User(name="John", surname="Doe", email="john@example.com", hashed_password="hashed", **kwargs)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class MockUserRepository:
+    def __init__(self, *users):
+        self.users = {user.id: user for user in users}
+        self.gets = 0
+
+    async def get(self, **filters):
+        self.gets += 1
+        return self.users.get(filters.get('id'))
+
+    async def update(self, user_id: str, **updates):
+        user = self.users.get(UUID(user_id))
+        if user:
+            for key, value in updates.items():
+                setattr(user, key, value)
+        return user
+
+    async def delete(self, user_id: str) -> bool:
+        return self.users.pop(UUID(user_id), None) is not None
+
+
+class FakeRedis:
+    def __init__(self):
+        self.published = []
+        self.values = {}
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def incr(self, key):
+        self.commands.append(lambda: self.redis.values.update({key: self.redis.values.get(key, 0) + 1}))
+
+    def publish(self, channel, message):
+        self.commands.append(lambda: self.redis.published.append((channel, message)))
+
+    async def execute(self):
+        for command in self.commands:
+            command()
+
+
+class FailingUnitOfWork(NullUnitOfWork):
+    async def commit(self):
+        raise RuntimeError("commit failed")
+
+
+def test_entries_expire_after_ttl():
+    clock = Clock()
+    cache = PrincipalCache(ttl_seconds=10, clock=clock)
+    user = create_user()
+    cache.put(user)
+
+    clock.now = 9.9
+    assert cache.get(user.id) is user
+    clock.now = 10
+    assert cache.get(user.id) is None
+    assert len(cache) == 0
+
+def test_least_recently_used_entry_is_evicted():
+    cache = PrincipalCache(max_size=2)
+    first, second, third = create_user(), create_user(), create_user()
+    cache.put(first)
+    cache.put(second)
+    cache.get(first.id)
+    cache.put(third)
+
+    assert cache.get(second.id) is None
+    assert cache.get(first.id) is first and cache.get(third.id) is third
+
+def test_zero_size_disables_the_cache():
+    cache = PrincipalCache(max_size=0)
+    user = create_user()
+    cache.put(user)
+
+    assert cache.get(user.id) is None
+
+def test_apply_handles_ids_wildcard_and_garbage():
+    cache = PrincipalCache()
+    first, second = create_user(), create_user()
+    cache.put(first)
+    cache.put(second)
+
+    cache.apply(str(first.id))
+    assert cache.get(first.id) is None and cache.get(second.id) is second
+    cache.apply("not-a-uuid")
+    cache.apply(ALL)
+    assert len(cache) == 0
+
+@pytest.mark.asyncio
+async def test_current_user_is_loaded_once(monkeypatch):
+    user = create_user(role=UserRole.admin)
+    repository = MockUserRepository(user)
+    cache = PrincipalCache()
+    monkeypatch.setattr(auth, "principal_cache", cache)
+
+    async def verify_token(token):
+        return str(user.id)
+    monkeypatch.setattr(auth, "verify_token", verify_token)
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials="token")
+
+    for _ in range(3):
+        assert await auth.get_current_user(credentials, repository) is user
+    assert repository.gets == 1
+
+@pytest.mark.asyncio
+async def test_role_change_invalidates_after_commit():
+    user = create_user()
+    cache = PrincipalCache()
+    cache.put(user)
+    redis = FakeRedis()
+    update_user = UpdateUser(MockUserRepository(user), SHA256PasswordHasher(), NullUnitOfWork(), PrincipalInvalidator(cache, redis))
+
+    await update_user(user.id, role=UserRole.admin)
+
+    assert cache.get(user.id) is None
+    assert redis.published == [(INVALIDATION_CHANNEL, str(user.id))]
+    assert redis.values == {f"security_version:{user.id}": 1}
+
+@pytest.mark.asyncio
+async def test_profile_change_keeps_cached_principal():
+    user = create_user()
+    cache = PrincipalCache()
+    cache.put(user)
+    redis = FakeRedis()
+    update_user = UpdateUser(MockUserRepository(user), SHA256PasswordHasher(), NullUnitOfWork(), PrincipalInvalidator(cache, redis))
+
+    await update_user(user.id, name="Jane")
+
+    assert cache.get(user.id) is user
+    assert redis.published == []
+
+@pytest.mark.asyncio
+async def test_failed_commit_does_not_invalidate():
+    user = create_user()
+    cache = PrincipalCache()
+    cache.put(user)
+    update_user = UpdateUser(MockUserRepository(user), SHA256PasswordHasher(), FailingUnitOfWork(), PrincipalInvalidator(cache, FakeRedis()))
+
+    with pytest.raises(RuntimeError):
+        await update_user(user.id, disabled=True)
+
+    assert cache.get(user.id) is user
+
+@pytest.mark.asyncio
+async def test_delete_invalidates_everywhere():
+    user = create_user()
+    cache = PrincipalCache()
+    cache.put(user)
+    redis = FakeRedis()
+
+    await DeleteUser(MockUserRepository(user), NullUnitOfWork(), PrincipalInvalidator(cache, redis))(user.id)
+
+    assert cache.get(user.id) is None
+    assert redis.published == [(INVALIDATION_CHANNEL, str(user.id))]
@@ -0,0 +1,75 @@
+import time
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, delete, select, update
+
+from app.api.middleware import LAST_WRITE_COOKIE, read_your_writes_middleware
+from app.infrastructure.database.models import DoctorORM
+from app.infrastructure.database.routing import RoutingSession, use_primary
+
+primary = create_engine("sqlite://")
+replica = create_engine("sqlite://")
+
+
+def make_session(replicas=(replica,)):
+    return RoutingSession(primary=primary, replicas=replicas)
+
+
+def test_select_goes_to_replica():
+    session = make_session()
+    assert session.get_bind(clause=select(DoctorORM)) is replica
+
+def test_writes_go_to_primary():
+    session = make_session()
+    assert session.get_bind(clause=update(DoctorORM).values(age=1)) is primary
+    assert make_session().get_bind(clause=delete(DoctorORM)) is primary
+
+def test_select_for_update_goes_to_primary():
+    session = make_session()
+    assert session.get_bind(clause=select(DoctorORM).with_for_update()) is primary
+
+def test_session_reads_its_own_writes():
+    session = make_session()
+    session.get_bind(clause=update(DoctorORM).values(age=1))
+    assert session.get_bind(clause=select(DoctorORM)) is primary
+
+def test_pinned_context_uses_primary():
+    session = make_session()
+    token = use_primary.set(True)
+    try:
+        assert session.get_bind(clause=select(DoctorORM)) is primary
+    finally:
+        use_primary.reset(token)
+
+def test_without_replicas_everything_uses_primary():
+    session = make_session(replicas=())
+    assert session.get_bind(clause=select(DoctorORM)) is primary
+
+
+app = FastAPI()
+app.middleware("http")(read_your_writes_middleware)
+
+@app.get("/pinned")
+async def pinned():
+    return {"primary": use_primary.get()}
+
+@app.post("/write")
+async def write():
+    return {"primary": use_primary.get()}
+
+
+def test_middleware_pins_writes_and_sets_cookie():
+    client = TestClient(app)
+    response = client.post("/write")
+    assert response.json() == {"primary": True}
+    assert LAST_WRITE_COOKIE in response.cookies
+
+def test_middleware_pins_reads_after_recent_write():
+    client = TestClient(app)
+    assert client.get("/pinned").json() == {"primary": False}
+
+    client.cookies.set(LAST_WRITE_COOKIE, str(time.time()))
+    assert client.get("/pinned").json() == {"primary": True}
+
+    client.cookies.set(LAST_WRITE_COOKIE, str(time.time() - 3600))
+    assert client.get("/pinned").json() == {"primary": False}
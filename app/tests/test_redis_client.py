@@ -0,0 +1,71 @@
+import asyncio
+import pytest
+from redis.exceptions import ConnectionError
+
+import app.infrastructure.redis as redis_module
+from app.core.config import settings
+from app.core.token_storage import TokenStorage
+from app.infrastructure.redis import (
+    InstrumentedConnectionPool, InstrumentedRedis, close_redis, create_redis, get_redis, redis_status, statistics
+)
+
+
+class OfflinePool(InstrumentedConnectionPool):
+    """Hands out connections without opening sockets"""
+
+    async def ensure_connection(self, connection):
+        pass
+
+
+@pytest.fixture
+def shared_client(monkeypatch):
+    monkeypatch.setattr(redis_module, "redis_client", None)
+
+
+def test_client_is_built_from_settings():
+    client = create_redis()
+    pool = client.connection_pool
+
+    assert isinstance(client, InstrumentedRedis)
+    assert pool.max_connections == settings.redis_max_connections
+    assert pool.timeout == settings.redis_pool_timeout
+    assert pool.connection_kwargs["socket_timeout"] == settings.redis_socket_timeout
+    assert pool.connection_kwargs["socket_connect_timeout"] == settings.redis_socket_connect_timeout
+    assert pool.connection_kwargs["health_check_interval"] == settings.redis_health_check_interval
+    assert pool.connection_kwargs["retry_on_timeout"] is True
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_client(shared_client):
+    clients = await asyncio.gather(*(get_redis() for _ in range(10)))
+
+    assert len({id(client) for client in clients}) == 1
+    assert await TokenStorage()._get_redis() is clients[0]
+    assert redis_status()["max_connections"] == settings.redis_max_connections
+    await close_redis()
+    assert redis_status()["connected"] is False
+
+@pytest.mark.asyncio
+async def test_exhausted_pool_waits_then_times_out():
+    pool = OfflinePool(max_connections=1, timeout=0.05)
+    timeouts = statistics.checkout_timeouts
+
+    connection = await pool.get_connection("GET")
+    with pytest.raises(ConnectionError):
+        await pool.get_connection("GET")
+    await pool.release(connection)
+    assert await pool.get_connection("GET") is connection
+
+    assert statistics.checkout_timeouts == timeouts + 1
+    assert statistics.checkout_wait_ms.snapshot()["max"] >= 50
+
+@pytest.mark.asyncio
+async def test_failed_commands_are_timed_and_counted():
+    client = InstrumentedRedis(host="127.0.0.1", port=1, socket_connect_timeout=0.1)
+    errors = statistics.errors
+
+    with pytest.raises(ConnectionError):
+        await client.get("key")
+    await client.aclose()
+
+    assert statistics.errors == errors + 1
+    assert statistics.commands["GET"].snapshot()["count"] >= 1
@@ -0,0 +1,100 @@
+import json
+import pytest
+from datetime import datetime, timezone
+from uuid import uuid4
+from fastapi.testclient import TestClient
+from pydantic import BaseModel, Field, ValidationError, computed_field
+
+from app.main import app
+from app.api.dependencies import list_rooms_use_case
+from app.api.routers.appoointments import appointment_list
+from app.api.routers.doctors import doctor_list
+from app.api.routers.schema import DoctorResponse, RoomItem
+from app.api.serialization import ListSerializer
+from app.domain.entities.appointment import Appointment
+from app.domain.entities.doctor import CategoryEnum, Doctor
+from app.domain.entities.room import Room
+from app.repository.pagination import Page
+
+
+def create_doctor(**kwargs):
+    values = dict(name="Jöhn", surname="Doe", age=30, specialization="GP",
+                  category=CategoryEnum.FIRST, password="hashed")
+    values.update(kwargs)
+    return Doctor(**values)
+
+
+def model_path(schema, items) -> list:
+    """What response_model validation followed by serialization returns"""
+    return [json.loads(schema.model_validate(item, from_attributes=True).model_dump_json()) for item in items]
+
+
+class MockListRooms:
+    def __init__(self, rooms):
+        self.rooms = rooms
+
+    async def __call__(self, skip=0, limit=100):
+        return self.rooms[skip:skip + limit]
+
+    async def page(self, limit=100, cursor=None):
+        return Page(self.rooms[:limit], next_cursor="next")
+
+    async def version(self):
+        return len(self.rooms), 1
+
+
+def test_trusted_output_matches_response_model():
+    doctors = [create_doctor(experience_years=index) for index in range(3)]
+    appointments = [
+        Appointment(datetime=datetime(2025, 1, 1, 9, 0, 0, 5), doctor_id=uuid4(), user_id=uuid4(), room_id=uuid4()),
+        Appointment(datetime=datetime(2025, 1, 1, 9, 0, tzinfo=timezone.utc), doctor_id=uuid4(), user_id=uuid4(), room_id=uuid4()),
+    ]
+
+    assert json.loads(doctor_list.dump_json(doctors, validate=False)) == model_path(DoctorResponse, doctors)
+    assert doctor_list.dump_json(doctors, validate=False) == doctor_list.dump_json(doctors, validate=True)
+    assert appointment_list.dump_json(appointments, validate=False) == appointment_list.dump_json(appointments, validate=True)
+    assert b"password" not in doctor_list.dump_json(doctors)
+
+def test_validation_can_be_switched_on():
+    broken = [create_doctor(age="thirty")]
+
+    assert json.loads(doctor_list.dump_json(broken, validate=False))[0]["age"] == "thirty"
+    with pytest.raises(ValidationError):
+        doctor_list.dump_json(broken, validate=True)
+
+def test_schemas_with_custom_serialization_are_rejected():
+    class WithComputed(BaseModel):
+        name: str
+
+        @computed_field
+        def upper(self) -> str:
+            return self.name.upper()
+
+    with pytest.raises(ValueError):
+        ListSerializer(WithComputed)
+
+def test_aliases_and_excluded_fields_are_honoured():
+    class Schema(BaseModel):
+        number: int = Field(serialization_alias="no", alias="no")
+        secret: str = Field(exclude=True)
+
+    class Entity:
+        number, secret = 7, "x"
+
+    assert ListSerializer(Schema).dump_json([Entity()]) == b'[{"no":7}]'
+
+def test_list_endpoint_returns_serialized_page_with_cursor():
+    rooms = [Room(number=index) for index in range(3)]
+    app.dependency_overrides[list_rooms_use_case] = lambda: MockListRooms(rooms)
+    try:
+        client = TestClient(app)
+        response = client.get("/api/v1/rooms")
+        legacy = client.get("/api/v1/rooms", params={"skip": 1})
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.headers["X-Next-Cursor"] == "next"
+    assert response.json() == model_path(RoomItem, rooms)
+    assert [room["number"] for room in legacy.json()] == [1, 2]
@@ -0,0 +1,112 @@
+import pytest
+from datetime import time
+from uuid import uuid4
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
+
+from app.adapters.postgres_doctor_repository import PostgresDoctorRepository
+from app.adapters.postgres_user_repository import PostgresUserRepository
+from app.adapters.postgres_doctor_repository import DatabaseException
+from app.domain.entities.doctor import CategoryEnum
+from app.use_cases.exceptions import InvalidDoctorDataError
+
+
+class Row:
+    def __init__(self, **values):
+        self.__dict__.update(values)
+
+
+class FakeResult:
+    def __init__(self, row):
+        self.row = row
+
+    def one_or_none(self):
+        return self.row
+
+    def first(self):
+        return self.row
+
+
+class CapturingSession:
+    def __init__(self, row=None):
+        self.row = row
+        self.statements = []
+
+    async def execute(self, statement):
+        self.statements.append(str(statement.compile(dialect=postgresql.dialect())))
+        return FakeResult(self.row)
+
+
+class FakeAsyncpgError(Exception):
+    def __init__(self, constraint_name):
+        self.constraint_name = constraint_name
+
+
+class FakeDriverError(Exception):
+    def __init__(self, sqlstate, constraint_name=None):
+        self.sqlstate = sqlstate
+        self.__cause__ = FakeAsyncpgError(constraint_name)
+
+
+class FailingSession:
+    def __init__(self, error):
+        self.error = error
+
+    async def execute(self, statement):
+        raise IntegrityError("UPDATE doctors ...", {}, self.error)
+
+
+def doctor_row(doctor_id, **overrides):
+    values = dict(id=doctor_id, name="John", surname="Doe", age=30, specialization="GP",
+                  category=CategoryEnum.FIRST, password="secret", experience_years=5,
+                  work_start=time(9, 0), work_end=time(17, 0), version=1)
+    values.update(overrides)
+    return Row(**values)
+
+
+@pytest.mark.asyncio
+async def test_update_is_a_single_update_returning():
+    doctor_id = uuid4()
+    session = CapturingSession(doctor_row(doctor_id, age=41))
+
+    doctor = await PostgresDoctorRepository(session).update(str(doctor_id), age=41, name=None)
+
+    assert len(session.statements) == 1
+    assert session.statements[0].startswith("UPDATE doctors SET age=")
+    assert "RETURNING" in session.statements[0]
+    assert "name=" not in session.statements[0]
+    assert doctor.id == doctor_id and doctor.age == 41
+
+@pytest.mark.asyncio
+async def test_update_past_stored_working_hours_is_invalid_data():
+    # e.g. only work_end sent, earlier than the stored work_start
+    session = FailingSession(FakeDriverError("23514", "doctors_working_hours_order"))
+
+    with pytest.raises(InvalidDoctorDataError) as error:
+        await PostgresDoctorRepository(session).update(str(uuid4()), work_end=time(8, 0))
+    assert error.value.status_code == 400
+
+    with pytest.raises(DatabaseException):
+        await PostgresDoctorRepository(FailingSession(FakeDriverError("23505"))).update(str(uuid4()), age=41)
+
+@pytest.mark.asyncio
+async def test_update_of_missing_row_returns_none():
+    session = CapturingSession(row=None)
+
+    assert await PostgresUserRepository(session).update(str(uuid4()), name="Jane") is None
+    assert len(session.statements) == 1
+
+@pytest.mark.asyncio
+async def test_delete_is_a_single_delete_returning():
+    session = CapturingSession(Row(id=uuid4()))
+
+    assert await PostgresDoctorRepository(session).delete(str(uuid4())) is True
+    assert len(session.statements) == 1
+    assert session.statements[0].startswith("DELETE FROM doctors")
+    assert "RETURNING doctors.id" in session.statements[0]
+
+@pytest.mark.asyncio
+async def test_delete_of_missing_row_returns_false():
+    session = CapturingSession(row=None)
+
+    assert await PostgresDoctorRepository(session).delete(str(uuid4())) is False
@@ -0,0 +1,179 @@
+import time
+import pytest
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import app.core.token_storage as token_storage_module
+from app.core.revocation_filter import (
+    BACKFILL_KEY, INDEX_KEY, REVOKED_CHANNEL, BloomFilter, RevocationFilter, token_fingerprint
+)
+from app.core.token_storage import TokenStorage
+
+
+class FakeRedis:
+    def __init__(self, index=None):
+        self.index = dict(index or {})
+        self.values = {}
+        self.published = []
+        self.lookups = 0
+        self.ttls = {}
+
+    async def zrangebyscore(self, key, minimum, maximum):
+        return [member for member, score in self.index.items() if score >= minimum]
+
+    async def zremrangebyscore(self, key, minimum, maximum):
+        self.index = {member: score for member, score in self.index.items() if score > maximum}
+
+    async def exists(self, key):
+        self.lookups += 1
+        return int(key in self.values)
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value):
+        self.values[key] = value
+
+    async def zadd(self, key, mapping):
+        assert key == INDEX_KEY
+        self.index.update(mapping)
+
+    async def scan_iter(self, match=None, count=None):
+        for key in list(self.values):
+            if key.startswith(match.rstrip("*")):
+                yield key
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.results = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def setex(self, key, ttl, value):
+        self.redis.values[key] = value
+
+    def ttl(self, key):
+        self.results.append(self.redis.ttls.get(key, -1))
+
+    def zadd(self, key, mapping):
+        assert key == INDEX_KEY
+        self.redis.index.update(mapping)
+
+    def publish(self, channel, message):
+        self.redis.published.append((channel, message))
+
+    async def execute(self):
+        return self.results
+
+
+def fingerprints(count):
+    return [token_fingerprint(uuid4().hex) for _ in range(count)]
+
+
+def test_bloom_filter_has_no_false_negatives_and_bounded_false_positives():
+    bloom = BloomFilter(capacity=10_000, error_rate=0.01)
+    members = fingerprints(10_000)
+    for fingerprint in members:
+        bloom.add(fingerprint)
+
+    assert all(fingerprint in bloom for fingerprint in members)
+    false_positives = sum(fingerprint in bloom for fingerprint in fingerprints(10_000))
+    assert false_positives < 300
+    assert bloom.expected_error_rate() == pytest.approx(0.01, rel=0.5)
+
+def test_filter_defers_to_redis_until_synced():
+    assert RevocationFilter().might_be_revoked("token") is True
+
+@pytest.mark.asyncio
+async def test_rebuild_loads_live_revocations_only():
+    redis = FakeRedis({token_fingerprint("revoked"): time.time() + 60, token_fingerprint("expired"): time.time() - 1})
+    revocations = RevocationFilter(capacity=100)
+
+    await revocations.rebuild(redis)
+
+    assert revocations.might_be_revoked("revoked") is True
+    assert revocations.might_be_revoked("expired") is False
+    assert revocations.might_be_revoked("other") is False
+    assert list(redis.index) == [token_fingerprint("revoked")]
+
+@pytest.mark.asyncio
+async def test_first_rebuild_indexes_revocations_from_before_the_index():
+    redis = FakeRedis()
+    redis.values.update({"blacklist:old": "revoked", "blacklist:no-ttl": "revoked", "refresh_token:1": "x"})
+    redis.ttls["blacklist:old"] = 600
+    revocations = RevocationFilter(capacity=100)
+
+    await revocations.rebuild(redis)
+
+    assert revocations.might_be_revoked("old") is True
+    assert list(redis.index) == [token_fingerprint("old")]
+    assert redis.values[BACKFILL_KEY]
+
+    # Done once: later rebuilds only read the index
+    redis.values["blacklist:later"] = "revoked"
+    redis.ttls["blacklist:later"] = 600
+    assert await revocations.backfill(redis) == 0
+
+def test_messages_are_added_with_their_sync_lag():
+    revocations = RevocationFilter(capacity=100)
+    revocations.ready = True
+
+    revocations.apply(f"{token_fingerprint('revoked')} {time.time() - 0.02}")
+    revocations.apply("garbage not-a-time")
+
+    assert revocations.might_be_revoked("revoked") is True
+    lag = revocations.snapshot()["sync_lag_ms"]
+    assert lag["count"] == 1 and lag["max"] >= 20
+
+@pytest.mark.asyncio
+async def test_negative_answer_skips_redis(monkeypatch):
+    revocations = RevocationFilter(capacity=100)
+    await revocations.rebuild(FakeRedis())
+    monkeypatch.setattr(token_storage_module, "revocation_filter", revocations)
+    storage = TokenStorage()
+    storage.redis = redis = FakeRedis()
+
+    assert await storage.is_token_blacklisted("token") is False
+    assert redis.lookups == 0
+
+@pytest.mark.asyncio
+async def test_revocation_is_local_immediately_and_announced(monkeypatch):
+    revocations = RevocationFilter(capacity=100)
+    await revocations.rebuild(FakeRedis())
+    monkeypatch.setattr(token_storage_module, "revocation_filter", revocations)
+    storage = TokenStorage()
+    storage.redis = redis = FakeRedis()
+
+    await storage.store_blacklisted_token("token", datetime.utcnow() + timedelta(minutes=5))
+
+    assert await storage.is_token_blacklisted("token") is True
+    assert redis.lookups == 1
+    assert token_fingerprint("token") in redis.index
+    channel, message = redis.published[0]
+    assert channel == REVOKED_CHANNEL and message.startswith(token_fingerprint("token"))
+
+@pytest.mark.asyncio
+async def test_false_positives_are_counted(monkeypatch):
+    revocations = RevocationFilter(capacity=100)
+    await revocations.rebuild(FakeRedis())
+    # Revoked locally, but the blacklist entry is gone: Redis says no
+    revocations.add(token_fingerprint("token"))
+    monkeypatch.setattr(token_storage_module, "revocation_filter", revocations)
+    storage = TokenStorage()
+    storage.redis = FakeRedis()
+
+    assert await storage.is_token_blacklisted("token") is False
+    assert await storage.is_token_blacklisted("other") is False
+
+    snapshot = revocations.snapshot()
+    assert snapshot["false_positives"] == 1 and snapshot["skipped"] == 1
+    assert snapshot["false_positive_rate"] == 0.5
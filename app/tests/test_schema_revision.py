@@ -0,0 +1,46 @@
+import pytest
+
+from app.infrastructure.database.models import AppointmentORM
+from app.infrastructure.database.schema import SchemaOutOfDateError, check_schema_revision, expected_revisions
+
+
+class FakeConnection:
+    def __init__(self, heads):
+        self.heads = heads
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    async def run_sync(self, fn):
+        return set(self.heads)
+
+
+class FakeEngine:
+    def __init__(self, heads):
+        self.heads = heads
+
+    def connect(self):
+        return FakeConnection(self.heads)
+
+
+def test_migrations_have_a_single_head():
+    assert len(expected_revisions()) == 1
+
+@pytest.mark.asyncio
+async def test_up_to_date_schema_passes():
+    heads = expected_revisions()
+    assert await check_schema_revision(FakeEngine(heads)) == ", ".join(sorted(heads))
+
+@pytest.mark.asyncio
+async def test_unmigrated_schema_fails():
+    with pytest.raises(SchemaOutOfDateError, match="alembic upgrade head"):
+        await check_schema_revision(FakeEngine([]))
+
+def test_appointment_foreign_keys_are_indexed():
+    indexed = {tuple(column.name for column in index.columns) for index in AppointmentORM.__table__.indexes}
+    assert ("doctor_id", "datetime") in indexed
+    assert ("room_id", "datetime") in indexed
+    assert ("user_id", "datetime") in indexed
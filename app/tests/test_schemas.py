@@ -1,9 +1,10 @@
 import pytest
 from pydantic import ValidationError
-from datetime import datetime
+from datetime import datetime, time
 from uuid import uuid4
 from app.api.routers.schema import (
     DoctorItemCreate, 
+    DoctorItemUpdate, 
     UserItemCreate, 
     AppointmentItemCreate,
     CategoryEnum,
@@ -47,6 +48,13 @@ def test_doctor_item_create_short_name():
             password="password123"
         )
 
+def test_doctor_item_update_rejects_reversed_working_hours():
+    with pytest.raises(ValidationError):
+        DoctorItemUpdate(work_start=time(18, 0), work_end=time(9, 0))
+
+    # One bound alone is checked against the stored row by the database
+    assert DoctorItemUpdate(work_end=time(8, 0)).work_end == time(8, 0)
+
 def test_user_item_create_valid():
     user_data = {
         "name": "Jane",
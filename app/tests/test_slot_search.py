@@ -0,0 +1,186 @@
+import pytest
+from datetime import datetime, time, timedelta, timezone
+from uuid import uuid4
+
+from app.domain.entities.appointment import Appointment
+from app.domain.entities.doctor import CategoryEnum, Doctor
+from app.domain.entities.room import Room
+from app.domain.interfaces.unit_of_work import NullUnitOfWork
+from app.domain.scheduling import IntervalSet, SlotIndex
+from app.repository.pagination import Page
+from app.use_cases.crud_appointment import CreateAppointment
+from app.use_cases.delete_appointment import DeleteAppointment
+from app.use_cases.exceptions import InvalidSlotSearchError, SlotIndexNotReadyError
+from app.use_cases.slot_search import FindFreeSlots, RefreshSlotIndex
+
+DAY = datetime.now().date() + timedelta(days=7)
+NINE = datetime.combine(DAY, time(9, 0))
+
+
+def create_doctor(specialization="Cardiology", **kwargs):
+    return Doctor(
+        name="John",
+        surname=f"D{uuid4().hex[:6]}",
+        age=40,
+        specialization=specialization,
+        category=CategoryEnum.FIRST,
+        password="secret",
+        **kwargs
+    )
+
+
+def book(doctor, room_id, start, minutes=30):
+    return Appointment(datetime=start, doctor_id=doctor.id, user_id=uuid4(), room_id=room_id, duration_minutes=minutes)
+
+
+class PagedRepository:
+    def __init__(self, items):
+        self.items = items
+
+    async def list_page(self, limit=100, cursor=None):
+        offset = int(cursor or 0)
+        chunk = self.items[offset:offset + limit]
+        next_cursor = str(offset + limit) if offset + limit < len(self.items) else None
+        return Page(chunk, next_cursor)
+
+
+class MockAppointmentRepository:
+    def __init__(self, appointments=()):
+        self.appointments = list(appointments)
+        self.stream_calls = 0
+
+    async def stream(self, date_from=None, date_to=None, doctor_id=None, batch_size=1000):
+        self.stream_calls += 1
+        for appointment in self.appointments:
+            yield appointment
+
+    async def add(self, appointment):
+        self.appointments.append(appointment)
+
+    async def delete(self, appointment_id):
+        return True
+
+
+def test_interval_set_gaps_and_is_free():
+    intervals = IntervalSet()
+    intervals.add(NINE + timedelta(hours=1), NINE + timedelta(hours=2), uuid4())
+    intervals.add(NINE, NINE + timedelta(minutes=30), uuid4())
+
+    gaps = list(intervals.gaps(NINE, NINE + timedelta(hours=3)))
+
+    assert gaps == [
+        (NINE + timedelta(minutes=30), NINE + timedelta(hours=1)),
+        (NINE + timedelta(hours=2), NINE + timedelta(hours=3)),
+    ]
+    assert intervals.is_free(NINE + timedelta(minutes=30), NINE + timedelta(hours=1))
+    assert not intervals.is_free(NINE + timedelta(minutes=45), NINE + timedelta(minutes=75))
+
+
+def test_find_returns_earliest_slots_across_doctors():
+    first, second = create_doctor(), create_doctor(work_start=time(8, 0))
+    room_id = uuid4()
+    index = SlotIndex(step_minutes=15)
+    index.load([first, second, create_doctor("Neurology")], [room_id], [])
+
+    slots = index.find("cardiology", NINE - timedelta(hours=2), NINE + timedelta(hours=8), timedelta(minutes=30), limit=2)
+    # Only the second doctor works before nine
+    assert [(slot.doctor_id, slot.start) for slot in slots] == [
+        (second.id, NINE - timedelta(hours=1)),
+        (second.id, NINE - timedelta(minutes=45)),
+    ]
+
+    slots = index.find("cardiology", NINE, NINE + timedelta(hours=8), timedelta(minutes=30), limit=2)
+    assert {slot.doctor_id for slot in slots} == {first.id, second.id}
+    assert {slot.start for slot in slots} == {NINE}
+    assert all(slot.room_id == room_id for slot in slots)
+
+
+def test_find_skips_busy_doctor_and_busy_rooms():
+    doctor = create_doctor()
+    rooms = [uuid4(), uuid4()]
+    other_doctor = create_doctor("Surgery")
+    index = SlotIndex()
+    index.load([doctor, other_doctor], rooms, [
+        book(doctor, rooms[0], NINE, minutes=45),
+        book(other_doctor, min(rooms), NINE + timedelta(minutes=45), minutes=60),
+    ])
+
+    slot, = index.find("Cardiology", NINE, NINE + timedelta(hours=8), timedelta(minutes=30), limit=1)
+
+    # Aligned to the 15 minute grid after the doctor's visit, in the room that is still free
+    assert slot.start == NINE + timedelta(minutes=45)
+    assert slot.room_id == max(rooms)
+
+
+def test_index_is_updated_incrementally():
+    doctor, room_id = create_doctor(), uuid4()
+    index = SlotIndex()
+    index.load([doctor], [room_id], [])
+    appointment = book(doctor, room_id, NINE)
+
+    index.add(appointment)
+    assert index.find("cardiology", NINE, NINE + timedelta(hours=1), timedelta(minutes=30))[0].start == NINE + timedelta(minutes=30)
+
+    index.remove(appointment.id)
+    assert index.find("cardiology", NINE, NINE + timedelta(hours=1), timedelta(minutes=30))[0].start == NINE
+
+
+@pytest.mark.asyncio
+async def test_use_cases_update_index_after_commit():
+    doctor, room_id = create_doctor(), uuid4()
+    index = SlotIndex()
+    index.load([doctor], [room_id], [])
+    repository = MockAppointmentRepository()
+    appointment = book(doctor, room_id, NINE)
+
+    await CreateAppointment(repository, NullUnitOfWork(), index)(appointment)
+    assert appointment.id in index.appointments
+
+    await DeleteAppointment(repository, NullUnitOfWork(), index)(appointment.id)
+    assert appointment.id not in index.appointments
+
+
+@pytest.mark.asyncio
+async def test_searches_read_the_index_the_refresh_built():
+    doctors = [create_doctor() for _ in range(3)]
+    rooms = [Room(number=number) for number in range(3)]
+    appointments = MockAppointmentRepository([book(doctors[0], rooms[0].id, NINE)])
+    index = SlotIndex()
+    use_case = FindFreeSlots(index)
+
+    with pytest.raises(SlotIndexNotReadyError):
+        await use_case("Cardiology", NINE, NINE + timedelta(hours=1))
+
+    await RefreshSlotIndex(index, PagedRepository(doctors), PagedRepository(rooms), appointments)()
+    slots = await use_case("Cardiology", NINE, NINE + timedelta(hours=1), limit=5)
+    # A stale index is still served; only the background refresh rebuilds it
+    index.loaded_at -= 3600
+    await use_case("Cardiology", NINE, NINE + timedelta(hours=1))
+
+    assert appointments.stream_calls == 1
+    assert len(slots) == 5
+    assert (doctors[0].id, NINE) not in {(slot.doctor_id, slot.start) for slot in slots}
+
+
+@pytest.mark.asyncio
+async def test_find_free_slots_rejects_oversized_window():
+    use_case = FindFreeSlots(SlotIndex(), max_window_days=7)
+
+    with pytest.raises(InvalidSlotSearchError):
+        await use_case("Cardiology", NINE, NINE + timedelta(days=8))
+
+
+@pytest.mark.asyncio
+async def test_find_free_slots_accepts_timezone_aware_bounds():
+    doctors = [create_doctor()]
+    rooms = [Room(number=1)]
+    index = SlotIndex()
+    await RefreshSlotIndex(index, PagedRepository(doctors), PagedRepository(rooms), MockAppointmentRepository())()
+    use_case = FindFreeSlots(index)
+    # e.g. ?date_from=...Z: the same instants as local NINE and NINE + 1h
+    date_from = NINE.astimezone(timezone.utc)
+
+    slots = await use_case("Cardiology", date_from, date_from + timedelta(hours=1))
+
+    assert slots[0].start == NINE
+    assert all(slot.start.tzinfo is None and slot.end <= NINE + timedelta(hours=1) for slot in slots)
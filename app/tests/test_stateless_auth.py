@@ -0,0 +1,166 @@
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from jose import jwt
+
+from app.api.auth import get_admin_user, get_current_user
+from app.core.config import settings
+from app.core.principal_cache import PrincipalCache
+from app.core.security import create_access_token
+from app.core.token_storage import security_version_key, token_storage
+from app.domain.entities.user import Principal, User, UserRole
+from app.use_cases.auth import AuthService
+import app.api.auth as auth
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def mget(self, *keys):
+        return [self.values.get(key) for key in keys]
+
+    async def setex(self, key, ttl, value):
+        self.values[key] = value
+
+    async def exists(self, key):
+        return key in self.values
+
+    async def delete(self, key):
+        self.values.pop(key, None)
+
+
+class AcceptingHasher:
+    async def verify_and_update(self, plain_password, hashed_password):
+        return True, None
+
+
+class DemotedDuringLoginRepository:
+    """The user is demoted, and the version bumped, right after the login lookup"""
+
+    def __init__(self, user, redis):
+        self.user = user
+        self.redis = redis
+
+    async def get_by_email(self, email):
+        loaded = User(**{**vars(self.user)})
+        self.user.role = UserRole.user
+        self.redis.values[security_version_key(str(self.user.id))] = "4"
+        return loaded
+
+    async def get(self, **filters):
+        return self.user
+
+
+class MockUserRepository:
+    def __init__(self, *users):
+        self.users = {user.id: user for user in users}
+        self.gets = 0
+
+    async def get(self, **filters):
+        self.gets += 1
+        return self.users.get(filters.get('id'))
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    redis = FakeRedis()
+    monkeypatch.setattr(token_storage, "redis", redis)
+    monkeypatch.setattr(settings, "stateless_auth", True)
+    monkeypatch.setattr(auth, "principal_cache", PrincipalCache(max_size=0))
+    return redis
+
+
+def create_user(**kwargs):
+    return User(name="John", surname="Doe", email="john@example.com", hashed_password="hashed", **kwargs)
+
+
+def bearer(token: str) -> HTTPAuthorizationCredentials:
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+async def access_token(user: User) -> str:
+    service = AuthService(MockUserRepository(user), password_hasher=None)
+    security_version = await token_storage.get_security_version(str(user.id))
+    return (await service.create_tokens(user, security_version))["access_token"]
+
+
+@pytest.mark.asyncio
+async def test_access_token_carries_role_and_version(redis):
+    user = create_user(role=UserRole.doctor)
+    redis.values[security_version_key(str(user.id))] = "3"
+
+    claims = jwt.decode(await access_token(user), settings.secret_key, algorithms=[settings.algorithm])
+
+    assert claims["role"] == "doctor" and claims["ver"] == 3
+
+@pytest.mark.asyncio
+async def test_principal_comes_from_claims_without_lookup(redis):
+    user = create_user(role=UserRole.admin)
+    repository = MockUserRepository(user)
+
+    principal = await get_current_user(bearer(await access_token(user)), repository)
+
+    assert principal == Principal(user.id, UserRole.admin)
+    assert await get_admin_user(principal) is principal
+    assert repository.gets == 0
+
+@pytest.mark.asyncio
+async def test_version_bump_revokes_outstanding_tokens(redis):
+    user = create_user(role=UserRole.admin)
+    token = await access_token(user)
+    redis.values[security_version_key(str(user.id))] = "1"
+
+    with pytest.raises(HTTPException) as error:
+        await get_current_user(bearer(token), MockUserRepository(user))
+    assert error.value.status_code == 401
+
+@pytest.mark.asyncio
+async def test_blacklisted_token_is_rejected(redis):
+    user = create_user()
+    token = await access_token(user)
+    redis.values[f"blacklist:{token}"] = "revoked"
+
+    with pytest.raises(HTTPException) as error:
+        await get_current_user(bearer(token), MockUserRepository(user))
+    assert error.value.status_code == 401
+
+@pytest.mark.asyncio
+async def test_token_without_claims_falls_back_to_lookup(redis):
+    user = create_user()
+    repository = MockUserRepository(user)
+    token = create_access_token(data={"sub": str(user.id)})
+
+    assert await get_current_user(bearer(token), repository) is user
+    assert repository.gets == 1
+
+@pytest.mark.asyncio
+async def test_disabled_user_cannot_refresh(redis, monkeypatch):
+    async def verify_refresh_token(token, user_id):
+        return True
+    monkeypatch.setattr("app.use_cases.auth.verify_refresh_token", verify_refresh_token)
+    user = create_user()
+    service = AuthService(MockUserRepository(user), password_hasher=None)
+    refresh_token = create_access_token(data={"sub": str(user.id)})
+
+    assert "access_token" in await service.refresh_access_token(refresh_token)
+
+    user.disabled = True
+    with pytest.raises(HTTPException) as error:
+        await service.refresh_access_token(refresh_token)
+    assert error.value.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_login_never_pairs_an_old_role_with_a_current_version(redis):
+    user = create_user(role=UserRole.admin)
+    redis.values[security_version_key(str(user.id))] = "3"
+    service = AuthService(DemotedDuringLoginRepository(user, redis), AcceptingHasher())
+
+    tokens = await service.login("john@example.com", "secret")
+
+    claims = jwt.decode(tokens["access_token"], settings.secret_key, algorithms=[settings.algorithm])
+    assert (claims["role"], claims["ver"]) == ("user", 4)
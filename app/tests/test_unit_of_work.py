@@ -0,0 +1,113 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.adapters.password_hasher import SHA256PasswordHasher
+from app.adapters.sqlalchemy_unit_of_work import SqlAlchemyUnitOfWork
+from app.api.middleware import COMMIT_COUNT_HEADER, commit_count_middleware
+from app.use_cases.crud_doctor import CreateDoctor
+from app.tests.utils import create_doctor
+
+
+class FakeTransaction:
+    def __init__(self, session):
+        self.session = session
+
+    async def __aenter__(self):
+        self.session.calls.append("savepoint")
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.session.calls.append("release" if exc_type is None else "rollback_to_savepoint")
+        return False
+
+
+class FakeSession:
+    def __init__(self):
+        self.calls = []
+
+    async def commit(self):
+        self.calls.append("commit")
+
+    async def rollback(self):
+        self.calls.append("rollback")
+
+    def begin_nested(self):
+        return FakeTransaction(self)
+
+
+class FailingDoctorRepository:
+    async def add(self, doctor):
+        raise RuntimeError("insert failed")
+
+
+@pytest.mark.asyncio
+async def test_commits_once_at_the_outermost_block():
+    session = FakeSession()
+    uow = SqlAlchemyUnitOfWork(session)
+
+    async with uow:
+        async with uow:
+            pass
+        assert session.calls == []
+
+    assert session.calls == ["commit"]
+    assert uow.commit_count == 1
+
+@pytest.mark.asyncio
+async def test_rolls_back_on_error():
+    session = FakeSession()
+    uow = SqlAlchemyUnitOfWork(session)
+
+    with pytest.raises(ValueError):
+        async with uow:
+            raise ValueError
+
+    assert session.calls == ["rollback"]
+    assert uow.commit_count == 0
+
+@pytest.mark.asyncio
+async def test_savepoint_failure_keeps_outer_transaction():
+    session = FakeSession()
+    uow = SqlAlchemyUnitOfWork(session)
+
+    async with uow:
+        with pytest.raises(ValueError):
+            async with uow.savepoint():
+                raise ValueError
+
+    assert session.calls == ["savepoint", "rollback_to_savepoint", "commit"]
+
+@pytest.mark.asyncio
+async def test_use_case_commits_through_unit_of_work(doctor_repository):
+    session = FakeSession()
+    use_case = CreateDoctor(doctor_repository, SHA256PasswordHasher(), SqlAlchemyUnitOfWork(session))
+
+    await use_case(create_doctor())
+
+    assert session.calls == ["commit"]
+
+@pytest.mark.asyncio
+async def test_use_case_failure_rolls_back():
+    session = FakeSession()
+    use_case = CreateDoctor(FailingDoctorRepository(), SHA256PasswordHasher(), SqlAlchemyUnitOfWork(session))
+
+    with pytest.raises(RuntimeError):
+        await use_case(create_doctor())
+
+    assert session.calls == ["rollback"]
+
+def test_commit_count_header():
+    app = FastAPI()
+    app.middleware("http")(commit_count_middleware)
+
+    @app.post("/twice")
+    async def twice():
+        uow = SqlAlchemyUnitOfWork(FakeSession())
+        async with uow:
+            pass
+        async with uow:
+            pass
+        return {}
+
+    response = TestClient(app).post("/twice")
+    assert response.headers[COMMIT_COUNT_HEADER] == "2"
@@ -1,5 +1,6 @@
 import pytest
 from uuid import uuid4, UUID
+from app.adapters.password_hasher import SHA256PasswordHasher
 from app.use_cases.update_doctor import UpdateDoctor
 from app.domain.entities.doctor import Doctor, CategoryEnum
 from app.use_cases.exceptions import DoctorNotFoundError
@@ -33,7 +34,7 @@ def doctor_repository():
 
 @pytest.fixture
 def update_doctor_use_case(doctor_repository):
-    return UpdateDoctor(doctor_repository)
+    return UpdateDoctor(doctor_repository, SHA256PasswordHasher())
 
 @pytest.mark.asyncio
 async def test_update_doctor_success(update_doctor_use_case, doctor_repository):
@@ -1,5 +1,6 @@
 import pytest
 from uuid import uuid4, UUID
+from app.adapters.password_hasher import SHA256PasswordHasher
 from app.use_cases.update_user import UpdateUser
 from app.domain.entities.user import User, UserRole
 from app.use_cases.exceptions import UserNotFoundError
@@ -45,7 +46,7 @@ def user_repository():
 
 @pytest.fixture
 def update_user_use_case(user_repository):
-    return UpdateUser(user_repository)
+    return UpdateUser(user_repository, SHA256PasswordHasher())
 
 @pytest.mark.asyncio
 async def test_update_user_success(update_user_use_case, user_repository):
@@ -0,0 +1,110 @@
+import asyncio
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import app.api.routers.websocket as websocket_module
+from app.api.broadcast_bus import BroadcastBus
+from app.api.connections import TRY_AGAIN_LATER, ConnectionManager
+
+
+class OfflineRedis:
+    """A single worker: nobody else is subscribed and no counts are reported"""
+
+    async def publish(self, channel, message):
+        return 0
+
+    async def hgetall(self, key):
+        return {}
+
+
+class FakeWebSocket:
+    def __init__(self, blocked: bool = False):
+        self.sent = []
+        self.closed_with = None
+        self.unblocked = asyncio.Event()
+        if not blocked:
+            self.unblocked.set()
+
+    async def accept(self):
+        pass
+
+    async def send(self, message):
+        await self.unblocked.wait()
+        self.sent.append(message["text"])
+
+    async def close(self, code=1000):
+        self.closed_with = code
+
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_broadcast_only_enqueues_and_writers_deliver_in_order():
+    manager = ConnectionManager(queue_size=10)
+    sockets = [FakeWebSocket() for _ in range(3)]
+    connections = [await manager.connect(socket) for socket in sockets]
+
+    assert manager.broadcast("one") == 3
+    assert manager.broadcast("two") == 3
+    assert all(socket.sent == [] for socket in sockets)
+
+    await settle()
+    assert all(socket.sent == ["one", "two"] for socket in sockets)
+    assert manager.snapshot()["delivery_ms"]["count"] == 6
+    for connection in connections:
+        await manager.disconnect(connection)
+    assert manager.snapshot()["active_connections"] == 0
+
+@pytest.mark.asyncio
+async def test_slow_client_is_disconnected_without_delaying_others():
+    manager = ConnectionManager(queue_size=2)
+    slow, fast = FakeWebSocket(blocked=True), FakeWebSocket()
+    await manager.connect(slow)
+    await manager.connect(fast)
+
+    for index in range(5):
+        manager.broadcast(str(index))
+        await settle()
+
+    assert fast.sent == ["0", "1", "2", "3", "4"]
+    assert manager.snapshot()["disconnected_slow"] == 1
+    assert manager.snapshot()["active_connections"] == 1
+    slow.unblocked.set()
+    await settle()
+    assert slow.closed_with == TRY_AGAIN_LATER
+
+@pytest.mark.asyncio
+async def test_skip_policy_marks_client_lagging_until_it_catches_up():
+    manager = ConnectionManager(queue_size=2, overflow_policy="skip")
+    slow = FakeWebSocket(blocked=True)
+    connection = await manager.connect(slow)
+
+    sent = [manager.broadcast(str(index)) for index in range(5)]
+    await settle()
+
+    assert sent == [1, 1, 0, 0, 0] and connection.skipped == 3
+    assert manager.snapshot()["lagging"] == 1
+    slow.unblocked.set()
+    await settle()
+    assert manager.snapshot()["lagging"] == 0
+    assert slow.sent == ["0", "1"]
+    await manager.disconnect(connection)
+
+def test_endpoint_relays_messages_to_every_client(monkeypatch):
+    manager = ConnectionManager()
+    monkeypatch.setattr(websocket_module, "manager", manager)
+    monkeypatch.setattr(websocket_module, "broadcast_bus", BroadcastBus(manager, OfflineRedis()))
+    app = FastAPI()
+    app.include_router(websocket_module.router)
+    client = TestClient(app)
+
+    with client.websocket_connect("/ws") as first, client.websocket_connect("/ws") as second:
+        first.send_text("hello")
+        assert first.receive_text() == "Broadcast: hello"
+        assert second.receive_text() == "Broadcast: hello"
+        status = client.get("/ws/status").json()
+        assert status["active_connections"] == 2 and status["status"] == "active"
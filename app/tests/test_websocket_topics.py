@@ -0,0 +1,124 @@
+import asyncio
+import json
+import pytest
+from uuid import uuid4
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import app.api.routers.websocket as websocket_module
+from app.api.broadcast_bus import BroadcastBus, schedule_frames
+from app.api.connections import ConnectionManager
+from app.domain.entities.appointment import Appointment
+from app.domain.entities.event import APPOINTMENT_CREATED, APPOINTMENT_DELETED, APPOINTMENT_UPDATED, DomainEvent
+from app.api.routers.websocket import parse_topic
+
+
+class OfflineRedis:
+    async def publish(self, channel, message):
+        return 0
+
+    async def hgetall(self, key):
+        return {}
+
+
+class FakeWebSocket:
+    def __init__(self):
+        self.sent = []
+
+    async def accept(self):
+        pass
+
+    async def send(self, message):
+        self.sent.append(json.loads(message["text"]))
+
+    async def close(self, code=1000):
+        pass
+
+
+def appointment_event(event_type, doctor_id, room_id):
+    appointment = Appointment(datetime=None, doctor_id=doctor_id, user_id=uuid4(), room_id=room_id)
+    return DomainEvent(event_type, appointment.id, {**appointment.to_dict(), "datetime": "2024-12-25T09:00:00"})
+
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_topics_are_validated_and_canonical():
+    doctor_id = uuid4()
+
+    assert parse_topic(f"doctor:{str(doctor_id).upper()}") == f"doctor:{doctor_id}"
+    assert parse_topic(f"room:{doctor_id.hex}") == f"room:{doctor_id}"
+    assert parse_topic(f"user:{doctor_id}") is None
+    assert parse_topic("doctor:42") is None
+    assert parse_topic(None) is None
+
+@pytest.mark.asyncio
+async def test_events_reach_only_subscribers_of_their_doctor_or_room():
+    manager = ConnectionManager()
+    bus = BroadcastBus(manager, OfflineRedis())
+    doctor_id, room_id = uuid4(), uuid4()
+    desk, ward, idle = FakeWebSocket(), FakeWebSocket(), FakeWebSocket()
+    manager.subscribe(await manager.connect(desk), f"doctor:{doctor_id}")
+    manager.subscribe(await manager.connect(ward), f"room:{room_id}")
+    await manager.connect(idle)
+
+    bus.deliver_event(appointment_event(APPOINTMENT_CREATED, doctor_id, room_id))
+    bus.deliver_event(appointment_event(APPOINTMENT_DELETED, uuid4(), room_id))
+    await settle()
+
+    assert [(frame["topic"], frame["event"]) for frame in desk.sent] == [(f"doctor:{doctor_id}", APPOINTMENT_CREATED)]
+    assert [frame["event"] for frame in ward.sent] == [APPOINTMENT_CREATED, APPOINTMENT_DELETED]
+    assert desk.sent[0]["appointment"]["doctor_id"] == str(doctor_id)
+    assert idle.sent == []
+
+def test_moved_booking_reaches_previous_doctor_and_room():
+    old_doctor, new_doctor, room_id = uuid4(), uuid4(), uuid4()
+    moved = appointment_event(APPOINTMENT_UPDATED, new_doctor, room_id)
+    moved.payload.update(previous_doctor_id=str(old_doctor), previous_room_id=str(room_id))
+    same = appointment_event(APPOINTMENT_UPDATED, new_doctor, room_id)
+    same.payload.update(previous_doctor_id=str(new_doctor), previous_room_id=str(room_id))
+
+    assert [topic for topic, _ in schedule_frames(moved)] == [
+        f"doctor:{new_doctor}", f"room:{room_id}", f"doctor:{old_doctor}"
+    ]
+    assert [topic for topic, _ in schedule_frames(same)] == [f"doctor:{new_doctor}", f"room:{room_id}"]
+
+@pytest.mark.asyncio
+async def test_disconnect_removes_connection_from_the_topic_index():
+    manager = ConnectionManager()
+    connection = await manager.connect(FakeWebSocket())
+    manager.subscribe(connection, "doctor:a")
+    manager.subscribe(connection, "room:b")
+
+    await manager.disconnect(connection)
+
+    assert manager.topics == {}
+    assert manager.broadcast("x", "doctor:a") == 0
+
+def test_subscribe_protocol(monkeypatch):
+    manager = ConnectionManager()
+    monkeypatch.setattr(websocket_module, "manager", manager)
+    monkeypatch.setattr(websocket_module, "broadcast_bus", BroadcastBus(manager, OfflineRedis()))
+    monkeypatch.setattr(websocket_module.settings, "websocket_max_topics", 1)
+    app = FastAPI()
+    app.include_router(websocket_module.router)
+    doctor_id = uuid4()
+
+    with TestClient(app).websocket_connect("/ws") as websocket:
+        websocket.send_json({"action": "subscribe", "topic": f"doctor:{doctor_id}"})
+        assert websocket.receive_json() == {"type": "subscribed", "topic": f"doctor:{doctor_id}"}
+        websocket.send_json({"action": "subscribe", "topic": f"room:{uuid4()}"})
+        assert websocket.receive_json()["type"] == "error"
+        websocket.send_json({"action": "subscribe", "topic": "everything"})
+        assert websocket.receive_json()["type"] == "error"
+        assert manager.snapshot()["subscriptions"] == 1
+
+        websocket.send_json({"action": "unsubscribe", "topic": f"doctor:{doctor_id}"})
+        assert websocket.receive_json()["type"] == "unsubscribed"
+        assert manager.topics == {}
+
+        # Anything else is still a plain broadcast
+        websocket.send_text("hello")
+        assert websocket.receive_text() == "Broadcast: hello"
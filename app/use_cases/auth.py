@@ -5,13 +5,21 @@ from app.domain.entities.user import User, UserRole
 from app.repository.user_repository import UserRepository
 from app.core.security import create_access_token, create_refresh_token, create_reset_token, verify_reset_token, verify_refresh_token, revoke_token
 from app.domain.interfaces.password_hasher import PasswordHasher
+from app.domain.interfaces.unit_of_work import UnitOfWork, NullUnitOfWork
 from app.core.token_storage import token_storage
+from app.core.config import settings
 from app.core.email import send_reset_email
 
 class AuthService:
-    def __init__(self, user_repository: UserRepository, password_hasher: PasswordHasher):
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        password_hasher: PasswordHasher,
+        unit_of_work: UnitOfWork | None = None
+    ):
         self.user_repository = user_repository
         self.password_hasher = password_hasher
+        self.unit_of_work = unit_of_work or NullUnitOfWork()
 
     async def authenticate_user(self, email: str, password: str) -> User:
         user = await self.user_repository.get_by_email(email)
@@ -20,7 +28,8 @@ class AuthService:
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Incorrect email or password"
             )
-        if not self.password_hasher.verify(password, user.hashed_password):
+        verified, new_hash = await self.password_hasher.verify_and_update(password, user.hashed_password)
+        if not verified:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Incorrect email or password"
@@ -30,10 +39,32 @@ class AuthService:
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="User account is disabled"
             )
+        if new_hash:
+            # Stored with an outdated scheme: only now do we have the plain password to upgrade it
+            async with self.unit_of_work:
+                await self.user_repository.update(str(user.id), hashed_password=new_hash)
+            user.hashed_password = new_hash
         return user
 
-    async def create_tokens(self, user: User) -> dict:
-        access_token = create_access_token(data={"sub": str(user.id)})
+    async def login(self, email: str, password: str) -> dict:
+        user = await self.authenticate_user(email, password)
+        if not settings.stateless_auth:
+            return await self.create_tokens(user)
+        # The role must not be older than the version: read the version, then the row again
+        security_version = await self._security_version(str(user.id))
+        user = await self._active_user(str(user.id))
+        return await self.create_tokens(user, security_version)
+
+    async def create_tokens(self, user: User, security_version: int = 0) -> dict:
+        """`security_version` must be read before `user` was loaded. Role changes
+        commit before they bump the version, so a token with an outdated role
+        then carries an outdated version too and is rejected."""
+        claims = {"sub": str(user.id)}
+        if settings.stateless_auth:
+            # Enough to authorize requests without loading the user; see verify_access_token
+            claims["role"] = user.role.value
+            claims["ver"] = security_version
+        access_token = create_access_token(data=claims)
         refresh_token = await create_refresh_token(data={"sub": str(user.id)})
         
         # Save data session
@@ -51,6 +82,25 @@ class AuthService:
             "token_type": "bearer"
         }
 
+    async def _security_version(self, user_id: str) -> int:
+        if not settings.stateless_auth:
+            return 0
+        return await token_storage.get_security_version(user_id)
+
+    async def _active_user(self, user_id: str) -> User:
+        user = await self.user_repository.get(id=UUID(user_id))
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found"
+            )
+        if user.disabled:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="User account is disabled"
+            )
+        return user
+
     async def register_user(self, name: str, surname: str, email: str, password: str, phone: str = None) -> User:
         # Checking if the user exists
         existing_user = await self.user_repository.get_by_email(email)
@@ -61,7 +111,7 @@ class AuthService:
             )
         
         # Create new user
-        hashed_password = self.password_hasher.hash(password)
+        hashed_password = await self.password_hasher.hash(password)
         user = User(
             name=name,
             surname=surname,
@@ -71,7 +121,8 @@ class AuthService:
             role=UserRole.user
         )
         
-        await self.user_repository.add(user)
+        async with self.unit_of_work:
+            await self.user_repository.add(user)
         return user
 
     async def refresh_access_token(self, refresh_token: str) -> dict:
@@ -86,18 +137,14 @@ class AuthService:
                     detail="Invalid refresh token"
                 )
             
-            user = await self.user_repository.get(id=UUID(user_id))
-            if not user:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="User not found"
-                )
+            security_version = await self._security_version(user_id)
+            user = await self._active_user(user_id)
             
             # Revoke old refresh token
             await token_storage.revoke_refresh_token(user_id)
             
             # Create new tokens
-            return await self.create_tokens(user)
+            return await self.create_tokens(user, security_version)
         except Exception:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -113,11 +160,12 @@ class AuthService:
         reset_token = create_reset_token(email)
         
         # Save tokens in database
-        await self.user_repository.update(
-            str(user.id), 
-            reset_token=reset_token,
-            reset_token_expires=datetime.now(timezone.utc) + timedelta(hours=1)
-        )
+        async with self.unit_of_work:
+            await self.user_repository.update(
+                str(user.id),
+                reset_token=reset_token,
+                reset_token_expires=datetime.now(timezone.utc) + timedelta(hours=1)
+            )
         
         # Send email
         await send_reset_email(email, reset_token)
@@ -146,13 +194,14 @@ class AuthService:
             )
         
         # Update your password and clear your token
-        hashed_password = self.password_hasher.hash(new_password)
-        await self.user_repository.update(
-            str(user.id),
-            hashed_password=hashed_password,
-            reset_token=None,
-            reset_token_expires=None
-        )
+        hashed_password = await self.password_hasher.hash(new_password)
+        async with self.unit_of_work:
+            await self.user_repository.update(
+                str(user.id),
+                hashed_password=hashed_password,
+                reset_token=None,
+                reset_token_expires=None
+            )
         
         return {"message": "Password successfully reset"}
     
@@ -1,6 +1,14 @@
+from dataclasses import dataclass
+from datetime import datetime
+from enum import StrEnum
+from functools import partial
+from typing import AsyncIterator
 from uuid import UUID
 from app.domain.entities.appointment import Appointment
 from app.repository.appointment_repository import AppointmentRepository
+from app.repository.pagination import Page
+from app.domain.interfaces.unit_of_work import UnitOfWork, NullUnitOfWork
+from app.domain.scheduling import SlotIndex
 from app.use_cases.exceptions import AppointmentNotFoundError
 
 class GetAppointment:
@@ -14,11 +22,21 @@ class GetAppointment:
         return appointment
 
 class CreateAppointment:
-    def __init__(self, appointment_repository: AppointmentRepository):
+    def __init__(
+        self,
+        appointment_repository: AppointmentRepository,
+        unit_of_work: UnitOfWork | None = None,
+        slot_index: SlotIndex | None = None
+    ):
         self.appointment_repository = appointment_repository
+        self.unit_of_work = unit_of_work or NullUnitOfWork()
+        self.slot_index = slot_index
 
     async def __call__(self, appointment: Appointment) -> Appointment:
-        await self.appointment_repository.add(appointment)  # This is equivalent to await MongoDoctorRepository().add(doctor)
+        async with self.unit_of_work:
+            await self.appointment_repository.add(appointment)  # This is equivalent to await MongoDoctorRepository().add(doctor)
+            if self.slot_index is not None:
+                self.unit_of_work.after_commit(partial(self.slot_index.add, appointment))
         return appointment
 
 class ListAppointments:
@@ -27,5 +45,95 @@ class ListAppointments:
 
     async def __call__(self, skip: int = 0, limit: int = 100) -> list[Appointment]:
         return await self.appointment_repository.list_all(skip=skip, limit=limit)
-    
-    
\ No newline at end of file
+
+    async def page(self, limit: int = 100, cursor: str | None = None) -> Page[Appointment]:
+        return await self.appointment_repository.list_page(limit=limit, cursor=cursor)
+
+
+class ExportAppointments:
+    def __init__(self, appointment_repository: AppointmentRepository, batch_size: int = 1000):
+        self.appointment_repository = appointment_repository
+        self.batch_size = batch_size
+
+    def __call__(
+        self,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        doctor_id: UUID | None = None
+    ) -> AsyncIterator[Appointment]:
+        return self.appointment_repository.stream(
+            date_from=date_from,
+            date_to=date_to,
+            doctor_id=doctor_id,
+            batch_size=self.batch_size
+        )
+
+
+class BulkItemStatus(StrEnum):
+    CREATED = "created"
+    CONFLICT = "conflict"
+    INVALID = "invalid"
+
+
+@dataclass
+class BulkItemResult:
+    index: int
+    appointment: Appointment
+    status: BulkItemStatus
+    detail: str | None = None
+
+
+class BulkCreateAppointments:
+    """Create many appointments with one multi-row INSERT per chunk.
+
+    Each chunk is its own transaction, so large imports never hold one huge
+    transaction; a conflicting or invalid item is reported, not fatal.
+    """
+
+    def __init__(
+        self,
+        appointment_repository: AppointmentRepository,
+        unit_of_work: UnitOfWork | None = None,
+        chunk_size: int = 500,
+        slot_index: SlotIndex | None = None
+    ):
+        self.appointment_repository = appointment_repository
+        self.unit_of_work = unit_of_work or NullUnitOfWork()
+        self.chunk_size = chunk_size
+        self.slot_index = slot_index
+
+    async def __call__(self, appointments: list[Appointment]) -> list[BulkItemResult]:
+        results: list[BulkItemResult | None] = [None] * len(appointments)
+        pending: list[tuple[int, Appointment]] = []
+        doctor_slots, room_slots = set(), set()
+
+        # Same doctor or room at the same time twice in one request
+        for index, appointment in enumerate(appointments):
+            doctor_slot = (appointment.doctor_id, appointment.datetime)
+            room_slot = (appointment.room_id, appointment.datetime)
+            if doctor_slot in doctor_slots or room_slot in room_slots:
+                results[index] = BulkItemResult(index, appointment, BulkItemStatus.CONFLICT, "Duplicate slot in request")
+                continue
+            doctor_slots.add(doctor_slot)
+            room_slots.add(room_slot)
+            pending.append((index, appointment))
+
+        for start in range(0, len(pending), self.chunk_size):
+            chunk = pending[start:start + self.chunk_size]
+            async with self.unit_of_work:
+                missing = await self.appointment_repository.missing_references([a for _, a in chunk])
+                valid = [appointment for _, appointment in chunk if appointment.id not in missing]
+                inserted = await self.appointment_repository.add_many(valid) if valid else set()
+                if self.slot_index is not None and inserted:
+                    created = [appointment for appointment in valid if appointment.id in inserted]
+                    self.unit_of_work.after_commit(partial(self.slot_index.add_many, created))
+
+            for index, appointment in chunk:
+                if appointment.id in missing:
+                    results[index] = BulkItemResult(index, appointment, BulkItemStatus.INVALID, missing[appointment.id])
+                elif appointment.id in inserted:
+                    results[index] = BulkItemResult(index, appointment, BulkItemStatus.CREATED)
+                else:
+                    results[index] = BulkItemResult(index, appointment, BulkItemStatus.CONFLICT, "Conflicts with an existing appointment")
+
+        return results
@@ -1,6 +1,9 @@
 from uuid import UUID
 from app.domain.entities.doctor import Doctor
-from app.repository.doctor_repository import DoctorRepository
+from app.repository.doctor_repository import DoctorFilters, DoctorRepository, DoctorSort
+from app.repository.pagination import Page
+from app.domain.interfaces.unit_of_work import UnitOfWork, NullUnitOfWork
+from app.domain.interfaces.password_hasher import PasswordHasher
 from app.use_cases.exceptions import DoctorNotFoundError
 
 class GetDoctor:
@@ -14,17 +17,46 @@ class GetDoctor:
         return doctor
 
 class CreateDoctor:
-    def __init__(self, doctor_repository: DoctorRepository):
+    def __init__(
+        self,
+        doctor_repository: DoctorRepository,
+        password_hasher: PasswordHasher,
+        unit_of_work: UnitOfWork | None = None
+    ):
         self.doctor_repository = doctor_repository
+        self.password_hasher = password_hasher
+        self.unit_of_work = unit_of_work or NullUnitOfWork()
 
     async def __call__(self, doctor: Doctor) -> Doctor:
-        await self.doctor_repository.add(doctor)  # This is equivalent to await MongoDoctorRepository().add(doctor)
+        """`doctor.password` comes in plain and is stored hashed"""
+        doctor.password = await self.password_hasher.hash(doctor.password)
+        async with self.unit_of_work:
+            await self.doctor_repository.add(doctor)  # This is equivalent to await MongoDoctorRepository().add(doctor)
         return doctor
 
 class ListDoctors:
     def __init__(self, doctor_repository: DoctorRepository):
         self.doctor_repository = doctor_repository
 
-    async def __call__(self, skip: int = 0, limit: int = 100) -> list[Doctor]:
-        return await self.doctor_repository.list_all(skip=skip, limit=limit)
+    async def __call__(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        filters: DoctorFilters | None = None,
+        sort: DoctorSort = DoctorSort.SURNAME
+    ) -> list[Doctor]:
+        return await self.doctor_repository.list_all(skip=skip, limit=limit, filters=filters, sort=sort)
+
+    async def page(
+        self,
+        limit: int = 100,
+        cursor: str | None = None,
+        filters: DoctorFilters | None = None,
+        sort: DoctorSort = DoctorSort.SURNAME
+    ) -> Page[Doctor]:
+        return await self.doctor_repository.list_page(limit=limit, cursor=cursor, filters=filters, sort=sort)
+
+    async def version(self) -> tuple[int, int]:
+        """Changes whenever any listing could; cheaper than loading one"""
+        return await self.doctor_repository.version()
     
@@ -1,14 +1,18 @@
 from typing import List
 from app.domain.entities.room import Room
 from app.repository.room_repository import RoomRepository
+from app.repository.pagination import Page
+from app.domain.interfaces.unit_of_work import UnitOfWork, NullUnitOfWork
 
 
 class CreateRoom:
-    def __init__(self, room_repository: RoomRepository):
+    def __init__(self, room_repository: RoomRepository, unit_of_work: UnitOfWork | None = None):
         self.room_repository = room_repository
+        self.unit_of_work = unit_of_work or NullUnitOfWork()
 
     async def __call__(self, room: Room) -> Room:
-        await self.room_repository.add(room)  # This is equivalent to await MongoDoctorRepository().add(doctor)
+        async with self.unit_of_work:
+            await self.room_repository.add(room)  # This is equivalent to await MongoDoctorRepository().add(doctor)
         return room
 
 
@@ -18,3 +22,10 @@ class ListRooms:
 
     async def __call__(self, skip: int = 0, limit: int = 100) -> List[Room]:
         return await self.room_repository.list(skip=skip, limit=limit)
+
+    async def page(self, limit: int = 100, cursor: str | None = None) -> Page[Room]:
+        return await self.room_repository.list_page(limit=limit, cursor=cursor)
+
+    async def version(self) -> tuple[int, int]:
+        """Changes whenever any listing could; cheaper than loading one"""
+        return await self.room_repository.version()
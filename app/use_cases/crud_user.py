@@ -1,7 +1,9 @@
 from uuid import UUID
 from app.domain.entities.user import User
 from app.repository.user_repository import UserRepository
+from app.repository.pagination import Page
 from app.domain.interfaces.password_hasher import PasswordHasher
+from app.domain.interfaces.unit_of_work import UnitOfWork, NullUnitOfWork
 from app.use_cases.exceptions import UserNotFoundError
 
 class GetUser:
@@ -15,14 +17,21 @@ class GetUser:
         return user
 
 class CreateUser:
-    def __init__(self, user_repository: UserRepository, password_hasher: PasswordHasher):
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        password_hasher: PasswordHasher,
+        unit_of_work: UnitOfWork | None = None
+    ):
         self.user_repository = user_repository
         self.password_hasher = password_hasher
+        self.unit_of_work = unit_of_work or NullUnitOfWork()
 
     async def __call__(self, user_data, plain_password: str) -> User:
-        hashed_password = self.password_hasher.hash(plain_password)
+        hashed_password = await self.password_hasher.hash(plain_password)
         user = user_data.to_entity(hashed_password)
-        await self.user_repository.add(user)
+        async with self.unit_of_work:
+            await self.user_repository.add(user)
         return user
 
 class ListUsers:
@@ -30,4 +39,7 @@ class ListUsers:
         self.user_repository = user_repository
 
     async def __call__(self, skip: int = 0, limit: int = 100) -> list[User]:
-        return await self.user_repository.list_all(skip=skip, limit=limit)
\ No newline at end of file
+        return await self.user_repository.list_all(skip=skip, limit=limit)
+
+    async def page(self, limit: int = 100, cursor: str | None = None) -> Page[User]:
+        return await self.user_repository.list_page(limit=limit, cursor=cursor)
\ No newline at end of file
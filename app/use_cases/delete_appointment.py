@@ -1,16 +1,27 @@
+from functools import partial
 from uuid import UUID
 from app.repository.appointment_repository import AppointmentRepository
+from app.domain.interfaces.unit_of_work import UnitOfWork, NullUnitOfWork
+from app.domain.scheduling import SlotIndex
 from app.use_cases.exceptions import AppointmentNotFoundError
 
 class DeleteAppointment:
-    def __init__(self, appointment_repository: AppointmentRepository):
+    def __init__(
+        self,
+        appointment_repository: AppointmentRepository,
+        unit_of_work: UnitOfWork | None = None,
+        slot_index: SlotIndex | None = None
+    ):
         self.appointment_repository = appointment_repository
+        self.unit_of_work = unit_of_work or NullUnitOfWork()
+        self.slot_index = slot_index
 
     async def __call__(self, appointment_id: UUID) -> bool:
-        # Проверяем существование записи
-        existing_appointment = await self.appointment_repository.get(id=appointment_id)
-        if not existing_appointment:
+        # Delete appointment; the repository reports whether a row existed
+        async with self.unit_of_work:
+            deleted = await self.appointment_repository.delete(str(appointment_id))
+            if deleted and self.slot_index is not None:
+                self.unit_of_work.after_commit(partial(self.slot_index.remove, appointment_id))
+        if not deleted:
             raise AppointmentNotFoundError(appointment_id)
-        
-        # Удаляем запись
-        return await self.appointment_repository.delete(str(appointment_id))
\ No newline at end of file
+        return deleted
\ No newline at end of file
@@ -1,16 +1,17 @@
 from uuid import UUID
 from app.repository.doctor_repository import DoctorRepository
+from app.domain.interfaces.unit_of_work import UnitOfWork, NullUnitOfWork
 from app.use_cases.exceptions import DoctorNotFoundError
 
 class DeleteDoctor:
-    def __init__(self, doctor_repository: DoctorRepository):
+    def __init__(self, doctor_repository: DoctorRepository, unit_of_work: UnitOfWork | None = None):
         self.doctor_repository = doctor_repository
+        self.unit_of_work = unit_of_work or NullUnitOfWork()
 
     async def __call__(self, doctor_id: UUID) -> bool:
-        # Chek existin doctor
-        existing_doctor = await self.doctor_repository.get(id=doctor_id)
-        if not existing_doctor:
+        # Delete doctor; the repository reports whether a row existed
+        async with self.unit_of_work:
+            deleted = await self.doctor_repository.delete(str(doctor_id))
+        if not deleted:
             raise DoctorNotFoundError(doctor_id)
-        
-        # Delete doctor
-        return await self.doctor_repository.delete(str(doctor_id))
\ No newline at end of file
+        return deleted
\ No newline at end of file
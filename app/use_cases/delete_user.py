@@ -1,16 +1,27 @@
+from functools import partial
 from uuid import UUID
 from app.repository.user_repository import UserRepository
+from app.domain.interfaces.unit_of_work import UnitOfWork, NullUnitOfWork
 from app.use_cases.exceptions import UserNotFoundError
+from app.core.principal_cache import PrincipalInvalidator
 
 class DeleteUser:
-    def __init__(self, user_repository: UserRepository):
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        unit_of_work: UnitOfWork | None = None,
+        principal_invalidator: PrincipalInvalidator | None = None
+    ):
         self.user_repository = user_repository
+        self.unit_of_work = unit_of_work or NullUnitOfWork()
+        self.principal_invalidator = principal_invalidator
 
     async def __call__(self, user_id: UUID) -> bool:
-        # Chek existing user
-        existing_user = await self.user_repository.get(id=user_id)
-        if not existing_user:
+        # Delete user; the repository reports whether a row existed
+        async with self.unit_of_work:
+            deleted = await self.user_repository.delete(str(user_id))
+            if deleted and self.principal_invalidator:
+                self.unit_of_work.after_commit(partial(self.principal_invalidator.invalidate, user_id))
+        if not deleted:
             raise UserNotFoundError(user_id)
-        
-        # Delete user
-        return await self.user_repository.delete(str(user_id))
\ No newline at end of file
+        return deleted
\ No newline at end of file
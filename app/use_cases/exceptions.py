@@ -36,4 +36,29 @@ class DoctorAlreadyExistsError(DomainException):
 class InvalidDoctorDataError(DomainException):
     def __init__(self, message: str):
         self.message = message
-        super().__init__(f"Invalid doctor data: {message}")
\ No newline at end of file
+        super().__init__(f"Invalid doctor data: {message}")
+
+class InvalidCursorError(DomainException):
+    def __init__(self, cursor: str):
+        self.cursor = cursor
+        super().__init__(f"Invalid pagination cursor: {cursor}")
+
+class AppointmentConflictError(DomainException):
+    """The doctor or room already has an overlapping appointment"""
+    status_code: int = 409
+
+    def __init__(self, resource: str):
+        self.resource = resource
+        super().__init__(f"The {resource} is already booked for an overlapping time")
+
+class InvalidSlotSearchError(DomainException):
+    def __init__(self, message: str):
+        self.message = message
+        super().__init__(f"Invalid slot search: {message}")
+
+class SlotIndexNotReadyError(DomainException):
+    """The worker has not finished loading its slot index yet"""
+    status_code: int = 503
+
+    def __init__(self):
+        super().__init__("Slot search is starting up, please retry shortly")
@@ -0,0 +1,149 @@
+import asyncio
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Iterable, Iterator
+
+from pydantic import BaseModel, ValidationError
+
+from app.api.routers.schema import DoctorItemCreate, UserItemCreate
+from app.domain.interfaces.password_hasher import PasswordHasher
+from app.domain.interfaces.unit_of_work import UnitOfWork, NullUnitOfWork
+from app.repository.bulk_import_repository import BulkImportRepository
+
+# Line 1 of every file is the header
+FIRST_DATA_LINE = 2
+
+
+@dataclass
+class RowReject:
+    line: int
+    reason: str
+
+
+@dataclass
+class ImportReport:
+    total: int = 0
+    imported: int = 0
+    rejects: list[RowReject] = field(default_factory=list)
+
+
+def _describe(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in item['loc']) or 'row'}: {item['msg']}"
+        for item in error.errors()
+    )
+
+
+def _clean(row: dict[str, str | None], int_fields: tuple[str, ...]) -> dict:
+    """CSV gives strings only: drop blanks and turn numeric columns into ints."""
+    data = {}
+    for key, value in row.items():
+        if key is None or value is None:
+            continue
+        value = value.strip()
+        if not value:
+            continue
+        if key in int_fields and value.lstrip("-").isdigit():
+            data[key] = int(value)
+        else:
+            data[key] = value
+    return data
+
+
+class CsvImport(ABC):
+    """Validates CSV rows, hashes passwords off the event loop and hands
+    batches to the bulk import repository; the merge runs once at the end
+    so the whole file lands in a single transaction."""
+
+    schema: type[BaseModel]
+    int_fields: tuple[str, ...] = ()
+
+    def __init__(
+        self,
+        import_repository: BulkImportRepository,
+        password_hasher: PasswordHasher,
+        unit_of_work: UnitOfWork | None = None,
+        batch_size: int = 1000
+    ):
+        self.import_repository = import_repository
+        self.password_hasher = password_hasher
+        self.unit_of_work = unit_of_work or NullUnitOfWork()
+        self.batch_size = batch_size
+
+    async def __call__(self, rows: Iterable[dict[str, str | None]]) -> ImportReport:
+        report = ImportReport()
+        lines: Iterator[tuple[int, dict]] = enumerate(rows, start=FIRST_DATA_LINE)
+
+        async with self.unit_of_work:
+            while batch := list(islice(lines, self.batch_size)):
+                report.total += len(batch)
+                valid = self._validate(batch, report)
+                if valid:
+                    hashes = await self._hash([model.password for _, model in valid])
+                    await self._stage([
+                        (line, self._to_entity(model, hashed_password))
+                        for (line, model), hashed_password in zip(valid, hashes)
+                    ])
+            rejected = await self._merge()
+
+        staged = report.total - len(report.rejects)
+        report.rejects.extend(RowReject(line, reason) for line, reason in rejected.items())
+        report.rejects.sort(key=lambda reject: reject.line)
+        report.imported = staged - len(rejected)
+        return report
+
+    def _validate(self, batch: list[tuple[int, dict]], report: ImportReport) -> list[tuple[int, BaseModel]]:
+        valid = []
+        for line, row in batch:
+            try:
+                valid.append((line, self.schema.model_validate(_clean(row, self.int_fields))))
+            except ValidationError as e:
+                report.rejects.append(RowReject(line, _describe(e)))
+        return valid
+
+    async def _hash(self, passwords: list[str]) -> list[str]:
+        # The hasher's pool bounds how many run at once
+        return list(await asyncio.gather(*(self.password_hasher.hash(password) for password in passwords)))
+
+    @abstractmethod
+    def _to_entity(self, model: BaseModel, hashed_password: str):
+        pass
+
+    @abstractmethod
+    async def _stage(self, rows: list[tuple[int, object]]) -> None:
+        pass
+
+    @abstractmethod
+    async def _merge(self) -> dict[int, str]:
+        pass
+
+
+class ImportDoctors(CsvImport):
+    schema = DoctorItemCreate
+    int_fields = ("age", "experience_years")
+
+    def _to_entity(self, model: DoctorItemCreate, hashed_password: str):
+        doctor = model.to_entity()
+        doctor.password = hashed_password
+        return doctor
+
+    async def _stage(self, rows):
+        await self.import_repository.stage_doctors(rows)
+
+    async def _merge(self) -> dict[int, str]:
+        return await self.import_repository.merge_doctors()
+
+
+class ImportUsers(CsvImport):
+    schema = UserItemCreate
+    int_fields = ("age",)
+
+    def _to_entity(self, model: UserItemCreate, hashed_password: str):
+        return model.to_entity(hashed_password)
+
+    async def _stage(self, rows):
+        await self.import_repository.stage_users(rows)
+
+    async def _merge(self) -> dict[int, str]:
+        return await self.import_repository.merge_users()
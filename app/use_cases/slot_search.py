@@ -0,0 +1,90 @@
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Awaitable, Callable, TypeVar
+
+from app.domain.scheduling import Slot, SlotIndex
+from app.repository.appointment_repository import AppointmentRepository
+from app.repository.doctor_repository import DoctorRepository
+from app.repository.pagination import Page
+from app.repository.room_repository import RoomRepository
+from app.use_cases.exceptions import InvalidSlotSearchError, SlotIndexNotReadyError
+
+T = TypeVar("T")
+
+# Appointments that started this long ago may still be running inside the window
+MAX_VISIT_LENGTH = timedelta(hours=8)
+
+
+def _local_naive(moment: datetime) -> datetime:
+    """Appointments are stored as naive local times; convert aware query values to match"""
+    if moment.tzinfo is None:
+        return moment
+    return moment.astimezone().replace(tzinfo=None)
+
+
+async def _all_pages(list_page: Callable[..., Awaitable[Page[T]]], page_size: int = 1000) -> AsyncIterator[T]:
+    cursor = None
+    while True:
+        page = await list_page(limit=page_size, cursor=cursor)
+        for item in page.items:
+            yield item
+        if not page.next_cursor:
+            return
+        cursor = page.next_cursor
+
+
+class FindFreeSlots:
+    """Read-only search over the worker's slot index; `RefreshSlotIndex` keeps it loaded"""
+
+    def __init__(self, slot_index: SlotIndex, max_window_days: int = 31):
+        self.slot_index = slot_index
+        self.max_window = timedelta(days=max_window_days)
+
+    async def __call__(
+        self,
+        specialization: str,
+        date_from: datetime,
+        date_to: datetime,
+        duration_minutes: int = 30,
+        limit: int = 10
+    ) -> list[Slot]:
+        date_to = _local_naive(date_to)
+        date_from = max(_local_naive(date_from), datetime.now())
+        if date_to <= date_from:
+            raise InvalidSlotSearchError("date_to must be in the future and after date_from")
+        if date_to - date_from > self.max_window:
+            raise InvalidSlotSearchError(f"search window is limited to {self.max_window.days} days")
+        if self.slot_index.loaded_at is None:
+            raise SlotIndexNotReadyError()
+
+        return self.slot_index.find(specialization, date_from, date_to, timedelta(minutes=duration_minutes), limit)
+
+
+class RefreshSlotIndex:
+    """Rebuilds the slot index from the database.
+
+    Runs from a background task, so searches keep answering from the previous
+    index while the doctors, rooms and appointments are read.
+    """
+
+    def __init__(
+        self,
+        slot_index: SlotIndex,
+        doctor_repository: DoctorRepository,
+        room_repository: RoomRepository,
+        appointment_repository: AppointmentRepository
+    ):
+        self.slot_index = slot_index
+        self.doctor_repository = doctor_repository
+        self.room_repository = room_repository
+        self.appointment_repository = appointment_repository
+
+    async def __call__(self) -> None:
+        async with self.slot_index.lock:
+            doctors = [doctor async for doctor in _all_pages(self.doctor_repository.list_page)]
+            room_ids = [room.id async for room in _all_pages(self.room_repository.list_page)]
+            appointments = [
+                appointment async for appointment in
+                self.appointment_repository.stream(date_from=datetime.now() - MAX_VISIT_LENGTH)
+            ]
+            # Swapped in without an await, so a search never sees a half-built index
+            self.slot_index.load(doctors, room_ids, appointments)
@@ -1,13 +1,22 @@
 from uuid import UUID
+from datetime import time
 from typing import Optional
 from app.domain.entities.doctor import Doctor, CategoryEnum
 from app.repository.doctor_repository import DoctorRepository
+from app.domain.interfaces.unit_of_work import UnitOfWork, NullUnitOfWork
 from app.use_cases.exceptions import DoctorNotFoundError
-from app.core.security import get_password_hash
+from app.domain.interfaces.password_hasher import PasswordHasher
 
 class UpdateDoctor:
-    def __init__(self, doctor_repository: DoctorRepository):
+    def __init__(
+        self,
+        doctor_repository: DoctorRepository,
+        password_hasher: PasswordHasher,
+        unit_of_work: UnitOfWork | None = None
+    ):
         self.doctor_repository = doctor_repository
+        self.password_hasher = password_hasher
+        self.unit_of_work = unit_of_work or NullUnitOfWork()
 
     async def __call__(
         self, 
@@ -17,13 +26,10 @@ class UpdateDoctor:
         age: Optional[int] = None,
         specialization: Optional[str] = None,
         category: Optional[CategoryEnum] = None,
-        password: Optional[str] = None
+        password: Optional[str] = None,
+        work_start: Optional[time] = None,
+        work_end: Optional[time] = None
     ) -> Doctor:
-        # Chek existing doctor
-        existing_doctor = await self.doctor_repository.get(id=doctor_id)
-        if not existing_doctor:
-            raise DoctorNotFoundError(doctor_id)
-        
         # Preparing data for udating
         updates = {}
         if name is not None:
@@ -37,10 +43,15 @@ class UpdateDoctor:
         if category is not None:
             updates["category"] = category
         if password is not None:
-            updates["password"] = get_password_hash(password)
+            updates["password"] = await self.password_hasher.hash(password)
+        if work_start is not None:
+            updates["work_start"] = work_start
+        if work_end is not None:
+            updates["work_end"] = work_end
         
-        # ОUpdating doctor
-        updated_doctor = await self.doctor_repository.update(str(doctor_id), **updates)
+        # Updating doctor; a missing doctor comes back as None, no lookup needed first
+        async with self.unit_of_work:
+            updated_doctor = await self.doctor_repository.update(str(doctor_id), **updates)
         if not updated_doctor:
             raise DoctorNotFoundError(doctor_id)
         
@@ -1,13 +1,25 @@
+from functools import partial
 from uuid import UUID
 from typing import Optional
 from app.domain.entities.user import User, UserRole
 from app.repository.user_repository import UserRepository
+from app.domain.interfaces.unit_of_work import UnitOfWork, NullUnitOfWork
 from app.use_cases.exceptions import UserNotFoundError
-from app.core.security import get_password_hash
+from app.domain.interfaces.password_hasher import PasswordHasher
+from app.core.principal_cache import PrincipalInvalidator
 
 class UpdateUser:
-    def __init__(self, user_repository: UserRepository):
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        password_hasher: PasswordHasher,
+        unit_of_work: UnitOfWork | None = None,
+        principal_invalidator: PrincipalInvalidator | None = None
+    ):
         self.user_repository = user_repository
+        self.password_hasher = password_hasher
+        self.unit_of_work = unit_of_work or NullUnitOfWork()
+        self.principal_invalidator = principal_invalidator
 
     async def __call__(
         self, 
@@ -21,11 +33,6 @@ class UpdateUser:
         password: Optional[str] = None,
         disabled: Optional[bool] = None
     ) -> User:
-        # Cheking existing user
-        existing_user = await self.user_repository.get(id=user_id)
-        if not existing_user:
-            raise UserNotFoundError(user_id)
-        
         # Preparing data for updating
         updates = {}
         if name is not None:
@@ -41,12 +48,16 @@ class UpdateUser:
         if role is not None:
             updates["role"] = role
         if password is not None:
-            updates["hashed_password"] = get_password_hash(password)
+            updates["hashed_password"] = await self.password_hasher.hash(password)
         if disabled is not None:
             updates["disabled"] = disabled
         
-        # Updating user
-        updated_user = await self.user_repository.update(str(user_id), **updates)
+        # Updating user; a missing user comes back as None, no lookup needed first
+        async with self.unit_of_work:
+            updated_user = await self.user_repository.update(str(user_id), **updates)
+            # Authorization depends on role and disabled only; cached principals must see the change
+            if updated_user and self.principal_invalidator and ("role" in updates or "disabled" in updates):
+                self.unit_of_work.after_commit(partial(self.principal_invalidator.invalidate, user_id))
         if not updated_user:
             raise UserNotFoundError(user_id)
         
@@ -0,0 +1,74 @@
+"""Login throughput and event-loop lag: slow hash inline on the loop vs. in the hasher pool.
+
+Runs without a database: each simulated login verifies a password against a stored hash.
+
+    python -m benchmarks.password_hashing --logins 200 --concurrency 50 --workers 4
+"""
+import argparse
+import asyncio
+import time
+
+from app.adapters.password_hasher import PooledPasswordHasher, _context
+from app.domain.interfaces.password_hasher import PasswordHasher
+
+
+class InlinePasswordHasher(PasswordHasher):
+    """The same scheme computed directly on the event loop"""
+
+    def __init__(self, scheme: str):
+        self.scheme = scheme
+
+    async def hash(self, password: str) -> str:
+        return _context(self.scheme).hash(password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return _context(self.scheme).verify(plain_password, hashed_password)
+
+
+async def measure_lag(samples: list[float], stop: asyncio.Event, interval: float = 0.005) -> None:
+    """How late a 5 ms timer fires; a blocked loop shows up here"""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        samples.append((time.perf_counter() - start - interval) * 1000)
+
+
+async def run_logins(hasher: PasswordHasher, stored: str, logins: int, concurrency: int) -> tuple[float, list[float]]:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def login():
+        async with semaphore:
+            assert await hasher.verify("correct horse", stored)
+
+    lag: list[float] = []
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(measure_lag(lag, stop))
+    start = time.perf_counter()
+    await asyncio.gather(*(login() for _ in range(logins)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await ticker
+    return logins / elapsed, sorted(lag) or [0.0]
+
+
+async def run(scheme: str, logins: int, concurrency: int, workers: int, processes: bool) -> None:
+    stored = _context(scheme).hash("correct horse")
+    pooled = PooledPasswordHasher(scheme, workers, processes)
+    try:
+        for name, hasher in (("inline", InlinePasswordHasher(scheme)), (f"pool ({workers} workers)", pooled)):
+            throughput, lag = await run_logins(hasher, stored, logins, concurrency)
+            print(f"{name:<20} {throughput:8.1f} logins/s  loop lag p50 {lag[len(lag) // 2]:7.2f} ms  "
+                  f"p99 {lag[int(len(lag) * 0.99)]:7.2f} ms  max {lag[-1]:7.2f} ms")
+    finally:
+        pooled.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scheme", default="pbkdf2_sha256")
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--processes", action="store_true")
+    args = parser.parse_args()
+    asyncio.run(run(args.scheme, args.logins, args.concurrency, args.workers, args.processes))
@@ -0,0 +1,91 @@
+"""Statements and latency per update/delete: SELECT-then-write vs. UPDATE/DELETE ... RETURNING.
+
+Needs a migrated database (DATABASE_URL); creates and removes its own rows.
+
+    python -m benchmarks.repository_round_trips --iterations 500
+"""
+import argparse
+import asyncio
+import time
+from uuid import UUID, uuid4
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.adapters.postgres_doctor_repository import PostgresDoctorRepository
+from app.core.config import settings
+from app.domain.entities.doctor import CategoryEnum, Doctor
+from app.infrastructure.database.models import DoctorORM
+
+
+async def legacy_update(session: AsyncSession, doctor_id: str, **updates) -> Doctor | None:
+    """The previous implementation: load the row, mutate it, flush"""
+    result = await session.execute(select(DoctorORM).where(DoctorORM.id == UUID(doctor_id)))
+    doctor_db = result.scalar_one_or_none()
+    if not doctor_db:
+        return None
+    for key, value in updates.items():
+        setattr(doctor_db, key, value)
+    await session.flush()
+    return doctor_db
+
+
+async def legacy_delete(session: AsyncSession, doctor_id: str) -> bool:
+    result = await session.execute(select(DoctorORM).where(DoctorORM.id == UUID(doctor_id)))
+    doctor_db = result.scalar_one_or_none()
+    if not doctor_db:
+        return False
+    await session.delete(doctor_db)
+    await session.flush()
+    return True
+
+
+async def run(iterations: int) -> None:
+    engine = create_async_engine(settings.database_url)
+    statements = 0
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def count(*args):
+        nonlocal statements
+        statements += 1
+
+    async def measure(name, operation):
+        nonlocal statements
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            repository = PostgresDoctorRepository(session)
+            ids = []
+            for _ in range(iterations):
+                doctor = Doctor(name="Bench", surname=f"b{uuid4().hex[:12]}", age=40,
+                                specialization="Benchmark", category=CategoryEnum.FIRST, password="x")
+                await repository.add(doctor)
+                ids.append(str(doctor.id))
+            await session.commit()
+            # Start every operation with an empty identity map, as a new request would
+            session.expunge_all()
+
+            statements = 0
+            start = time.perf_counter()
+            for doctor_id in ids:
+                await operation(session, repository, doctor_id)
+            await session.commit()
+            elapsed = time.perf_counter() - start
+
+            print(f"{name:<28} {statements / iterations:5.2f} statements/op  "
+                  f"{elapsed / iterations * 1000:7.3f} ms/op")
+
+            for doctor_id in ids:
+                await repository.delete(doctor_id)
+            await session.commit()
+
+    await measure("update: select + flush", lambda s, r, i: legacy_update(s, i, age=41))
+    await measure("update: UPDATE RETURNING", lambda s, r, i: r.update(i, age=41))
+    await measure("delete: select + flush", lambda s, r, i: legacy_delete(s, i))
+    await measure("delete: DELETE RETURNING", lambda s, r, i: r.delete(i))
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200)
+    asyncio.run(run(parser.parse_args().iterations))
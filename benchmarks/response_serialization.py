@@ -0,0 +1,81 @@
+"""CPU per list page: FastAPI's response_model path vs. the precompiled ListSerializer.
+
+Runs without a database: pages are built from in-memory entities the way the
+repositories return them.
+
+    python -m benchmarks.response_serialization --items 1000 --rounds 50
+"""
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute, serialize_response
+
+from app.api.routers.appoointments import appointment_list, router as appointments_router
+from app.api.routers.doctors import doctor_list, router as doctors_router
+from app.api.serialization import ListSerializer
+from app.domain.entities.appointment import Appointment
+from app.domain.entities.doctor import CategoryEnum, Doctor
+
+
+def response_field(router, path: str):
+    route = next(route for route in router.routes if isinstance(route, APIRoute) and route.path == path and "GET" in route.methods)
+    return route.response_field
+
+
+def doctors(count: int) -> list[Doctor]:
+    return [
+        Doctor(name=f"Name{i}", surname=f"Surname{i}", age=30 + i % 30, specialization="Cardiology",
+               category=CategoryEnum.FIRST, password="hashed", experience_years=i % 40)
+        for i in range(count)
+    ]
+
+
+def appointments(count: int) -> list[Appointment]:
+    start = datetime(2025, 1, 1, 9, 0)
+    return [
+        Appointment(datetime=start + timedelta(minutes=30 * i), doctor_id=uuid4(), user_id=uuid4(), room_id=uuid4())
+        for i in range(count)
+    ]
+
+
+async def response_model_path(field, items) -> bytes:
+    content = await serialize_response(field=field, response_content=items)
+    return JSONResponse(content).body
+
+
+def cpu_ms(call, rounds: int) -> float:
+    start = time.process_time()
+    for _ in range(rounds):
+        call()
+    return (time.process_time() - start) * 1000 / rounds
+
+
+def run(count: int, rounds: int) -> None:
+    cases = [
+        ("doctors", doctor_list, response_field(doctors_router, "/doctors"), doctors(count)),
+        ("appointments", appointment_list, response_field(appointments_router, "/appointments"), appointments(count)),
+    ]
+    loop = asyncio.new_event_loop()
+    for name, serializer, field, items in cases:
+        serializer: ListSerializer
+        expected = loop.run_until_complete(response_model_path(field, items))
+        assert serializer.dump_json(items) == expected, "fast path output differs"
+
+        before = cpu_ms(lambda: loop.run_until_complete(response_model_path(field, items)), rounds)
+        validated = cpu_ms(lambda: serializer.dump_json(items, validate=True), rounds)
+        trusted = cpu_ms(lambda: serializer.dump_json(items, validate=False), rounds)
+        print(f"{name:<13} {count} items/page  response_model {before:7.2f} ms  "
+              f"validated {validated:6.2f} ms  trusted {trusted:6.2f} ms  ({before / trusted:4.1f}x)")
+    loop.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+    run(args.items, args.rounds)
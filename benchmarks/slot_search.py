@@ -0,0 +1,91 @@
+"""Free-slot search latency on a synthetic clinic (in memory, no database needed).
+
+500 doctors across 20 specializations and 300 rooms, with a week of bookings
+filling about half of the doctors' working hours. Reports latency percentiles of
+`SlotIndex.find` and of incremental add/remove.
+
+    python -m benchmarks.slot_search --searches 2000
+"""
+import argparse
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from app.domain.entities.appointment import Appointment
+from app.domain.entities.doctor import CategoryEnum, Doctor
+from app.domain.scheduling import SlotIndex
+
+SPECIALIZATIONS = [f"specialization-{number}" for number in range(20)]
+
+
+def build_clinic(doctors: int, rooms: int, days: int, occupancy: float, seed: int):
+    rng = random.Random(seed)
+    start = datetime.combine(datetime.now().date() + timedelta(days=1), datetime.min.time())
+    doctor_list = [
+        Doctor(
+            name="Doc", surname=f"D{number}", age=40, specialization=SPECIALIZATIONS[number % len(SPECIALIZATIONS)],
+            category=CategoryEnum.FIRST, password="x"
+        )
+        for number in range(doctors)
+    ]
+    room_ids = [uuid4() for _ in range(rooms)]
+
+    # Half-hour visits on a 30 minute grid; room chosen round-robin per time slot
+    appointments = []
+    for day in range(days):
+        for slot in range(16):  # 09:00-17:00
+            moment = start + timedelta(days=day, hours=9, minutes=30 * slot)
+            busy_doctors = [doctor for doctor in doctor_list if rng.random() < occupancy]
+            for doctor, room_id in zip(busy_doctors, room_ids):
+                appointments.append(Appointment(datetime=moment, doctor_id=doctor.id, user_id=uuid4(), room_id=room_id))
+    return start, doctor_list, room_ids, appointments
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def report(name: str, samples: list[float]) -> None:
+    print(f"{name:<22} p50 {statistics.median(samples):7.3f} ms  "
+          f"p99 {percentile(samples, 0.99):7.3f} ms  max {max(samples):7.3f} ms")
+
+
+def run(searches: int, doctors: int, rooms: int, occupancy: float, seed: int) -> None:
+    start, doctor_list, room_ids, appointments = build_clinic(doctors, rooms, days=7, occupancy=occupancy, seed=seed)
+    index = SlotIndex()
+
+    began = time.perf_counter()
+    index.load(doctor_list, room_ids, appointments)
+    print(f"index build: {len(appointments)} appointments in {(time.perf_counter() - began) * 1000:.1f} ms")
+
+    rng = random.Random(seed)
+    samples = []
+    for _ in range(searches):
+        window_start = start + timedelta(days=rng.randrange(7), hours=rng.randrange(24))
+        began = time.perf_counter()
+        index.find(rng.choice(SPECIALIZATIONS), window_start, window_start + timedelta(days=7),
+                   timedelta(minutes=rng.choice((15, 30, 60))), limit=10)
+        samples.append((time.perf_counter() - began) * 1000)
+    report("find (7 day window)", samples)
+
+    samples = []
+    for appointment in rng.sample(appointments, min(searches, len(appointments))):
+        began = time.perf_counter()
+        index.remove(appointment.id)
+        index.add(appointment)
+        samples.append((time.perf_counter() - began) * 1000)
+    report("remove + add", samples)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--searches", type=int, default=2000)
+    parser.add_argument("--doctors", type=int, default=500)
+    parser.add_argument("--rooms", type=int, default=300)
+    parser.add_argument("--occupancy", type=float, default=0.5)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    run(args.searches, args.doctors, args.rooms, args.occupancy, args.seed)
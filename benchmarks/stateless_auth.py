@@ -0,0 +1,72 @@
+"""Latency of get_current_user: user lookup in PostgreSQL vs. role/version claims in the token.
+
+Needs a migrated database (DATABASE_URL) and Redis (REDIS_URL); creates and removes its own user.
+The principal cache is disabled so the lookup path really reaches the database.
+
+    python -m benchmarks.stateless_auth --iterations 2000
+"""
+import argparse
+import asyncio
+import time
+from uuid import uuid4
+
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+import app.api.auth as auth
+from app.adapters.postgres_user_repository import PostgresUserRepository
+from app.core.config import settings
+from app.core.principal_cache import PrincipalCache
+from app.domain.entities.user import User, UserRole
+from app.infrastructure.redis import close_redis
+from app.use_cases.auth import AuthService
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    return sorted(samples)[min(len(samples) - 1, int(len(samples) * fraction))]
+
+
+async def run(iterations: int) -> None:
+    engine = create_async_engine(settings.database_url)
+    auth.principal_cache = PrincipalCache(max_size=0)
+    user = User(name="Bench", surname="Auth", email=f"bench-{uuid4().hex[:12]}@example.com",
+                hashed_password="x", role=UserRole.admin)
+
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        repository = PostgresUserRepository(session)
+        await repository.add(user)
+        await session.commit()
+
+    async def measure(name: str, stateless: bool) -> None:
+        settings.stateless_auth = stateless
+        async with AsyncSession(engine) as session:
+            repository = PostgresUserRepository(session)
+            tokens = await AuthService(repository, password_hasher=None).create_tokens(user)
+            credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=tokens["access_token"])
+
+            samples = []
+            for _ in range(iterations):
+                start = time.perf_counter()
+                await auth.get_admin_user(await auth.get_current_user(credentials, repository))
+                samples.append((time.perf_counter() - start) * 1000)
+                # A fresh identity map per call, as a new request would have
+                session.expunge_all()
+
+        print(f"{name:<22} p50 {percentile(samples, 0.5):7.3f} ms  "
+              f"p99 {percentile(samples, 0.99):7.3f} ms  avg {sum(samples) / iterations:7.3f} ms")
+
+    try:
+        await measure("database lookup", stateless=False)
+        await measure("stateless claims", stateless=True)
+    finally:
+        async with AsyncSession(engine) as session:
+            await PostgresUserRepository(session).delete(str(user.id))
+            await session.commit()
+        await engine.dispose()
+        await close_redis()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=1000)
+    asyncio.run(run(parser.parse_args().iterations))
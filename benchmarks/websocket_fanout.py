@@ -0,0 +1,102 @@
+"""WebSocket broadcast latency: sequential sends vs. per-connection queues and writer tasks.
+
+Runs without a server: each connection is a fake socket whose send yields to the
+loop, and a fraction of them take `--slow-ms` per frame like a client on a bad network.
+
+    python -m benchmarks.websocket_fanout --connections 10000 --broadcasts 20 --slow 0.01
+"""
+import argparse
+import asyncio
+import time
+
+from app.api.connections import ConnectionManager
+
+
+class FakeWebSocket:
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.received = 0
+
+    async def accept(self):
+        pass
+
+    async def send(self, message):
+        await asyncio.sleep(self.delay)
+        self.received += 1
+
+    async def send_text(self, text):
+        await self.send({"type": "websocket.send", "text": text})
+
+    async def close(self, code=1000):
+        pass
+
+
+def make_sockets(connections: int, slow: float, slow_ms: float) -> list[FakeWebSocket]:
+    every = int(1 / slow) if slow else connections + 1
+    return [FakeWebSocket(slow_ms / 1000 if index % every == 0 else 0) for index in range(connections)]
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(len(samples) * fraction))]
+
+
+async def wait_for(sockets: list[FakeWebSocket], expected: int) -> None:
+    while any(socket.received < expected for socket in sockets):
+        await asyncio.sleep(0.001)
+
+
+async def sequential(sockets: list[FakeWebSocket], broadcasts: int) -> tuple[list[float], float]:
+    """The previous broadcast_message: await every socket in turn"""
+    calls = []
+    start = time.perf_counter()
+    for index in range(broadcasts):
+        started = time.perf_counter()
+        for socket in sockets:
+            await socket.send_text(f"message {index}")
+        calls.append((time.perf_counter() - started) * 1000)
+    return calls, time.perf_counter() - start
+
+
+async def queued(sockets: list[FakeWebSocket], broadcasts: int, queue_size: int) -> tuple[list[float], float, dict]:
+    manager = ConnectionManager(queue_size, "skip")
+    connections = [await manager.connect(socket) for socket in sockets]
+    fast = [socket for socket in sockets if not socket.delay]
+    calls = []
+    start = time.perf_counter()
+    for index in range(broadcasts):
+        started = time.perf_counter()
+        manager.broadcast(f"message {index}")
+        calls.append((time.perf_counter() - started) * 1000)
+        await asyncio.sleep(0)
+    await wait_for(fast, broadcasts)
+    elapsed = time.perf_counter() - start
+    snapshot = manager.snapshot()
+    for connection in connections:
+        await manager.disconnect(connection)
+    return calls, elapsed, snapshot
+
+
+async def run(connections: int, broadcasts: int, slow: float, slow_ms: float, queue_size: int) -> None:
+    print(f"{connections} connections, {slow:.1%} of them {slow_ms:g} ms per frame, {broadcasts} broadcasts")
+
+    calls, elapsed = await sequential(make_sockets(connections, slow, slow_ms), broadcasts)
+    print(f"{'sequential':<12} broadcast call p50 {percentile(calls, 0.5):9.2f} ms  "
+          f"p99 {percentile(calls, 0.99):9.2f} ms  all delivered after {elapsed:7.2f} s")
+
+    calls, elapsed, snapshot = await queued(make_sockets(connections, slow, slow_ms), broadcasts, queue_size)
+    delivery = snapshot["delivery_ms"]
+    print(f"{'queued':<12} broadcast call p50 {percentile(calls, 0.5):9.2f} ms  "
+          f"p99 {percentile(calls, 0.99):9.2f} ms  fast clients done after {elapsed:7.2f} s  "
+          f"delivery avg {delivery['avg']:.2f} ms  skipped {snapshot['skipped']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--connections", type=int, default=10_000)
+    parser.add_argument("--broadcasts", type=int, default=20)
+    parser.add_argument("--slow", type=float, default=0.01, help="fraction of slow clients")
+    parser.add_argument("--slow-ms", type=float, default=20.0)
+    parser.add_argument("--queue-size", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(run(args.connections, args.broadcasts, args.slow, args.slow_ms, args.queue_size))
@@ -0,0 +1,121 @@
+"""Initial schema and query indexes
+
+Creates the tables that used to be built by `Base.metadata.create_all` at
+startup (skipping the ones that already exist, so databases created that way
+can simply be upgraded) and adds the indexes the repositories rely on.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+category_enum = postgresql.ENUM("FIRST", "SECOND", "HIGHEST", "NO_CATEGORY", name="categoryenum", create_type=False)
+user_role_enum = postgresql.ENUM("user", "admin", "doctor", name="userrole", create_type=False)
+
+# (name, table, columns)
+INDEXES = [
+    # Postgres does not index foreign keys; these also serve the per-doctor,
+    # per-room and per-patient schedules ordered by time
+    ("ix_appointments_doctor_id_datetime", "appointments", ["doctor_id", "datetime"]),
+    ("ix_appointments_room_id_datetime", "appointments", ["room_id", "datetime"]),
+    ("ix_appointments_user_id_datetime", "appointments", ["user_id", "datetime"]),
+    # Keyset pagination sort keys (doctors.surname and users.email are unique already)
+    ("ix_appointments_datetime_id", "appointments", ["datetime", "id"]),
+    ("ix_rooms_number_id", "rooms", ["number", "id"]),
+]
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    # Offline (--sql) runs cannot inspect the database and emit the full schema
+    existing_tables = set() if op.get_context().as_sql else set(sa.inspect(bind).get_table_names())
+
+    category_enum.create(bind, checkfirst=not op.get_context().as_sql)
+    user_role_enum.create(bind, checkfirst=not op.get_context().as_sql)
+
+    if "doctors" not in existing_tables:
+        op.create_table(
+            "doctors",
+            sa.Column("id", sa.UUID(), nullable=False),
+            sa.Column("name", sa.String(), nullable=False),
+            sa.Column("surname", sa.String(), nullable=False),
+            sa.Column("age", sa.Integer(), nullable=False),
+            sa.Column("specialization", sa.String(), nullable=False),
+            sa.Column("category", category_enum, nullable=False),
+            sa.Column("password", sa.String(), nullable=False),
+            sa.Column("experience_years", sa.Integer(), nullable=False),
+            sa.PrimaryKeyConstraint("id"),
+            sa.UniqueConstraint("surname"),
+        )
+
+    if "rooms" not in existing_tables:
+        op.create_table(
+            "rooms",
+            sa.Column("id", sa.UUID(), nullable=False),
+            sa.Column("number", sa.Integer(), nullable=False),
+            sa.PrimaryKeyConstraint("id"),
+        )
+
+    if "users" not in existing_tables:
+        op.create_table(
+            "users",
+            sa.Column("id", sa.UUID(), nullable=False),
+            sa.Column("name", sa.String(), nullable=False),
+            sa.Column("surname", sa.String(), nullable=False),
+            sa.Column("email", sa.String(), nullable=False),
+            sa.Column("age", sa.Integer(), nullable=True),
+            sa.Column("phone", sa.String(), nullable=True),
+            sa.Column("role", user_role_enum, server_default="user", nullable=False),
+            sa.Column("hashed_password", sa.String(), nullable=False),
+            sa.Column("disabled", sa.Boolean(), nullable=False),
+            sa.Column("reset_token", sa.String(), nullable=True),
+            sa.Column("reset_token_expires", sa.DateTime(), nullable=True),
+            sa.PrimaryKeyConstraint("id"),
+            sa.UniqueConstraint("email"),
+            sa.UniqueConstraint("phone"),
+        )
+
+    if "appointments" not in existing_tables:
+        op.create_table(
+            "appointments",
+            sa.Column("id", sa.UUID(), nullable=False),
+            sa.Column("datetime", sa.DateTime(), nullable=False),
+            sa.Column("doctor_id", sa.UUID(), nullable=False),
+            sa.Column("user_id", sa.UUID(), nullable=False),
+            sa.Column("room_id", sa.UUID(), nullable=False),
+            sa.ForeignKeyConstraint(["doctor_id"], ["doctors.id"], ondelete="CASCADE"),
+            sa.ForeignKeyConstraint(["room_id"], ["rooms.id"], ondelete="CASCADE"),
+            sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+            sa.PrimaryKeyConstraint("id"),
+        )
+
+    # CONCURRENTLY keeps existing tables writable while the indexes build
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+    op.drop_table("appointments")
+    op.drop_table("users")
+    op.drop_table("rooms")
+    op.drop_table("doctors")
+    user_role_enum.drop(op.get_bind(), checkfirst=True)
+    category_enum.drop(op.get_bind(), checkfirst=True)
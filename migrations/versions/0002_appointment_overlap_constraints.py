@@ -0,0 +1,55 @@
+"""Appointment durations and double-booking exclusion constraints
+
+Each appointment occupies [datetime, datetime + duration_minutes). Two
+exclusion constraints reject overlapping ranges for the same doctor and for
+the same room, so concurrent bookings cannot both succeed. Existing
+overlapping rows must be resolved before upgrading.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+VISIT_RANGE = "tsrange(datetime, datetime + duration_minutes * interval '1 minute')"
+
+# (constraint name, resource column)
+OVERLAP_CONSTRAINTS = [
+    ("appointments_doctor_no_overlap", "doctor_id"),
+    ("appointments_room_no_overlap", "room_id"),
+]
+
+
+def upgrade() -> None:
+    # Lets a GiST index combine uuid equality with range overlap
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+
+    op.add_column(
+        "appointments",
+        sa.Column("duration_minutes", sa.Integer(), server_default="30", nullable=False),
+    )
+    op.create_check_constraint("appointments_duration_positive", "appointments", "duration_minutes > 0")
+
+    for name, column in OVERLAP_CONSTRAINTS:
+        op.execute(
+            f"ALTER TABLE appointments ADD CONSTRAINT {name} "
+            f"EXCLUDE USING gist ({column} WITH =, {VISIT_RANGE} WITH &&)"
+        )
+
+
+def downgrade() -> None:
+    for name, _ in reversed(OVERLAP_CONSTRAINTS):
+        op.drop_constraint(name, "appointments")
+    op.drop_constraint("appointments_duration_positive", "appointments")
+    op.drop_column("appointments", "duration_minutes")
@@ -0,0 +1,32 @@
+"""Doctor working hours
+
+Working hours bound the free-slot search; existing doctors get 09:00-17:00.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("doctors", sa.Column("work_start", sa.Time(), server_default="09:00", nullable=False))
+    op.add_column("doctors", sa.Column("work_end", sa.Time(), server_default="17:00", nullable=False))
+    op.create_check_constraint("doctors_working_hours_order", "doctors", "work_start < work_end")
+
+
+def downgrade() -> None:
+    op.drop_constraint("doctors_working_hours_order", "doctors")
+    op.drop_column("doctors", "work_end")
+    op.drop_column("doctors", "work_start")
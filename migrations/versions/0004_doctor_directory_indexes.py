@@ -0,0 +1,46 @@
+"""Indexes for filtering and sorting the doctor directory
+
+Backs the GET /doctors filters: lower(specialization), category and
+experience_years btree indexes that also carry the keyset sort order, and
+pg_trgm GIN indexes for case-insensitive name/surname prefix search.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (name, columns, options)
+INDEXES = [
+    ("ix_doctors_specialization_surname_id", [sa.text("lower(specialization)"), "surname", "id"], {}),
+    ("ix_doctors_category_surname_id", ["category", "surname", "id"], {}),
+    ("ix_doctors_experience_years_id", ["experience_years", "id"], {}),
+    ("ix_doctors_name_trgm", ["name"], {"postgresql_using": "gin", "postgresql_ops": {"name": "gin_trgm_ops"}}),
+    ("ix_doctors_surname_trgm", ["surname"], {"postgresql_using": "gin", "postgresql_ops": {"surname": "gin_trgm_ops"}}),
+]
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # CONCURRENTLY keeps the doctors table writable while the indexes build
+    with op.get_context().autocommit_block():
+        for name, columns, options in INDEXES:
+            op.create_index(name, "doctors", columns, postgresql_concurrently=True, if_not_exists=True, **options)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name="doctors", postgresql_concurrently=True, if_exists=True)
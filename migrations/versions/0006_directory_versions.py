@@ -0,0 +1,50 @@
+"""Row versions for doctors and rooms
+
+Every insert and update draws a new `version` from a per-table sequence, so
+count(*) and sum(version) change with every committed insert, update or
+delete, even when commits land out of sequence order; the directory endpoints
+build their ETags from them. `updated_at` records the last change.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ("doctors", "rooms")
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        sequence = f"{table}_version_seq"
+        op.execute(f"CREATE SEQUENCE {sequence}")
+        # Existing rows each get their own value from the sequence
+        op.add_column(table, sa.Column(
+            "version", sa.BigInteger(), server_default=sa.text(f"nextval('{sequence}')"), nullable=False
+        ))
+        op.execute(f"ALTER SEQUENCE {sequence} OWNED BY {table}.version")
+        op.add_column(table, sa.Column(
+            "updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False
+        ))
+        # Narrow index the ETag's count(*) and sum(version) can read with an
+        # index-only scan instead of visiting the table
+        op.create_index(f"ix_{table}_version", table, ["version"])
+
+
+def downgrade() -> None:
+    for table in reversed(TABLES):
+        op.drop_index(f"ix_{table}_version", table_name=table)
+        op.drop_column(table, "updated_at")
+        # Dropping the column drops the sequence it owns
+        op.drop_column(table, "version")